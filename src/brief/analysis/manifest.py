@@ -1,24 +1,245 @@
 """Manifest building from analyzed files - Python, docs, and other tracked files."""
 from pathlib import Path
-from typing import Generator, Any
+from typing import Callable, Generator, Any
 from datetime import datetime
+from functools import lru_cache
 import fnmatch
+import os
+import re
 from .parser import PythonFileParser, compute_file_hash
 from .markdown import MarkdownParser, is_dated_filename
+from .parallel import map_files
 from ..models import (
     ManifestFileRecord, ManifestClassRecord, ManifestFunctionRecord,
     ManifestDocRecord
 )
-from ..storage import read_jsonl, write_jsonl
+from ..storage import (
+    read_jsonl, write_jsonl, write_jsonl_lines, encode_jsonl_record,
+    index_jsonl, read_jsonl_spans
+)
 from ..config import (
-    get_brief_path, MANIFEST_FILE,
-    DEFAULT_EXCLUDE_PATTERNS, DEFAULT_DOC_INCLUDE, DEFAULT_DOC_EXCLUDE,
-    PARSED_EXTENSIONS, TRACKED_EXTENSIONS
+    get_brief_path, MANIFEST_FILE, MANIFEST_SHARD_FILE, MANIFEST_INDEX_FILE,
+    DEFAULT_EXCLUDE_PATTERNS, DEFAULT_DOC_INCLUDE, DEFAULT_DOC_EXCLUDE, DATE_DOC_EXCLUDE,
+    classify_extension
 )
 
 # Type alias for manifest records
 ManifestRecord = ManifestFileRecord | ManifestClassRecord | ManifestFunctionRecord | ManifestDocRecord
 
+# Record types that get their own manifest shard
+MANIFEST_RECORD_TYPES = ("file", "class", "function", "doc")
+
+
+def manifest_shard_path(brief_path: Path, record_type: str) -> Path:
+    """Get the path of the per-type manifest shard for a record type."""
+    return brief_path / MANIFEST_SHARD_FILE.format(type=record_type)
+
+
+def write_manifest(brief_path: Path, records: list[ManifestRecord | dict]) -> None:
+    """Write the manifest plus one shard file per record type.
+
+    manifest.jsonl stays the source of truth. The shards are written after it,
+    so a shard is only trusted while it is at least as new as the manifest.
+    Every writer of a non-empty manifest should go through here (or
+    write_manifest_file_records) so the shards never lag behind it.
+
+    Each record is serialized once; the same bytes go to the manifest and its
+    shard, and their offsets become the manifest.idx entries, so read
+    commands normally find the index current without re-parsing anything.
+    """
+    manifest_path = brief_path / MANIFEST_FILE
+    lines: list[bytes] = []
+    entries: list[list] = []
+    by_type: dict[str, list[bytes]] = {t: [] for t in MANIFEST_RECORD_TYPES}
+    offset = 0
+    for record in records:
+        if isinstance(record, dict):
+            rtype, path = record.get("type"), record.get("path") or record.get("file", "")
+        else:
+            rtype, path = record.type, getattr(record, "path", None) or getattr(record, "file", "")
+        line = encode_jsonl_record(record)
+        lines.append(line)
+        entries.append([rtype, path, offset, len(line) + 1])
+        offset += len(line) + 1
+        if rtype in by_type:
+            by_type[rtype].append(line)
+
+    write_jsonl_lines(manifest_path, lines)
+    for rtype, typed_lines in by_type.items():
+        write_jsonl_lines(manifest_shard_path(brief_path, rtype), typed_lines)
+
+    write_jsonl(brief_path / MANIFEST_INDEX_FILE, [_manifest_stamp(manifest_path), *entries])
+
+
+def write_manifest_file_records(brief_path: Path, records: list[ManifestRecord | dict]) -> None:
+    """Rewrite the manifest after a change that only touched file records.
+
+    For one-field updates such as a new description reference. Only the file
+    shard is rewritten; the other shards still hold the right records, so
+    the ones that were current are just re-stamped newer than the manifest.
+    manifest.idx is dropped and rebuilt on its next read.
+    """
+    manifest_path = brief_path / MANIFEST_FILE
+    others = [manifest_shard_path(brief_path, t) for t in MANIFEST_RECORD_TYPES if t != "file"]
+    still_current = [shard for shard in others if _shard_is_current(shard, manifest_path)]
+
+    lines = [encode_jsonl_record(record) for record in records]
+    write_jsonl_lines(manifest_path, lines)
+    write_jsonl_lines(manifest_shard_path(brief_path, "file"), (
+        line for record, line in zip(records, lines)
+        if (record.get("type") if isinstance(record, dict) else record.type) == "file"
+    ))
+
+    for shard in still_current:
+        os.utime(shard)
+    (brief_path / MANIFEST_INDEX_FILE).unlink(missing_ok=True)
+
+
+def _shard_is_current(shard_path: Path, manifest_path: Path) -> bool:
+    """Check whether a shard was written no earlier than the manifest."""
+    try:
+        return shard_path.stat().st_mtime_ns >= manifest_path.stat().st_mtime_ns
+    except OSError:
+        return False
+
+
+def read_manifest(
+    brief_path: Path,
+    record_type: str | None = None,
+    prefilter: Callable[[str], bool] | None = None,
+) -> Generator[dict, None, None]:
+    """Read manifest records, optionally only those of one type.
+
+    Uses the per-type shard when it is current, so a type query doesn't have
+    to decode every record. Falls back to filtering manifest.jsonl when the
+    shard is missing or older than the manifest (e.g. after the manifest was
+    edited by hand). prefilter is passed through to read_jsonl.
+    """
+    manifest_path = brief_path / MANIFEST_FILE
+    if record_type is None:
+        yield from read_jsonl(manifest_path, prefilter)
+        return
+
+    shard_path = manifest_shard_path(brief_path, record_type)
+    if _shard_is_current(shard_path, manifest_path):
+        yield from read_jsonl(shard_path, prefilter)
+        return
+
+    # Skip decoding lines that can't be of this type (either JSON spacing)
+    type_markers = (f'"type": "{record_type}"', f'"type":"{record_type}"')
+
+    def has_type(line: str) -> bool:
+        if not any(marker in line for marker in type_markers):
+            return False
+        return prefilter is None or prefilter(line)
+
+    for record in read_jsonl(manifest_path, has_type):
+        if record.get("type") == record_type:
+            yield record
+
+
+def _manifest_stamp(manifest_path: Path) -> dict[str, int]:
+    """Get the mtime/size stamp that manifest.idx is checked against."""
+    stat = manifest_path.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _build_manifest_index(brief_path: Path) -> list[list]:
+    """Index manifest.jsonl and write the manifest.idx sidecar."""
+    manifest_path = brief_path / MANIFEST_FILE
+    stamp = _manifest_stamp(manifest_path)
+    entries = index_jsonl(
+        manifest_path,
+        lambda r: (r.get("type"), r.get("path") or r.get("file", "")),
+    )
+    write_jsonl(brief_path / MANIFEST_INDEX_FILE, [stamp, *entries])
+    return entries
+
+
+def load_manifest_index(brief_path: Path) -> list[list]:
+    """Load the manifest.idx sidecar, rebuilding it if the manifest changed.
+
+    Each entry is [type, path, offset, length], where path is the record's
+    path (file/doc) or file (class/function). The first line of manifest.idx
+    records the manifest's mtime and size it was built from.
+
+    write_manifest() writes the sidecar; it is only rebuilt here when the
+    manifest was written some other way (e.g. emptied by init).
+    """
+    manifest_path = brief_path / MANIFEST_FILE
+    if not manifest_path.exists():
+        return []
+
+    try:
+        lines = read_jsonl(brief_path / MANIFEST_INDEX_FILE)
+        if next(lines, None) == _manifest_stamp(manifest_path):
+            return list(lines)
+    except ValueError:
+        pass  # Corrupt index - rebuild
+
+    return _build_manifest_index(brief_path)
+
+
+def find_manifest_records(
+    brief_path: Path,
+    record_type: str | None = None,
+    path_contains: str | None = None,
+) -> Generator[dict, None, None]:
+    """Find manifest records by type and/or path substring.
+
+    Matches are looked up in manifest.idx and only the matching lines of
+    manifest.jsonl are decoded.
+    """
+    spans = (
+        (offset, length)
+        for rtype, path, offset, length in load_manifest_index(brief_path)
+        if (record_type is None or rtype == record_type)
+        and (path_contains is None or path_contains in path)
+    )
+    yield from read_jsonl_spans(brief_path / MANIFEST_FILE, spans)
+
+
+class ExcludeMatcher:
+    """Exclude patterns compiled once for matching many paths.
+
+    Patterns are matched against individual path components:
+    - ".*" matches any dot-prefixed component (.git, .venv, ...)
+    - glob patterns are fnmatch-ed against each component (combined into
+      one regex)
+    - plain names must equal a component exactly
+    """
+
+    def __init__(self, patterns: tuple[str, ...]):
+        self.dot_prefixed = ".*" in patterns
+        names = set()
+        globs = []
+        for pattern in patterns:
+            if pattern == ".*":
+                continue
+            if any(c in pattern for c in '*?['):
+                globs.append(fnmatch.translate(os.path.normcase(pattern)))
+            else:
+                names.add(pattern)
+        self.names = frozenset(names)
+        self.glob_re = re.compile("|".join(globs)) if globs else None
+
+    def matches(self, path: Path) -> bool:
+        """Check if any component of path is excluded."""
+        for part in path.parts:
+            if self.dot_prefixed and part.startswith('.') and part != '.':
+                return True
+            if part in self.names:
+                return True
+            if self.glob_re and self.glob_re.match(os.path.normcase(part)):
+                return True
+        return False
+
+
+@lru_cache(maxsize=32)
+def get_exclude_matcher(patterns: tuple[str, ...]) -> ExcludeMatcher:
+    """Get a (cached) compiled matcher for a set of exclude patterns."""
+    return ExcludeMatcher(patterns)
+
 
 def should_exclude(path: Path, patterns: list[str]) -> bool:
     """Check if path matches any exclude pattern.
@@ -26,36 +247,34 @@ def should_exclude(path: Path, patterns: list[str]) -> bool:
     Matches patterns against individual path components to avoid substring
     false positives (e.g. gitignore 'lib/' should not exclude 'libs/').
     """
-    for pattern in patterns:
-        # Special handling for dot-prefixed directory pattern
-        if pattern == ".*":
-            for part in path.parts:
-                if part.startswith('.') and part != '.':
-                    return True
-            continue
+    return get_exclude_matcher(tuple(patterns)).matches(path)
+
+
+# The four DATE_DOC_EXCLUDE globs as one alternative: YYYY, MM and DD joined
+# by the same separator ("-", "_", "." or none), same as fnmatch-ing each
+_DATE_GLOBS_RE = r"(?s:.*[0-9]{4}(?P<date_sep>[-_.]?)[0-9]{2}(?P=date_sep)[0-9]{2}.*)\Z"
 
-        # Check if pattern contains glob characters
-        if any(c in pattern for c in '*?['):
-            # Glob pattern: match against each path component
-            for part in path.parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-        else:
-            # Plain name: exact match against path components
-            if pattern in path.parts:
-                return True
-    return False
+
+@lru_cache(maxsize=32)
+def get_glob_regex(patterns: tuple[str, ...]) -> "re.Pattern[str] | None":
+    """Get a (cached) single regex matching any of the glob patterns."""
+    if not patterns:
+        return None
+    parts = []
+    if set(DATE_DOC_EXCLUDE).issubset(patterns):
+        parts.append(_DATE_GLOBS_RE)
+        patterns = tuple(p for p in patterns if p not in DATE_DOC_EXCLUDE)
+    parts.extend(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    return re.compile("|".join(parts))
 
 
 def matches_pattern(path: Path, patterns: list[str], base_path: Path) -> bool:
     """Check if path matches any of the glob patterns."""
-    rel_path = str(path.relative_to(base_path))
-    for pattern in patterns:
-        if fnmatch.fnmatch(rel_path, pattern):
-            return True
-        if fnmatch.fnmatch(path.name, pattern):
-            return True
-    return False
+    glob_re = get_glob_regex(tuple(patterns))
+    if glob_re is None:
+        return False
+    rel_path = os.path.normcase(str(path.relative_to(base_path)))
+    return bool(glob_re.match(rel_path) or glob_re.match(os.path.normcase(path.name)))
 
 
 def should_include_doc(
@@ -89,8 +308,9 @@ def find_python_files(
     exclude_patterns: list[str]
 ) -> Generator[Path, None, None]:
     """Find all Python files in directory, respecting exclude patterns."""
+    matcher = get_exclude_matcher(tuple(exclude_patterns))
     for path in directory.rglob("*.py"):
-        if not should_exclude(path, exclude_patterns):
+        if not matcher.matches(path):
             yield path
 
 
@@ -101,8 +321,9 @@ def find_doc_files(
     doc_exclude: list[str] | None = None
 ) -> Generator[Path, None, None]:
     """Find all documentation files in directory."""
+    matcher = get_exclude_matcher(tuple(exclude_patterns))
     for path in directory.rglob("*.md"):
-        if should_exclude(path, exclude_patterns):
+        if matcher.matches(path):
             continue
         if should_include_doc(path, directory, doc_include, doc_exclude):
             yield path
@@ -113,18 +334,15 @@ def find_other_files(
     exclude_patterns: list[str]
 ) -> Generator[Path, None, None]:
     """Find other tracked files (not Python or docs)."""
+    matcher = get_exclude_matcher(tuple(exclude_patterns))
     for path in directory.rglob("*"):
         if path.is_dir():
             continue
-        if should_exclude(path, exclude_patterns):
+        if matcher.matches(path):
             continue
 
-        ext = path.suffix.lower()
-        # Skip Python and markdown (handled separately)
-        if ext in [".py", ".md"]:
-            continue
-        # Only yield if extension is in our tracked list
-        if ext in TRACKED_EXTENSIONS:
+        # Python and markdown are handled separately; only yield tracked extensions
+        if classify_extension(path.suffix) == "other":
             yield path
 
 
@@ -136,19 +354,20 @@ def find_all_files(
 
     Yields: (path, category) where category is 'python', 'doc', or 'other'
     """
+    matcher = get_exclude_matcher(tuple(exclude_patterns))
     for path in directory.rglob("*"):
         if path.is_dir():
             continue
-        if should_exclude(path, exclude_patterns):
+        if matcher.matches(path):
             continue
 
-        ext = path.suffix.lower()
-        if ext == ".py":
+        kind = classify_extension(path.suffix)
+        if kind == "python":
             yield (path, "python")
-        elif ext == ".md":
+        elif kind == "markdown":
             if should_include_doc(path, directory):
                 yield (path, "doc")
-        elif ext in TRACKED_EXTENSIONS:
+        elif kind == "other":
             yield (path, "other")
 
 
@@ -207,10 +426,9 @@ def ensure_manifest_current(brief_path: Path, base_path: Path) -> dict[str, int]
     if not config_file.exists():
         return {"added": 0, "updated": 0, "removed": 0}
 
-    from ..storage import read_json
-    from ..config import load_exclude_patterns
+    from ..config import get_config, load_exclude_patterns
 
-    config = read_json(config_file)
+    config = get_config(brief_path)
     exclude = load_exclude_patterns(base_path, config)
 
     # Get Python files on disk
@@ -269,7 +487,7 @@ def ensure_manifest_current(brief_path: Path, base_path: Path) -> dict[str, int]
                 continue
 
     if changed:
-        write_jsonl(manifest_path, manifest_records)
+        write_manifest(brief_path, manifest_records)
 
         # Regenerate lite descriptions for new/stale files
         from ..generation.lite import generate_and_save_lite_description
@@ -356,9 +574,10 @@ class ManifestBuilder:
 
         self.records = []
 
-        # Analyze Python files (full parsing)
-        for file_path in find_python_files(directory, self.exclude_patterns):
-            self.records.extend(self.analyze_python_file(file_path))
+        # Analyze Python files (full parsing, in worker processes for big trees)
+        python_files = list(find_python_files(directory, self.exclude_patterns))
+        for file_records in map_files(self.analyze_python_file, python_files):
+            self.records.extend(file_records)
 
         # Analyze documentation files (heading extraction)
         for file_path in find_doc_files(
@@ -380,7 +599,7 @@ class ManifestBuilder:
         if brief_path is None:
             brief_path = get_brief_path(self.base_path)
 
-        write_jsonl(brief_path / MANIFEST_FILE, self.records)
+        write_manifest(brief_path, self.records)
 
     def get_stats(self) -> dict[str, int]:
         """Get statistics about analyzed code."""
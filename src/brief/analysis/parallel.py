@@ -0,0 +1,33 @@
+"""Parallel per-file processing for analysis - used when a project has many files."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, TypeVar
+
+R = TypeVar("R")
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def map_files(
+    func: Callable[[Path], R],
+    files: list[Path],
+    min_files: int = PARALLEL_MIN_FILES
+) -> list[R]:
+    """Apply func to each file, using worker processes for large file sets.
+
+    func must be picklable (a module-level function or a functools.partial
+    of one). Results are returned in the same order as files. Falls back to
+    a plain loop for small inputs, single-core machines, or when worker
+    processes cannot be started.
+    """
+    if len(files) >= min_files and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(func, files, chunksize=16))
+        except (OSError, BrokenProcessPool):
+            pass
+
+    return [func(file_path) for file_path in files]
@@ -2,6 +2,8 @@
 from pathlib import Path
 from typing import Union
 from .parser import PythonFileParser
+from .parallel import map_files
+from .manifest import find_python_files
 from ..models import ImportRelationship, CallRelationship
 from ..storage import write_jsonl
 from ..config import get_brief_path, RELATIONSHIPS_FILE
@@ -142,14 +144,12 @@ class RelationshipExtractor:
 
         self.relationships = []
 
-        for file_path in directory.rglob("*.py"):
-            skip = False
-            for pattern in self.exclude_patterns:
-                if pattern in str(file_path):
-                    skip = True
-                    break
-            if not skip:
-                self.relationships.extend(self.extract_from_file(file_path))
+        # Same component-wise exclude matching as the manifest
+        files = list(find_python_files(directory, self.exclude_patterns))
+
+        # Parse in worker processes for big trees
+        for file_relationships in map_files(self.extract_from_file, files):
+            self.relationships.extend(file_relationships)
 
         return self.relationships
 
@@ -5,8 +5,105 @@ import typer
 from pathlib import Path
 from typing import Optional
 
+
+class _LazyGroup(typer.core.TyperGroup):
+    """Top-level group that imports command modules on first use.
+
+    See _LAZY_COMMANDS and _LAZY_GROUPS below for the dispatch table.
+    """
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        # Keep the order Typer used when everything was registered eagerly
+        # (it drives help panel order): commands defined above the dispatch
+        # table, lazy commands, commands defined below it, then groups.
+        eager = [n for n in self.commands if n not in _LAZY_COMMANDS and n not in _LAZY_GROUPS]
+        return [
+            *(n for n in eager if n in _COMMANDS_BEFORE_LAZY),
+            *_LAZY_COMMANDS,
+            *(n for n in eager if n not in _COMMANDS_BEFORE_LAZY),
+            *_LAZY_GROUPS,
+        ]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name not in self.commands:
+            command = _load_command(cmd_name)
+            if command is None:
+                return None
+            self.commands[cmd_name] = command
+        return self.commands[cmd_name]
+
+    def resolve_command(self, ctx: typer.Context, args: list[str]):
+        # TyperGroup suggests from self.commands, which only holds the
+        # commands loaded so far, so unknown names are reported from here
+        # using every listed name
+        if (
+            args
+            and self.suggest_commands
+            and not args[0].startswith("-")
+            and ctx.token_normalize_func is None
+            and not ctx.resilient_parsing
+            and self.get_command(ctx, args[0]) is None
+        ):
+            from difflib import get_close_matches
+
+            message = f"No such command {args[0]!r}."
+            matches = get_close_matches(args[0], self.list_commands(ctx))
+            if matches:
+                suggestions = ", ".join(f"{m!r}" for m in matches)
+                message = f"{message.rstrip('.')}. Did you mean {suggestions}?"
+            ctx.fail(message)
+        return super().resolve_command(ctx, args)
+
+
+class _LazySubGroup(typer.core.TyperGroup):
+    """Subcommand group that builds each command's Click parser on first use.
+
+    `brief trace show x` only converts `show`; --help and completion list
+    every command, which builds them all.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._pending: dict[str, typer.models.CommandInfo] = {}
+        self._order: list[str] = []
+
+    def defer(self, infos: list[typer.models.CommandInfo], source: typer.Typer) -> None:
+        """Queue the commands of `source` to be converted on demand."""
+        import typer.main
+
+        self._source = source
+        for info in infos:
+            name = info.name or typer.main.get_command_name(info.callback.__name__)
+            self._pending[name] = info
+        # Typer lists commands before nested groups (e.g. task archive)
+        self._order = [*self._pending, *self.commands]
+
+    def _build(self, name: str) -> None:
+        import typer.main
+
+        command = typer.main.get_command_from_info(
+            self._pending.pop(name),
+            pretty_exceptions_short=self._source.pretty_exceptions_short,
+            rich_markup_mode=self._source.rich_markup_mode,
+        )
+        self.commands[name] = command
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return list(self._order)
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name in self._pending:
+            self._build(cmd_name)
+        elif cmd_name not in self.commands:
+            # Unknown name: build the rest so "did you mean" sees every command
+            for name in list(self._pending):
+                self._build(name)
+        return self.commands.get(cmd_name)
+
+
 app = typer.Typer(
     name="brief",
+    cls=_LazyGroup,
     help="Context infrastructure for AI coding agents - deterministic context packages for convergent code generation",
     no_args_is_help=True,
     rich_markup_mode="rich",
@@ -128,63 +225,87 @@ def ctx_shortcut(
     _run_quick_query(query, base)
 
 
-# Import and register command modules
-from .commands import init as init_cmd
-from .commands import analyze as analyze_cmd
-from .commands import report as report_cmd
-from .commands import describe as describe_cmd
-from .commands import context as context_cmd
-from .commands import task as task_cmd
-from .commands import memory as memory_cmd
-from .commands import trace as trace_cmd
-from .commands import contracts as contracts_cmd
-from .commands import config_cmd
-from .commands import reset as reset_cmd
-from .commands import setup as setup_cmd
-from .commands import model as model_cmd
-from .commands import logs as logs_cmd
-
-# Register init as a direct command (not a subcommand)
-app.command(name="init", rich_help_panel="Getting Started")(init_cmd.init)
-
-# Register setup wizard as a direct command
-app.command(name="setup", rich_help_panel="Getting Started")(setup_cmd.setup)
-
-# Register reset as a direct command
-app.command(name="reset", rich_help_panel="Advanced")(reset_cmd.reset)
-
-# Register subcommand groups with "did you mean?" callbacks and help panels
-_subcommand_groups = {
-    "context": (context_cmd.app, "Context Queries"),
-    "analyze": (analyze_cmd.app, "Analysis"),
-    "describe": (describe_cmd.app, "Analysis"),
-    "task": (task_cmd.app, "Task Management"),
-    "memory": (memory_cmd.app, "Context Queries"),
-    "trace": (trace_cmd.app, "Analysis"),
-    "contracts": (contracts_cmd.app, "Analysis"),
-    "config": (config_cmd.app, "Advanced"),
-    "model": (model_cmd.app, "Advanced"),
-    "logs": (logs_cmd.app, "Advanced"),
+# Command modules are registered lazily: only the module for the invoked
+# command is imported, so `brief memory list` doesn't pay for importing
+# every other command (and their Rich/BAML/retrieval dependencies).
+# --help and shell completion list every command, which loads them all.
+
+# Commands decorated above this point come before the lazy ones in --help
+_COMMANDS_BEFORE_LAZY = {info.name for info in app.registered_commands}
+
+# Top-level commands: name -> (module in brief.commands, function, help panel)
+_LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "init": ("init", "init", "Getting Started"),
+    "setup": ("setup", "setup", "Getting Started"),
+    "reset": ("reset", "reset", "Advanced"),
+    "status": ("report", "status", "Getting Started"),
+    "overview": ("report", "overview", "Reports"),
+    "tree": ("report", "tree", "Reports"),
+    "deps": ("report", "deps", "Reports"),
+    "coverage": ("report", "coverage_cmd", "Reports"),
+    "stale": ("report", "stale", "Reports"),
+    "inventory": ("report", "inventory", "Reports"),
+    # Top-level aliases for common memory commands
+    "remember": ("memory", "memory_add", "Context Queries"),
+    "recall": ("memory", "memory_get", "Context Queries"),
+}
+
+# Subcommand groups (with "did you mean?" callbacks): name -> (module, help panel)
+_LAZY_GROUPS: dict[str, tuple[str, str]] = {
+    "context": ("context", "Context Queries"),
+    "analyze": ("analyze", "Analysis"),
+    "describe": ("describe", "Analysis"),
+    "task": ("task", "Task Management"),
+    "memory": ("memory", "Context Queries"),
+    "trace": ("trace", "Analysis"),
+    "contracts": ("contracts", "Analysis"),
+    "config": ("config_cmd", "Advanced"),
+    "model": ("model", "Advanced"),
+    "logs": ("logs", "Advanced"),
 }
 
-for group_name, (group_app, panel) in _subcommand_groups.items():
-    group_app.info.invoke_without_command = True
-    group_app.registered_callback = None  # Clear any existing
-    group_app.callback()(_make_suggestion_callback(group_name))
-    app.add_typer(group_app, name=group_name, rich_help_panel=panel)
 
-# Register individual report commands at top level
-app.command(name="status", rich_help_panel="Getting Started")(report_cmd.status)
-app.command(name="overview", rich_help_panel="Reports")(report_cmd.overview)
-app.command(name="tree", rich_help_panel="Reports")(report_cmd.tree)
-app.command(name="deps", rich_help_panel="Reports")(report_cmd.deps)
-app.command(name="coverage", rich_help_panel="Reports")(report_cmd.coverage_cmd)
-app.command(name="stale", rich_help_panel="Reports")(report_cmd.stale)
-app.command(name="inventory", rich_help_panel="Reports")(report_cmd.inventory)
+def _load_command(name: str) -> "typer.core.TyperCommand | typer.core.TyperGroup | None":
+    """Import the module behind a lazily registered command and build it."""
+    import importlib
+    import typer.main
+
+    if name in _LAZY_GROUPS:
+        module_name, panel = _LAZY_GROUPS[name]
+        group_app = importlib.import_module(f".commands.{module_name}", __package__).app
+        group_app.info.invoke_without_command = True
+        group_app.registered_callback = None  # Clear any existing
+        group_app.callback()(_make_suggestion_callback(name))
+        # Build only the group and its nested groups now; commands are deferred
+        group_app.info.cls = _LazySubGroup
+        infos, group_app.registered_commands = group_app.registered_commands, []
+        try:
+            command = typer.main.get_group(group_app)
+        finally:
+            group_app.registered_commands = infos
+        command.defer(infos, group_app)
+    elif name in _LAZY_COMMANDS:
+        module_name, func_name, panel = _LAZY_COMMANDS[name]
+        func = getattr(importlib.import_module(f".commands.{module_name}", __package__), func_name)
+        # A Typer with a single command converts to that command itself
+        single = typer.Typer(add_completion=False)
+        single.command(name=name)(func)
+        command = typer.main.get_command(single)
+    else:
+        return None
 
-# Register top-level aliases for common memory commands
-app.command(name="remember", rich_help_panel="Context Queries")(memory_cmd.memory_add)
-app.command(name="recall", rich_help_panel="Context Queries")(memory_cmd.memory_get)
+    command.name = name
+    command.rich_help_panel = panel
+    return command
+
+
+# Markdown checkboxes for resume's step list, keyed by TaskStepStatus value
+_RESUME_STEP_ICONS = {
+    "pending": "[ ]",
+    "in_progress": "[~]",
+    "complete": "[x]",
+    "skipped": "[-]",
+}
 
 
 # Resume command - top-level for easy access
@@ -205,8 +326,7 @@ def resume(
         brief resume
         brief resume --output resume-context.md
     """
-    from .config import get_brief_path
-    from .storage import read_json
+    from .config import get_brief_path, get_config_value
     from .tasks.manager import TaskManager
     from .retrieval.context import build_context_for_query
     from .retrieval.search import hybrid_search
@@ -218,8 +338,7 @@ def resume(
         raise typer.Exit(1)
 
     # Check if tasks are enabled — fall back to status if not
-    config = read_json(brief_path / "config.json")
-    if not config.get("enable_tasks", False):
+    if not get_config_value(brief_path, "enable_tasks", False):
         from .commands.report import status as status_cmd
         typer.echo("Task system is not enabled — showing project status instead.")
         typer.echo("")
@@ -258,7 +377,7 @@ def resume(
 
     # Steps progress
     if task.steps:
-        summary = manager.get_step_summary(task.id)
+        summary = manager.summarize_steps(task)
         lines.extend([
             "## Progress",
             "",
@@ -273,12 +392,7 @@ def resume(
         lines.append("### Steps")
         lines.append("")
         for step in task.steps:
-            icon = {
-                "pending": "[ ]",
-                "in_progress": "[~]",
-                "complete": "[x]",
-                "skipped": "[-]"
-            }.get(step.status.value, "[?]")
+            icon = _RESUME_STEP_ICONS.get(step.status.value, "[?]")
             lines.append(f"- {icon} {step.name}")
             if step.notes:
                 lines.append(f"  - Note: {step.notes}")
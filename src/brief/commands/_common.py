@@ -0,0 +1,40 @@
+"""Helpers shared by several Brief commands."""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
+
+def ensure_gitignore(base_path: Path) -> bool:
+    """Add .brief/ and .brief-logs/ to .gitignore if not already present.
+
+    Returns True if the file was modified.
+    """
+    gitignore = base_path / ".gitignore"
+    entries_needed = (".brief/", ".brief-logs/")
+
+    # "a+" creates the file if needed, so one open covers the read and the append
+    with open(gitignore, "a+") as f:
+        f.seek(0)
+        existing_lines = f.read().splitlines()
+        existing = set(existing_lines)
+        missing = [e for e in entries_needed if e not in existing]
+        if not missing:
+            return False
+
+        # Add a newline separator if file doesn't end with one
+        if existing_lines and existing_lines[-1].strip():
+            f.write("\n")
+        if not existing_lines:
+            f.write("# Brief context data (local, not committed)\n")
+        for entry in missing:
+            f.write(f"{entry}\n")
+
+    return True
+
+
+def split_csv(value: Optional[str]) -> list[str]:
+    """Split a comma-separated option into trimmed, non-empty items."""
+    return [item for item in _CSV_SPLIT(value.strip()) if item] if value else []
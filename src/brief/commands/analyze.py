@@ -2,11 +2,10 @@
 import typer
 from pathlib import Path
 from typing import Optional
-from ..config import get_brief_path, load_exclude_patterns
+from ..config import get_brief_path, get_config, load_exclude_patterns
 from ..analysis.manifest import ManifestBuilder, get_changed_files
 from ..analysis.relationships import RelationshipExtractor
 from ..models import ImportRelationship, CallRelationship
-from ..storage import read_json
 
 app = typer.Typer()
 
@@ -73,7 +72,7 @@ def analyze_directory(
         raise typer.Exit(1)
 
     # Load config and exclude patterns (including gitignore if enabled)
-    config = read_json(brief_path / "config.json")
+    config = get_config(brief_path)
     exclude_patterns = load_exclude_patterns(base, config)
 
     # Build manifest
@@ -143,7 +142,7 @@ def refresh(
         typer.echo("Error: Brief not initialized. Run 'brief init' first.", err=True)
         raise typer.Exit(1)
 
-    config = read_json(brief_path / "config.json")
+    config = get_config(brief_path)
     exclude_patterns = config.get("exclude_patterns", [])
 
     new_files, changed_files, deleted_files = get_changed_files(
@@ -2,8 +2,8 @@
 import typer
 from pathlib import Path
 from typing import Optional
-from ..config import get_brief_path, MANIFEST_FILE
-from ..storage import read_json, read_jsonl
+from ..config import get_brief_path, get_config, MANIFEST_FILE
+from ..storage import read_jsonl
 
 app = typer.Typer()
 
@@ -39,7 +39,7 @@ def _get_auto_generate_default(brief_path: Path) -> bool:
     config_file = brief_path / "config.json"
     if config_file.exists():
         try:
-            config = read_json(config_file)
+            config = get_config(brief_path)
             return config.get("auto_generate_descriptions", True)
         except Exception:
             pass
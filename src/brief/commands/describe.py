@@ -4,7 +4,7 @@ import typer
 from pathlib import Path
 from typing import Optional
 from ..config import get_brief_path, MANIFEST_FILE, CONTEXT_DIR, RELATIONSHIPS_FILE
-from ..storage import read_jsonl, write_jsonl
+from ..storage import read_jsonl
 from ..models import ManifestFileRecord, ManifestClassRecord, ManifestFunctionRecord
 
 app = typer.Typer()
@@ -37,6 +37,7 @@ def update_manifest_context_ref(
         description_hash: Hash of the file at time of description generation
     """
     from datetime import datetime
+    from ..analysis.manifest import write_manifest_file_records
 
     records = list(read_jsonl(brief_path / MANIFEST_FILE))
 
@@ -48,7 +49,7 @@ def update_manifest_context_ref(
                 record["description_hash"] = description_hash
             break
 
-    write_jsonl(brief_path / MANIFEST_FILE, records)
+    write_manifest_file_records(brief_path, records)
 
 
 @app.command("file")
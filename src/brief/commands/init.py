@@ -10,37 +10,8 @@ from ..config import (
     MEMORY_FILE,
     CONTEXT_DIR,
 )
-from ..storage import write_json, write_jsonl, read_json
-
-
-def _ensure_gitignore(base_path: Path) -> bool:
-    """Add .brief/ and .brief-logs/ to .gitignore if not already present.
-
-    Returns True if the file was modified.
-    """
-    gitignore = base_path / ".gitignore"
-    entries_needed = [".brief/", ".brief-logs/"]
-
-    existing_lines = []
-    if gitignore.exists():
-        existing_lines = gitignore.read_text().splitlines()
-
-    # Check which entries are missing
-    missing = [e for e in entries_needed if e not in existing_lines]
-    if not missing:
-        return False
-
-    # Append missing entries
-    with open(gitignore, "a") as f:
-        # Add a newline separator if file doesn't end with one
-        if existing_lines and existing_lines[-1].strip():
-            f.write("\n")
-        if not existing_lines:
-            f.write("# Brief context data (local, not committed)\n")
-        for entry in missing:
-            f.write(f"{entry}\n")
-
-    return True
+from ..storage import write_json, reset_jsonl, read_json
+from ._common import ensure_gitignore
 
 
 def init(
@@ -72,17 +43,15 @@ def init(
         raise typer.Exit(1)
 
     # Create directory structure
-    brief_path.mkdir(parents=True, exist_ok=True)
-    (brief_path / CONTEXT_DIR).mkdir(exist_ok=True)
-    (brief_path / CONTEXT_DIR / "modules").mkdir(exist_ok=True)
-    (brief_path / CONTEXT_DIR / "files").mkdir(exist_ok=True)
-    (brief_path / CONTEXT_DIR / "paths").mkdir(exist_ok=True)
+    # parents=True creates .brief/ and context/ along with the first leaf
+    for sub in ("modules", "files", "paths"):
+        (brief_path / CONTEXT_DIR / sub).mkdir(parents=True, exist_ok=True)
 
     # Create empty JSONL files
-    write_jsonl(brief_path / MANIFEST_FILE, [])
-    write_jsonl(brief_path / RELATIONSHIPS_FILE, [])
-    write_jsonl(brief_path / TASKS_FILE, [])
-    write_jsonl(brief_path / MEMORY_FILE, [])
+    reset_jsonl(brief_path / MANIFEST_FILE)
+    reset_jsonl(brief_path / RELATIONSHIPS_FILE)
+    reset_jsonl(brief_path / TASKS_FILE)
+    reset_jsonl(brief_path / MEMORY_FILE)
 
     # Create config
     from ..models import BriefConfig
@@ -92,7 +61,7 @@ def init(
     typer.echo(f"Initialized Brief at {brief_path}")
 
     # Add to .gitignore
-    if _ensure_gitignore(path):
+    if ensure_gitignore(path):
         typer.echo("  Added .brief/ and .brief-logs/ to .gitignore")
 
     # Run analysis
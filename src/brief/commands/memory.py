@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Optional
 from ..config import get_brief_path
 from ..memory.store import MemoryStore
+from ._common import split_csv
 
 app = typer.Typer()
 
@@ -29,7 +30,7 @@ def memory_add(
 
     store = MemoryStore(brief_path)
 
-    tag_list = [t.strip() for t in tags.split(",")] if tags else []
+    tag_list = split_csv(tags)
 
     record = store.remember(
         key=key,
@@ -72,7 +73,7 @@ def memory_get(
     if file_path:
         results = store.recall_for_file(file_path)
     else:
-        tag_list = [t.strip() for t in tags.split(",")] if tags else None
+        tag_list = split_csv(tags) or None
         results = store.recall(query=query, tags=tag_list, scope=scope)
 
     if not results:
@@ -1,13 +1,10 @@
 """Reporting commands for Brief."""
 import typer
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
-from ..config import get_brief_path, MANIFEST_FILE, load_exclude_patterns
-from ..reporting.overview import generate_project_overview, generate_project_overview_rich, generate_module_overview
-from ..reporting.tree import generate_tree
-from ..reporting.deps import get_dependencies, format_dependencies, generate_dependency_graph
-from ..reporting.coverage import calculate_coverage, format_coverage, find_stale_files, format_stale, format_coverage_detailed
-from ..storage import read_json, read_jsonl
+from ..config import get_brief_path, get_config, load_exclude_patterns
 
 app = typer.Typer()
 
@@ -27,13 +24,16 @@ def overview(
         brief overview           # Show all packages
         brief overview src.brief # Show specific module details
     """
-    from rich.console import Console
+    from ..reporting.overview import generate_project_overview, generate_project_overview_rich, generate_module_overview
 
     brief_path = get_brief_path(base)
-    console = Console(force_terminal=not plain, no_color=plain)
 
     if not brief_path.exists():
-        console.print("[red]Error:[/red] Brief not initialized. Run 'brief init' first.")
+        if plain:
+            typer.echo("Error: Brief not initialized. Run 'brief init' first.")
+        else:
+            from rich.console import Console
+            Console(force_terminal=True).print("[red]Error:[/red] Brief not initialized. Run 'brief init' first.")
         raise typer.Exit(1)
 
     if module:
@@ -61,21 +61,29 @@ def tree(
       ○ = Analyzed only (yellow)
       ✗ = Not analyzed (red)
     """
-    from rich.console import Console
+    from ..reporting.tree import generate_tree
 
     brief_path = get_brief_path(base)
-    console = Console(force_terminal=not plain, no_color=plain)
+
+    # Rich is only needed for colored output
+    console = None
+    if not plain:
+        from rich.console import Console
+        console = Console(force_terminal=True)
 
     if not brief_path.exists():
-        console.print("[red]Error:[/red] Brief not initialized.")
+        if console:
+            console.print("[red]Error:[/red] Brief not initialized.")
+        else:
+            typer.echo("Error: Brief not initialized.")
         raise typer.Exit(1)
 
     output = generate_tree(brief_path, base, path, show_status=not no_status, use_color=not plain)
 
-    if plain:
-        typer.echo(output)
-    else:
+    if console:
         console.print(output)
+    else:
+        typer.echo(output)
 
 
 @app.command()
@@ -85,6 +93,8 @@ def deps(
     reverse: bool = typer.Option(False, "--reverse", "-r", help="Show only reverse dependencies"),
 ) -> None:
     """Show dependencies for a file or project summary."""
+    from ..reporting.deps import get_dependencies, format_dependencies, generate_dependency_graph
+
     brief_path = get_brief_path(base)
 
     if not brief_path.exists():
@@ -120,20 +130,21 @@ def coverage_cmd(
         brief coverage
         brief coverage --detailed
     """
-    from rich.console import Console
+    from ..reporting.coverage import calculate_coverage, format_coverage, format_coverage_detailed
 
     brief_path = get_brief_path(base)
-    console = Console()
 
     if not brief_path.exists():
         typer.echo("Error: Brief not initialized.", err=True)
         raise typer.Exit(1)
 
-    config = read_json(brief_path / "config.json")
+    config = get_config(brief_path)
     exclude_patterns = load_exclude_patterns(base, config)
 
     if detailed:
-        format_coverage_detailed(brief_path, base, exclude_patterns, console)
+        # Only the detailed view renders with Rich
+        from rich.console import Console
+        format_coverage_detailed(brief_path, base, exclude_patterns, Console())
     else:
         cov = calculate_coverage(brief_path, base, exclude_patterns)
         typer.echo(format_coverage(cov, show_unparsed=unparsed))
@@ -144,6 +155,8 @@ def stale(
     base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
 ) -> None:
     """Show files that changed since last analysis."""
+    from ..reporting.coverage import find_stale_files, format_stale
+
     brief_path = get_brief_path(base)
 
     if not brief_path.exists():
@@ -154,6 +167,42 @@ def stale(
     typer.echo(format_stale(stale_files))
 
 
+# --- Inventory line formatters, one per manifest record type ---
+
+_get_location = itemgetter("name", "file", "line")
+
+
+def _format_file_record(record: dict) -> str:
+    tag = "FILE" if record.get("parsed", True) else "OTHER"
+    return f"[{tag}] {record['path']}"
+
+
+def _format_doc_record(record: dict) -> str:
+    line = f"[DOC] {record['path']}"
+    title = record.get("title")
+    return f"{line}\n      Title: {title}" if title else line
+
+
+def _format_class_record(record: dict) -> str:
+    name, file, line = _get_location(record)
+    return f"[CLASS] {name} in {file}:{line}"
+
+
+def _format_function_record(record: dict) -> str:
+    name, file, line = _get_location(record)
+    class_name = record.get("class_name")
+    prefix = f"{class_name}." if class_name else ""
+    return f"[FUNC] {prefix}{name} in {file}:{line}"
+
+
+_INVENTORY_FORMATTERS = {
+    "file": _format_file_record,
+    "doc": _format_doc_record,
+    "class": _format_class_record,
+    "function": _format_function_record,
+}
+
+
 @app.command()
 def inventory(
     filter_path: Optional[str] = typer.Option(None, "--filter", "-f", help="Filter by path pattern"),
@@ -164,6 +213,9 @@ def inventory(
     """List all items in the manifest.
 
     Types: file (Python), doc (markdown), class, function
+
+    --filter looks paths up in .brief/manifest.idx, which is rebuilt here
+    if the manifest was changed without it.
     """
     brief_path = get_brief_path(base)
 
@@ -171,49 +223,38 @@ def inventory(
         typer.echo("Error: Brief not initialized.", err=True)
         raise typer.Exit(1)
 
-    records = []
-    for record in read_jsonl(brief_path / MANIFEST_FILE):
-        # Apply filters
-        if record_type and record.get("type") != record_type:
-            continue
+    from ..analysis.manifest import find_manifest_records, read_manifest
 
-        if filter_path:
-            path = record.get("path") or record.get("file", "")
-            if filter_path not in path:
-                continue
-
-        records.append(record)
+    # Filtering happens before records reach this function: path filters go
+    # through the manifest.idx sidecar and type-only queries read the
+    # per-type shard, so there is no per-record filter check here
+    if filter_path:
+        matches = find_manifest_records(brief_path, record_type, filter_path)
+    else:
+        matches = read_manifest(brief_path, record_type)
 
-        if len(records) >= limit:
-            break
+    # At least one record is shown, even for --limit 0
+    records = list(islice(matches, max(limit, 1)))
 
     if not records:
         typer.echo("No matching records found.")
         return
 
-    typer.echo(f"Inventory ({len(records)} records):")
-    typer.echo("-" * 60)
+    # Build the whole listing and write it once rather than a line at a time
+    lines = [
+        f"Inventory ({len(records)} records):",
+        "-" * 60,
+    ]
 
     for record in records:
-        rtype = record.get("type", "?")
-        if rtype == "file":
-            parsed = record.get("parsed", True)
-            ext = record.get("extension", ".py")
-            tag = "FILE" if parsed else "OTHER"
-            typer.echo(f"[{tag}] {record['path']}")
-        elif rtype == "doc":
-            title = record.get("title", "")
-            typer.echo(f"[DOC] {record['path']}")
-            if title:
-                typer.echo(f"      Title: {title}")
-        elif rtype == "class":
-            typer.echo(f"[CLASS] {record['name']} in {record['file']}:{record['line']}")
-        elif rtype == "function":
-            prefix = f"{record['class_name']}." if record.get('class_name') else ""
-            typer.echo(f"[FUNC] {prefix}{record['name']} in {record['file']}:{record['line']}")
+        formatter = _INVENTORY_FORMATTERS.get(record.get("type"))
+        if formatter:
+            lines.append(formatter(record))
 
     if len(records) == limit:
-        typer.echo(f"\n(showing first {limit} records, use --limit to see more)")
+        lines.append(f"\n(showing first {limit} records, use --limit to see more)")
+
+    typer.echo("\n".join(lines))
 
 
 @app.command()
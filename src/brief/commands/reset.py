@@ -1,6 +1,9 @@
 """Reset Brief cache and analysis data."""
 
+import mmap
+import os
 import typer
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from ..config import (
     get_brief_path,
@@ -9,11 +12,60 @@ from ..config import (
     EMBEDDINGS_DB,
     CONTEXT_DIR,
 )
-from ..storage import write_jsonl
+from ..storage import reset_jsonl
 
 app = typer.Typer(help="Reset Brief cache data")
 
 
+def _probe(path: Path) -> tuple[bool, bool, int]:
+    """Check a path with a single scandir call.
+
+    Returns:
+        (exists, is_dir, entry_count) - entry_count is 0 for files.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return True, True, sum(1 for _ in entries)
+    except NotADirectoryError:
+        return True, False, 0
+    except FileNotFoundError:
+        return False, False, 0
+
+
+_COUNT_CHUNK = 1 << 20
+
+
+def _count_lines(path: Path) -> int:
+    """Count records in a JSONL file by counting newlines in a memory map."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # mmap.count() only exists on 3.13+, so count slice by slice
+            count = sum(
+                mm[start:start + _COUNT_CHUNK].count(b"\n")
+                for start in range(0, size, _COUNT_CHUNK)
+            )
+            # A final record without a trailing newline still counts
+            return count if mm[size - 1:size] == b"\n" else count + 1
+
+
+def _clear_files(path: Path) -> int:
+    """Delete the files directly inside a directory, keeping the directory.
+
+    Subdirectories are left alone. Returns the number of files deleted.
+    Deletion is syscall-bound, so the unlinks are spread over a few threads.
+    """
+    with os.scandir(path) as entries:
+        files = [entry.path for entry in entries if entry.is_file()]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # list() so any unlink error is raised here
+        list(executor.map(os.unlink, files))
+    return len(files)
+
+
 def reset(
     base: Path = typer.Option(
         Path("."),
@@ -51,6 +103,7 @@ def reset(
     By default, clears:
       - manifest.jsonl (code structure cache)
       - relationships.jsonl (dependency graph cache)
+      - manifest.{type}.jsonl shards, manifest.idx, tasks.idx (deleted)
 
     Preserves by default:
       - context/files/ (LLM-generated descriptions - costs $ to regenerate)
@@ -79,7 +132,8 @@ def reset(
         typer.echo("Error: Brief not initialized. Run 'brief init' first.", err=True)
         raise typer.Exit(1)
 
-    from ..config import TASKS_FILE, MEMORY_FILE, ACTIVE_TASK_FILE
+    from ..config import TASKS_FILE, TASKS_INDEX_FILE, MEMORY_FILE, ACTIVE_TASK_FILE, MANIFEST_INDEX_FILE
+    from ..analysis.manifest import MANIFEST_RECORD_TYPES, manifest_shard_path
 
     # Define what to clear
     analysis_files = [
@@ -87,6 +141,15 @@ def reset(
         (brief_path / RELATIONSHIPS_FILE, "relationships.jsonl (dependencies)"),
     ]
 
+    # Shards and index sidecars are deleted rather than emptied, so nothing
+    # can serve records from before the reset; they are rebuilt on demand
+    derived_files = [
+        (shard, f"{shard.name} (manifest shard)")
+        for shard in (manifest_shard_path(brief_path, t) for t in MANIFEST_RECORD_TYPES)
+    ]
+    derived_files.append((brief_path / MANIFEST_INDEX_FILE, f"{MANIFEST_INDEX_FILE} (manifest index)"))
+    derived_files.append((brief_path / TASKS_INDEX_FILE, f"{TASKS_INDEX_FILE} (task index)"))
+
     embeddings_file = brief_path / EMBEDDINGS_DB
 
     # LLM-generated content directories
@@ -106,6 +169,8 @@ def reset(
 
     # Build list of items to clear
     to_clear = list(analysis_files)
+    to_clear.extend(item for item in derived_files if item[0].exists())
+    derived_paths = {path for path, _ in derived_files}
 
     if include_embeddings or full:
         if embeddings_file.exists():
@@ -117,24 +182,27 @@ def reset(
     if include_user_data:
         to_clear.extend(user_data_files)
 
-    # Show what will be cleared
+    # Show what will be cleared (output is collected and written in one go)
     action_word = "Would clear" if dry_run else "Will clear"
-    typer.echo(f"{action_word}:")
+    lines = [f"{action_word}:"]
+    # Probe each path once; the preview and the clear loop share the result
+    probes = {path: _probe(path) for path, _ in to_clear}
     for path, desc in to_clear:
-        if path.exists():
-            if path.is_dir():
-                # Count files in directory
-                file_count = len(list(path.glob("*")))
-                typer.echo(f"  - {desc} ({file_count} files)")
+        exists, is_dir, file_count = probes[path]
+        if exists:
+            if is_dir:
+                lines.append(f"  - {desc} ({file_count} files)")
+            elif path.suffix == ".jsonl":
+                lines.append(f"  - {desc} ({_count_lines(path):,} records)")
             else:
-                typer.echo(f"  - {desc}")
+                lines.append(f"  - {desc}")
         else:
-            typer.echo(f"  - {desc} (not present)")
+            lines.append(f"  - {desc} (not present)")
 
     # Show what will be preserved
-    typer.echo("")
+    lines.append("")
     preserve_word = "Would preserve" if dry_run else "Will preserve"
-    typer.echo(f"{preserve_word}:")
+    lines.append(f"{preserve_word}:")
     preserved = []
     if not include_user_data:
         preserved.extend(["tasks.jsonl", "memory.jsonl", "config.json", "active_task"])
@@ -143,14 +211,17 @@ def reset(
     if not full:
         preserved.extend(["context/files/", "context/modules/", "context/paths/", "context/traces.jsonl"])
     for item in preserved:
-        typer.echo(f"  - {item}")
+        lines.append(f"  - {item}")
 
     # Exit if dry run
     if dry_run:
-        typer.echo("")
-        typer.echo("(Dry run - no changes made)")
+        lines.append("")
+        lines.append("(Dry run - no changes made)")
+        typer.echo("\n".join(lines))
         return
 
+    typer.echo("\n".join(lines))
+
     # Confirm if destructive operation
     needs_confirm = (full or include_user_data) and not yes
     if needs_confirm:
@@ -165,28 +236,27 @@ def reset(
             raise typer.Exit(0)
 
     # Perform the reset
-    typer.echo("")
+    lines = [""]
     cleared_count = 0
 
     for path, desc in to_clear:
-        if path.exists():
-            if path.is_dir():
+        exists, is_dir, _ = probes[path]
+        if exists:
+            if is_dir:
                 # Clear directory contents but keep the directory
-                for file in path.glob("*"):
-                    if file.is_file():
-                        file.unlink()
-                        cleared_count += 1
-                typer.echo(f"  Cleared {desc}")
+                cleared_count += _clear_files(path)
+                lines.append(f"  Cleared {desc}")
             else:
-                if path.suffix == ".jsonl":
+                if path.suffix == ".jsonl" and path not in derived_paths:
                     # Reset JSONL files to empty array
-                    write_jsonl(path, [])
-                    typer.echo(f"  Reset {desc}")
+                    reset_jsonl(path)
+                    lines.append(f"  Reset {desc}")
                 else:
                     # Delete other files
-                    path.unlink()
-                    typer.echo(f"  Deleted {desc}")
+                    path.unlink(missing_ok=True)
+                    lines.append(f"  Deleted {desc}")
                 cleared_count += 1
 
-    typer.echo("")
-    typer.echo(f"Reset complete. Run 'brief analyze full' to rebuild analysis cache.")
+    lines.append("")
+    lines.append(f"Reset complete. Run 'brief analyze full' to rebuild analysis cache.")
+    typer.echo("\n".join(lines))
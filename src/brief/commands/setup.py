@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import os
 import json
-import stat
 import typer
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -12,7 +11,8 @@ if TYPE_CHECKING:
     from rich.console import Console
 
 from ..config import get_brief_path
-from ..storage import write_json, read_json
+from ..storage import write_json
+from ._common import ensure_gitignore
 
 
 def _detect_api_keys() -> dict[str, bool]:
@@ -24,33 +24,23 @@ def _detect_api_keys() -> dict[str, bool]:
     }
 
 
-def _check_dotenv(base_path: Path) -> bool:
-    """Check if a .env file exists."""
-    return (base_path / ".env").exists()
-
-
-def _ensure_gitignore(base_path: Path) -> bool:
-    """Add .brief/ and .brief-logs/ to .gitignore if not already present."""
-    gitignore = base_path / ".gitignore"
-    entries_needed = [".brief/", ".brief-logs/"]
+def _snapshot_dir(path: Path) -> set[str]:
+    """List the entry names in a directory with a single scandir pass.
 
-    existing_lines = []
-    if gitignore.exists():
-        existing_lines = gitignore.read_text().splitlines()
-
-    missing = [e for e in entries_needed if e not in existing_lines]
-    if not missing:
-        return False
+    Setup checks several siblings (.env, .brief);
+    one directory read replaces a stat() per file. Returns an empty set
+    if the directory does not exist yet.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
-    with open(gitignore, "a") as f:
-        if existing_lines and existing_lines[-1].strip():
-            f.write("\n")
-        if not existing_lines:
-            f.write("# Brief context data (local, not committed)\n")
-        for entry in missing:
-            f.write(f"{entry}\n")
 
-    return True
+def _check_dotenv(entries: set[str]) -> bool:
+    """Check if a .env file exists."""
+    return ".env" in entries
 
 
 CLAUDE_MD_BRIEF_SECTION = '''
@@ -88,49 +78,44 @@ After context compaction, run `brief resume` to restore your active task context
 '''
 
 
-def _write_claude_md_tasks_snippet(base_path: Path, console: Console) -> bool:
-    """Append Brief tasks section to CLAUDE.md if not already present."""
+def _update_claude_md(base_path: Path, enable_tasks: bool, console: Console) -> bool:
+    """Append the Brief sections to CLAUDE.md (or create it).
+
+    CLAUDE.md is read once; both section markers are checked against that
+    content and everything missing is written in a single open.
+    Returns True if the file was modified.
+    """
     claude_md = base_path / "CLAUDE.md"
-    marker = "### Task Management"
+    try:
+        content: str | None = claude_md.read_text()
+    except FileNotFoundError:
+        content = None
+
+    parts = []
+    messages = []
+    if content is None:
+        parts.append(f"# CLAUDE.md\n{CLAUDE_MD_BRIEF_SECTION}")
+        messages.append("  [green]✓[/green] Created CLAUDE.md with Brief workflow")
+    elif "## Context Management (Brief)" in content:
+        console.print("  [dim]CLAUDE.md already has Brief section — skipped[/dim]")
+    else:
+        parts.append("\n" + CLAUDE_MD_BRIEF_SECTION)
+        messages.append("  [green]✓[/green] Appended Brief section to CLAUDE.md")
 
-    if not claude_md.exists():
-        return False
+    if enable_tasks and (content is None or "### Task Management" not in content):
+        parts.append(CLAUDE_MD_TASKS_SECTION)
+        messages.append("  [green]✓[/green] Added task management section to CLAUDE.md")
 
-    content = claude_md.read_text()
-    if marker in content:
+    if not parts:
         return False
 
-    with open(claude_md, "a") as f:
-        f.write(CLAUDE_MD_TASKS_SECTION)
-    console.print("  [green]✓[/green] Added task management section to CLAUDE.md")
+    with open(claude_md, "a" if content is not None else "w") as f:
+        f.write("".join(parts))
+    for message in messages:
+        console.print(message)
     return True
 
 
-def _write_claude_md_snippet(base_path: Path, console: Console) -> bool:
-    """Append Brief section to CLAUDE.md (or create it).
-
-    Returns True if the file was modified.
-    """
-    claude_md = base_path / "CLAUDE.md"
-    marker = "## Context Management (Brief)"
-
-    if claude_md.exists():
-        content = claude_md.read_text()
-        if marker in content:
-            console.print("  [dim]CLAUDE.md already has Brief section — skipped[/dim]")
-            return False
-        # Append
-        with open(claude_md, "a") as f:
-            f.write("\n" + CLAUDE_MD_BRIEF_SECTION)
-        console.print("  [green]✓[/green] Appended Brief section to CLAUDE.md")
-        return True
-    else:
-        # Create new
-        claude_md.write_text(f"# CLAUDE.md\n{CLAUDE_MD_BRIEF_SECTION}")
-        console.print("  [green]✓[/green] Created CLAUDE.md with Brief workflow")
-        return True
-
-
 # --- Hook script contents (written to .brief/hooks/) ---
 
 _HOOK_SESSION_START = r'''#!/bin/bash
@@ -160,40 +145,41 @@ echo '[Brief] Before exploring code, run: brief context get "<topic>" to get str
 exit 0
 '''
 
-_HOOK_PRE_TOOL_USE = r'''#!/bin/bash
+_HOOK_PRE_TOOL_USE = r"""#!/usr/bin/env python3
 # Brief PreToolUse hook - contextual reminder when using Read/Grep/Glob
-INPUT=$(cat)
-echo "$INPUT" | python3 -c '
-import sys, json
+import json
+import re
+import sys
+
+SKIP_RE = re.compile(r"/(?:node_modules|\.venv|__pycache__|\.git|site-packages|\.brief|\.brief-logs)/")
+SKIP_FILES = frozenset({"CLAUDE.md", "settings.json", "config.json", ".env", "pyproject.toml", "package.json"})
+CODE_EXTS = frozenset({"py", "js", "ts", "tsx", "jsx", "go", "rs", "java", "rb", "cpp", "c", "h"})
+OUTPUT = '{"hookSpecificOutput":{"hookEventName":"PreToolUse","additionalContext":"[Brief Tip] If you are trying to understand how %s works or fits into the codebase, consider running `brief context get` first - it provides descriptions, signatures, and related files in one call."}}\n'
+
 try:
-    data = json.loads(sys.stdin.read())
+    data = json.loads(sys.stdin.buffer.read())
     tool_input = data.get("tool_input", {})
     file_path = tool_input.get("file_path") or tool_input.get("path") or ""
-    skip_dirs = ["/node_modules/", "/.venv/", "/__pycache__/", "/.git/", "/site-packages/"]
-    if any(d in file_path for d in skip_dirs):
-        sys.exit(0)
-    skip_files = ["CLAUDE.md", "settings.json", "config.json", ".env", "pyproject.toml", "package.json"]
-    if any(f in file_path for f in skip_files):
-        sys.exit(0)
-    if "/.brief/" in file_path or "/.brief-logs/" in file_path:
+    filename = file_path.rpartition("/")[2]
+    if SKIP_RE.search(file_path) or filename in SKIP_FILES:
         sys.exit(0)
-    code_extensions = [".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".rs", ".java", ".rb", ".cpp", ".c", ".h"]
-    if any(file_path.endswith(ext) for ext in code_extensions):
-        filename = file_path.split("/")[-1] if "/" in file_path else file_path
-        output = {"hookSpecificOutput":{"hookEventName":"PreToolUse","additionalContext":f"[Brief Tip] If you are trying to understand how {filename} works or fits into the codebase, consider running `brief context get` first - it provides descriptions, signatures, and related files in one call."}}
-        print(json.dumps(output))
+    if "." in filename and filename.rpartition(".")[2] in CODE_EXTS:
+        sys.stdout.buffer.write((OUTPUT % json.dumps(filename)[1:-1]).encode())
 except Exception:
     pass
 sys.exit(0)
-'
-exit 0
-'''
+"""
 
 _HOOK_SCRIPTS = {
     "session-start.sh": _HOOK_SESSION_START,
     "pre-compact.sh": _HOOK_PRE_COMPACT,
     "user-prompt.sh": _HOOK_USER_PROMPT,
-    "pre-tool-use.sh": _HOOK_PRE_TOOL_USE,
+    "pre-tool-use.py": _HOOK_PRE_TOOL_USE,
+}
+
+# Scripts written by earlier versions, mapped to their replacements
+_LEGACY_HOOK_SCRIPTS = {
+    "pre-tool-use.sh": "pre-tool-use.py",
 }
 
 # The hooks config that references .brief/hooks/ via $CLAUDE_PROJECT_DIR
@@ -219,7 +205,7 @@ _BRIEF_HOOKS_CONFIG = {
     "PreToolUse": [
         {
             "matcher": "Read|Grep|Glob",
-            "hooks": [{"type": "command", "command": "$CLAUDE_PROJECT_DIR/.brief/hooks/pre-tool-use.sh", "timeout": 5}]
+            "hooks": [{"type": "command", "command": "$CLAUDE_PROJECT_DIR/.brief/hooks/pre-tool-use.py", "timeout": 5}]
         }
     ],
 }
@@ -231,18 +217,68 @@ _BRIEF_PERMISSIONS = [
 
 
 def _install_hooks(brief_path: Path) -> int:
-    """Write hook scripts to .brief/hooks/. Returns count of scripts written."""
+    """Write hook scripts to .brief/hooks/, skipping unchanged ones. Returns count of scripts installed."""
     hooks_dir = brief_path / "hooks"
     hooks_dir.mkdir(exist_ok=True)
     count = 0
     for filename, content in _HOOK_SCRIPTS.items():
         script_path = hooks_dir / filename
-        script_path.write_text(content.lstrip("\n"))
-        script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+        data = content.lstrip("\n").encode()
         count += 1
+        try:
+            if script_path.read_bytes() == data:
+                continue
+        except FileNotFoundError:
+            pass
+        # Create executable in one step instead of write + stat + chmod
+        fd = os.open(script_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+    for filename in _LEGACY_HOOK_SCRIPTS:
+        (hooks_dir / filename).unlink(missing_ok=True)
     return count
 
 
+def _has_brief_hooks(hooks: dict) -> bool:
+    """Check whether any hook command already points into .brief/hooks/."""
+    for event_list in hooks.values():
+        for hook_entry in event_list:
+            if not isinstance(hook_entry, dict):
+                continue
+            for hook in hook_entry.get("hooks", []):
+                if isinstance(hook, dict) and ".brief/hooks/" in hook.get("command", ""):
+                    return True
+    return False
+
+
+def _migrate_brief_hooks(hooks: dict) -> bool:
+    """Point hook commands at renamed scripts. Returns True if any changed."""
+    changed = False
+    for event_list in hooks.values():
+        for hook_entry in event_list:
+            if not isinstance(hook_entry, dict):
+                continue
+            for hook in hook_entry.get("hooks", []):
+                command = hook.get("command", "") if isinstance(hook, dict) else ""
+                for old, new in _LEGACY_HOOK_SCRIPTS.items():
+                    if command.endswith(f".brief/hooks/{old}"):
+                        hook["command"] = command[:-len(old)] + new
+                        changed = True
+    return changed
+
+
+def _write_settings(path: Path, settings: dict) -> None:
+    """Serialize settings once and write them with a single open."""
+    data = (json.dumps(settings, indent=2) + "\n").encode()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def _configure_claude_settings(base_path: Path, console: Console) -> None:
     """Write/merge hooks into .claude/settings.json and permissions into settings.local.json."""
     claude_dir = base_path / ".claude"
@@ -260,14 +296,14 @@ def _configure_claude_settings(base_path: Path, console: Console) -> None:
     existing_hooks = settings.get("hooks", {})
 
     # Check if Brief hooks are already installed (look for .brief/hooks/ in any command)
-    already_has_brief_hooks = any(
-        ".brief/hooks/" in str(hook_entry)
-        for event_list in existing_hooks.values()
-        for hook_entry in event_list
-    )
+    already_has_brief_hooks = _has_brief_hooks(existing_hooks)
 
     if already_has_brief_hooks:
-        console.print("  [dim]Hooks already configured in .claude/settings.json — skipped[/dim]")
+        if _migrate_brief_hooks(existing_hooks):
+            _write_settings(settings_path, settings)
+            console.print("  [green]✓[/green] Updated Brief hook commands in .claude/settings.json")
+        else:
+            console.print("  [dim]Hooks already configured in .claude/settings.json — skipped[/dim]")
     else:
         # Merge: for each event type, append Brief's hooks to any existing ones
         for event_name, brief_entries in _BRIEF_HOOKS_CONFIG.items():
@@ -277,7 +313,7 @@ def _configure_claude_settings(base_path: Path, console: Console) -> None:
                 existing_hooks[event_name] = brief_entries
 
         settings["hooks"] = existing_hooks
-        settings_path.write_text(json.dumps(settings, indent=2) + "\n")
+        _write_settings(settings_path, settings)
         console.print("  [green]✓[/green] Configured hooks in .claude/settings.json")
 
     # --- settings.local.json: permissions ---
@@ -304,7 +340,7 @@ def _configure_claude_settings(base_path: Path, console: Console) -> None:
         if "permissions" not in local_settings:
             local_settings["permissions"] = {}
         local_settings["permissions"]["allow"] = existing_perms
-        local_path.write_text(json.dumps(local_settings, indent=2) + "\n")
+        _write_settings(local_path, local_settings)
         console.print("  [green]✓[/green] Added brief command permissions to .claude/settings.local.json")
 
 
@@ -338,12 +374,16 @@ def setup(
     """
     from rich.console import Console
     from rich.panel import Panel
-    from rich.prompt import Prompt, Confirm
     from rich import box
+    if not non_interactive:
+        # Prompts are only needed for the interactive wizard
+        from rich.prompt import Confirm
     from ..models import BriefConfig
 
     console = Console()
     brief_path = get_brief_path(path)
+    # One directory read answers every "does this file exist?" question below
+    entries = _snapshot_dir(path)
 
     # Welcome banner
     console.print()
@@ -356,7 +396,7 @@ def setup(
     console.print()
 
     # Check if already initialized
-    already_initialized = brief_path.exists()
+    already_initialized = brief_path.name in entries
     if already_initialized:
         console.print("[yellow]Brief is already initialized in this directory.[/yellow]")
         if not non_interactive:
@@ -366,20 +406,19 @@ def setup(
                 raise typer.Exit(0)
         console.print()
 
-    # Load the user's project .env (if present) before detecting keys
-    env_file = path / ".env"
-    if env_file.exists():
+    # Detect API keys, loading the user's project .env only if the
+    # environment is missing one of them
+    api_keys = _detect_api_keys()
+    has_dotenv = _check_dotenv(entries)
+    if has_dotenv and not all(api_keys.values()):
         try:
             from dotenv import load_dotenv
-            load_dotenv(env_file)
+            if load_dotenv(path / ".env"):
+                api_keys = _detect_api_keys()
         except ImportError:
             pass
-
-    # Detect API keys
-    api_keys = _detect_api_keys()
     has_openai = api_keys["openai"]
     has_any_key = any(api_keys.values())
-    has_dotenv = _check_dotenv(path)
 
     # --- Step 1: API Key Detection ---
     console.print("[bold]Step 1: API Keys[/bold]")
@@ -449,19 +488,17 @@ def setup(
             MEMORY_FILE,
             CONTEXT_DIR,
         )
-        from ..storage import write_jsonl
+        from ..storage import reset_jsonl
 
-        brief_path.mkdir(parents=True, exist_ok=True)
-        (brief_path / CONTEXT_DIR).mkdir(exist_ok=True)
-        (brief_path / CONTEXT_DIR / "modules").mkdir(exist_ok=True)
-        (brief_path / CONTEXT_DIR / "files").mkdir(exist_ok=True)
-        (brief_path / CONTEXT_DIR / "paths").mkdir(exist_ok=True)
+        # parents=True creates .brief/ and context/ along with the first leaf
+        for sub in ("modules", "files", "paths"):
+            (brief_path / CONTEXT_DIR / sub).mkdir(parents=True, exist_ok=True)
 
-        write_jsonl(brief_path / MANIFEST_FILE, [])
-        write_jsonl(brief_path / RELATIONSHIPS_FILE, [])
+        reset_jsonl(brief_path / MANIFEST_FILE)
+        reset_jsonl(brief_path / RELATIONSHIPS_FILE)
         if enable_tasks:
-            write_jsonl(brief_path / TASKS_FILE, [])
-        write_jsonl(brief_path / MEMORY_FILE, [])
+            reset_jsonl(brief_path / TASKS_FILE)
+        reset_jsonl(brief_path / MEMORY_FILE)
 
         console.print("  [green]✓[/green] Created .brief/ directory")
 
@@ -476,7 +513,7 @@ def setup(
     console.print("  [green]✓[/green] Saved configuration")
 
     # Gitignore
-    if _ensure_gitignore(path):
+    if ensure_gitignore(path):
         console.print("  [green]✓[/green] Added .brief/ and .brief-logs/ to .gitignore")
 
     # --- Step 4: Analysis ---
@@ -495,9 +532,9 @@ def setup(
     if run_analysis:
         from ..analysis.manifest import ManifestBuilder
         from ..analysis.relationships import RelationshipExtractor
-        from ..config import load_exclude_patterns
+        from ..config import get_config, load_exclude_patterns
 
-        current_config = read_json(brief_path / "config.json")
+        current_config = get_config(brief_path)
         exclude_patterns = load_exclude_patterns(path, current_config)
 
         builder = ManifestBuilder(path, exclude_patterns)
@@ -566,9 +603,7 @@ def setup(
         )
 
     if write_claude:
-        _write_claude_md_snippet(path, console)
-        if enable_tasks:
-            _write_claude_md_tasks_snippet(path, console)
+        _update_claude_md(path, enable_tasks, console)
 
     # Install hooks and configure permissions
     hook_count = _install_hooks(brief_path)
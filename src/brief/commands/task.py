@@ -1,44 +1,116 @@
 """Task management commands for Brief."""
+import os
+import re
+import sys
+from itertools import islice
 import typer
-import shutil
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
-from ..config import get_brief_path, TASKS_FILE
-from ..storage import read_json, read_jsonl, write_jsonl
-from ..tasks.manager import TaskManager
-from ..models import TaskStatus, TaskStepStatus
+from typing import TYPE_CHECKING, Optional
+from ..config import get_brief_path, brief_dir_exists, get_config_value
+from ._common import split_csv
+
+if TYPE_CHECKING:
+    from ..tasks.manager import TaskManager
 
 app = typer.Typer()
 
+# Shared default for every --base option
+_CWD = Path(".")
+
 # Archive directory structure
 ARCHIVES_DIR = "archives"
 TASK_ARCHIVES_DIR = "archives/tasks"
+_META_SUFFIX = ".meta.json"
+_PARALLEL_META_READS = 8  # archive list reads metadata on a pool from this many files
+
+
+# Decided once per process and per stream: click otherwise probes isatty()
+# on every echo
+_COLOR_OUT = sys.stdout.isatty()
+_COLOR_ERR = sys.stderr.isatty()
+
+# Icons keyed by TaskStatus / TaskStepStatus value (keeps the models import lazy)
+_STATUS_ICONS_PLAIN = {
+    "pending": "○",
+    "ready": "◐",
+    "in_progress": "●",
+    "done": "✓",
+    "blocked": "⊘",
+}
+_STEP_ICONS_PLAIN = {
+    "pending": "○",
+    "in_progress": "◐",
+    "complete": "●",
+    "skipped": "⊘",
+}
+
+_SEP = "-" * 60
+
+# icon, id, title, priority, depends, active marker
+_TASK_ROW = "{} {}: {} {} {}{}".format
+
+_STATUS_FIELD = re.compile(rb'"status"\s*:\s*"([a-z_]+)"').search
+
+
+def _header(kind: str, n: int) -> str:
+    """Build the two-line "Kind (n):" plus separator header of a listing."""
+    return f"{kind} ({n}):\n{_SEP}"
+
+
+def _echo(message: str = "", *, err: bool = False) -> None:
+    """Echo a line with the module-wide color decision for its stream."""
+    typer.echo(message, err=err, color=_COLOR_ERR if err else _COLOR_OUT)
+
+
+def _raw_status(line: bytes) -> str:
+    """Read a task's status from its raw JSONL line without decoding it.
+
+    The top-level status is serialized before steps (whose own "status"
+    keys come later), and quotes inside string values are escaped, so the
+    first match is the task's. A missing status is the model default.
+    """
+    match = _STATUS_FIELD(line)
+    return match.group(1).decode() if match else "pending"
 
 
 def _check_tasks_enabled(brief_path: Path) -> bool:
     """Check if the task system is enabled in config.
 
-    Returns True if enabled, False if disabled. Shows warning when disabled.
+    Expects an initialized brief_path (see _require_manager). Returns True
+    if enabled, False if disabled. Shows warning when disabled.
     """
-    if not brief_path.exists():
-        return True  # Let individual commands handle "not initialized" error
-
-    config = read_json(brief_path / "config.json")
-    if not config.get("enable_tasks", False):
-        typer.echo("Task system is disabled in config.", err=True)
-        typer.echo("To enable: brief config set enable_tasks true", err=True)
-        typer.echo("", err=True)
-        typer.echo("This allows using external task tools (e.g., beads) instead.", err=True)
+    if not get_config_value(brief_path, "enable_tasks", False):
+        _echo("Task system is disabled in config.", err=True)
+        _echo("To enable: brief config set enable_tasks true", err=True)
+        _echo("", err=True)
+        _echo("This allows using external task tools (e.g., beads) instead.", err=True)
         return False
     return True
 
 
+def _require_manager(base: Path) -> "TaskManager":
+    """Build the TaskManager for a command, exiting if tasks can't be used.
+
+    Exits when Brief isn't initialized or the task system is disabled.
+    """
+    brief_path = get_brief_path(base)
+    if not brief_dir_exists(brief_path):
+        _echo("Error: Brief not initialized.", err=True)
+        raise typer.Exit(1)
+
+    if not _check_tasks_enabled(brief_path):
+        raise typer.Exit(1)
+
+    from ..tasks.manager import TaskManager
+    return TaskManager(brief_path)
+
+
 @app.command("list")
 def task_list(
     status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status"),
     tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Filter by tag"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    limit: int = typer.Option(0, "--limit", "-n", help="Show at most N tasks (0 = all)"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """List all tasks.
 
@@ -48,83 +120,75 @@ def task_list(
         brief task list
         brief task list --status pending
         brief task list --tag bug
+        brief task list --limit 20
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
+    manager = _require_manager(base)
+    from ..models import TaskStatus
 
-    if not _check_tasks_enabled(brief_path):
+    # Map lookup instead of TaskStatus(status) so bad input doesn't raise and catch
+    status_filter = TaskStatus._value2member_map_.get(status) if status else None
+    if status and status_filter is None:
+        _echo(f"Invalid status: {status}", err=True)
         raise typer.Exit(1)
 
-    manager = TaskManager(brief_path)
-
-    status_filter = None
-    if status:
-        try:
-            status_filter = TaskStatus(status)
-        except ValueError:
-            typer.echo(f"Invalid status: {status}", err=True)
-            raise typer.Exit(1)
-
-    tasks = manager.list_tasks(status=status_filter, tag=tag)
+    tasks = manager.iter_tasks(status=status_filter, tag=tag)
+    if limit > 0:
+        # Decode one extra task only to know whether the listing was cut short
+        tasks = list(islice(tasks, limit + 1))
+        more = len(tasks) > limit
+        del tasks[limit:]
+    else:
+        tasks = list(tasks)
+        more = False
 
     if not tasks:
-        typer.echo("No tasks found.")
+        _echo("No tasks found.")
         return
 
-    # Get active task for marking
-    active_task = manager.get_active_task()
-    active_id = active_task.id if active_task else None
+    # Active task for marking (only its ID is needed, not a second task load)
+    active_id = manager.active_id
 
-    typer.echo(f"Tasks ({len(tasks)}):")
-    typer.echo("-" * 60)
+    lines = [_header("Tasks", len(tasks))]
 
     for task in tasks:
-        status_icon = {
-            TaskStatus.PENDING: "○",
-            TaskStatus.READY: "◐",
-            TaskStatus.IN_PROGRESS: "●",
-            TaskStatus.DONE: "✓",
-            TaskStatus.BLOCKED: "⊘"
-        }.get(task.status, "?")
+        lines.append(_TASK_ROW(
+            _STATUS_ICONS_PLAIN.get(task.status.value, "?"),
+            task.id,
+            task.title,
+            f"[P{task.priority}]" if task.priority > 0 else "",
+            f"(depends: {', '.join(task.depends)})" if task.depends else "",
+            " *" if task.id == active_id else "",
+        ))
 
-        priority_str = f"[P{task.priority}]" if task.priority > 0 else ""
-        deps_str = f"(depends: {', '.join(task.depends)})" if task.depends else ""
-        active_marker = " *" if task.id == active_id else ""
+    if more:
+        lines.append("... more tasks not shown (raise --limit or use --limit 0)")
 
-        typer.echo(f"{status_icon} {task.id}: {task.title} {priority_str} {deps_str}{active_marker}")
+    # One write for the whole listing instead of one echo per task
+    _echo("\n".join(lines))
 
 
 @app.command("ready")
 def task_ready(
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Show tasks ready to work on (no blockers).
 
     Lists pending tasks that have no unmet dependencies.
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
+    manager = _require_manager(base)
     ready = manager.get_ready_tasks()
 
     if not ready:
-        typer.echo("No ready tasks. All tasks are either blocked, in progress, or done.")
+        _echo("No ready tasks. All tasks are either blocked, in progress, or done.")
         return
 
-    typer.echo(f"Ready tasks ({len(ready)}):")
-    typer.echo("-" * 60)
+    lines = [_header("Ready tasks", len(ready))]
 
     for task in ready:
         priority_str = f"[P{task.priority}]" if task.priority > 0 else ""
-        typer.echo(f"○ {task.id}: {task.title} {priority_str}")
+        lines.append(f"○ {task.id}: {task.title} {priority_str}")
+
+    _echo("\n".join(lines))
 
 
 @app.command("create")
@@ -134,7 +198,7 @@ def task_create(
     priority: int = typer.Option(0, "--priority", "-p", help="Priority (higher = more important)"),
     tags: Optional[str] = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
     depends: Optional[str] = typer.Option(None, "--depends", help="Comma-separated dependency IDs"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Create a new task.
 
@@ -143,18 +207,10 @@ def task_create(
         brief task create "Add caching" -d "Implement Redis caching" -p 80
         brief task create "Write tests" --depends ag-1234
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
+    manager = _require_manager(base)
 
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
-
-    tag_list = [t.strip() for t in tags.split(",")] if tags else []
-    dep_list = [d.strip() for d in depends.split(",")] if depends else []
+    tag_list = split_csv(tags)
+    dep_list = split_csv(depends)
 
     try:
         task = manager.create_task(
@@ -164,9 +220,9 @@ def task_create(
             tags=tag_list,
             depends=dep_list
         )
-        typer.echo(f"Created task: {task.id}")
+        _echo(f"Created task: {task.id}")
     except ValueError as e:
-        typer.echo(f"Error: {e}", err=True)
+        _echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
 
 
@@ -174,7 +230,7 @@ def task_create(
 def task_start(
     task_id: str = typer.Argument(..., help="Task ID to start"),
     steps: Optional[str] = typer.Option(None, "--steps", "-s", help="Comma-separated step names"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Mark a task as in progress and set as active.
 
@@ -182,222 +238,191 @@ def task_start(
         brief task start ag-1234
         brief task start ag-1234 --steps "design,implement,test"
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
+    manager = _require_manager(base)
+    from ..models import TaskStatus
+
+    # Restarting the active in-progress task would only rewrite its start time
+    if not steps and manager.active_id == task_id:
+        task = manager.get_task(task_id)
+        if task and task.status == TaskStatus.IN_PROGRESS:
+            _echo(f"Already started: {task.id} - {task.title}")
+            return
 
     task = manager.start_task(task_id)
     if not task:
-        typer.echo(f"Task not found: {task_id}", err=True)
+        _echo(f"Task not found: {task_id}", err=True)
         raise typer.Exit(1)
 
-    typer.echo(f"Started: {task.id} - {task.title}")
-    typer.echo(f"  (Now the active task)")
+    _echo(f"Started: {task.id} - {task.title}")
+    _echo(f"  (Now the active task)")
 
     # Set steps if provided
     if steps:
-        step_names = [s.strip() for s in steps.split(",")]
+        step_names = split_csv(steps)
         task = manager.set_steps(task_id, step_names)
         if task:
-            typer.echo(f"  Steps: {len(task.steps)}")
-            for step in task.steps:
-                typer.echo(f"    - {step.id}: {step.name}")
+            lines = [f"  Steps: {len(task.steps)}"]
+            lines.extend(f"    - {step.id}: {step.name}" for step in task.steps)
+            _echo("\n".join(lines))
 
 
 @app.command("done")
 def task_done(
     task_id: str = typer.Argument(..., help="Task ID to complete"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Mark a task as complete."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
+    manager = _require_manager(base)
+    from ..models import TaskStatus
 
-    if not _check_tasks_enabled(brief_path):
+    task = manager.get_task(task_id)
+    if not task:
+        _echo(f"Task not found: {task_id}", err=True)
         raise typer.Exit(1)
 
-    manager = TaskManager(brief_path)
+    # Already done: skip the rewrite so the original completion time stands
+    if task.status == TaskStatus.DONE:
+        _echo(f"Already complete: {task.id} - {task.title}")
+        return
 
     task = manager.complete_task(task_id)
-    if task:
-        typer.echo(f"Completed: {task.id} - {task.title}")
-    else:
-        typer.echo(f"Task not found: {task_id}", err=True)
-        raise typer.Exit(1)
+    _echo(f"Completed: {task.id} - {task.title}")
 
 
 @app.command("note")
 def task_note(
     task_id: str = typer.Argument(..., help="Task ID"),
     note: str = typer.Argument(..., help="Note to add"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Add a note to a task."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
+    manager = _require_manager(base)
 
     task = manager.add_note(task_id, note)
     if task:
-        typer.echo(f"Note added to {task_id}")
+        _echo(f"Note added to {task_id}")
     else:
-        typer.echo(f"Task not found: {task_id}", err=True)
+        _echo(f"Task not found: {task_id}", err=True)
         raise typer.Exit(1)
 
 
 @app.command("show")
 def task_show(
     task_id: str = typer.Argument(..., help="Task ID to show"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Show details of a specific task."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
+    manager = _require_manager(base)
 
     task = manager.get_task(task_id)
     if not task:
-        typer.echo(f"Task not found: {task_id}", err=True)
+        _echo(f"Task not found: {task_id}", err=True)
         raise typer.Exit(1)
 
     # Check if this is the active task
-    active_task = manager.get_active_task()
-    is_active = active_task and active_task.id == task_id
+    is_active = manager.active_id == task_id
 
-    typer.echo(f"Task: {task.id}" + (" (ACTIVE)" if is_active else ""))
-    typer.echo(f"Title: {task.title}")
-    typer.echo(f"Status: {task.status.value}")
-    typer.echo(f"Priority: {task.priority}")
-    typer.echo(f"Created: {task.created}")
+    lines = [
+        f"Task: {task.id}" + (" (ACTIVE)" if is_active else ""),
+        f"Title: {task.title}",
+        f"Status: {task.status.value}",
+        f"Priority: {task.priority}",
+        f"Created: {task.created}",
+    ]
 
     if task.description:
-        typer.echo(f"Description: {task.description}")
+        lines.append(f"Description: {task.description}")
 
     if task.tags:
-        typer.echo(f"Tags: {', '.join(task.tags)}")
+        lines.append(f"Tags: {', '.join(task.tags)}")
 
     if task.depends:
-        typer.echo(f"Depends on: {', '.join(task.depends)}")
+        lines.append(f"Depends on: {', '.join(task.depends)}")
 
     if task.started:
-        typer.echo(f"Started: {task.started}")
+        lines.append(f"Started: {task.started}")
 
     if task.completed:
-        typer.echo(f"Completed: {task.completed}")
+        lines.append(f"Completed: {task.completed}")
 
     # Show steps if present
     if task.steps:
-        summary = manager.get_step_summary(task_id)
-        typer.echo("")
-        typer.echo(f"Steps: {summary['completed']}/{summary['total_steps']} complete ({summary['progress_percent']:.0f}%)")
+        summary = manager.summarize_steps(task)
+        lines.append("")
+        lines.append(f"Steps: {summary['completed']}/{summary['total_steps']} complete ({summary['progress_percent']:.0f}%)")
         if summary['current_step']:
-            typer.echo(f"Current: {summary['current_step']} - {summary['current_step_name']}")
-        typer.echo("")
+            lines.append(f"Current: {summary['current_step']} - {summary['current_step_name']}")
+        lines.append("")
         for step in task.steps:
-            icon = {
-                "pending": "○",
-                "in_progress": "◐",
-                "complete": "●",
-                "skipped": "⊘"
-            }.get(step.status.value, "?")
-            typer.echo(f"  {icon} {step.id}: {step.name}")
+            icon = _STEP_ICONS_PLAIN.get(step.status.value, "?")
+            lines.append(f"  {icon} {step.id}: {step.name}")
             if step.notes:
-                typer.echo(f"      Note: {step.notes}")
+                lines.append(f"      Note: {step.notes}")
 
     if task.notes:
-        typer.echo("")
-        typer.echo("Notes:")
+        lines.extend(("", "Notes:"))
         for note in task.notes:
-            typer.echo(f"  - {note}")
+            lines.append(f"  - {note}")
+
+    _echo("\n".join(lines))
 
 
 @app.command("delete")
 def task_delete(
     task_id: str = typer.Argument(..., help="Task ID to delete"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
     """Delete a task."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
-
-    task = manager.get_task(task_id)
-    if not task:
-        typer.echo(f"Task not found: {task_id}", err=True)
-        raise typer.Exit(1)
+    manager = _require_manager(base)
 
+    # The title is only needed for the prompt; --force goes straight to the delete
     if not force:
+        task = manager.get_task(task_id)
+        if not task:
+            _echo(f"Task not found: {task_id}", err=True)
+            raise typer.Exit(1)
+
         confirm = typer.confirm(f"Delete task '{task.title}'?")
         if not confirm:
-            typer.echo("Cancelled.")
+            _echo("Cancelled.")
             return
 
     if manager.delete_task(task_id):
-        typer.echo(f"Deleted: {task_id}")
+        _echo(f"Deleted: {task_id}")
     else:
-        typer.echo(f"Failed to delete: {task_id}", err=True)
+        _echo(f"Task not found: {task_id}", err=True)
+        raise typer.Exit(1)
 
 
 @app.command("blocked")
 def task_blocked(
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Show tasks that are blocked by dependencies."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
-    blocked = manager.get_blocked_tasks()
-
-    if not blocked:
-        typer.echo("No blocked tasks.")
+    manager = _require_manager(base)
+
+    # The header is filled in once the count is known
+    lines = [""]
+    count = 0
+    for task_id, title, blockers in manager.iter_blocked():
+        lines.append(f"⊘ {task_id}: {title}")
+        lines.append(f"  Blocked by: {', '.join(blockers)}")
+        count += 1
+
+    if not count:
+        _echo("No blocked tasks.")
         return
 
-    typer.echo(f"Blocked tasks ({len(blocked)}):")
-    typer.echo("-" * 60)
-
-    for task, blockers in blocked:
-        typer.echo(f"⊘ {task.id}: {task.title}")
-        typer.echo(f"  Blocked by: {', '.join(blockers)}")
+    lines[0] = _header("Blocked tasks", count)
+    _echo("\n".join(lines))
 
 
 @app.command("steps")
 def task_steps(
     steps: str = typer.Argument(..., help="Comma-separated step names"),
     task_id: Optional[str] = typer.Option(None, "--task", "-t", help="Task ID (uses active task if not provided)"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Set steps for a task.
 
@@ -405,34 +430,25 @@ def task_steps(
         brief task steps "design,implement,test"
         brief task steps "investigate,fix,verify" --task ag-1234
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
+    manager = _require_manager(base)
 
     # Use active task if no task_id provided
     if not task_id:
-        active = manager.get_active_task()
-        if not active:
-            typer.echo("No active task. Specify --task or start a task first.", err=True)
+        task_id = manager.active_id
+        if not task_id:
+            _echo("No active task. Specify --task or start a task first.", err=True)
             raise typer.Exit(1)
-        task_id = active.id
 
-    step_names = [s.strip() for s in steps.split(",")]
+    step_names = split_csv(steps)
     task = manager.set_steps(task_id, step_names)
 
     if not task:
-        typer.echo(f"Task not found: {task_id}", err=True)
+        _echo(f"Task not found: {task_id}", err=True)
         raise typer.Exit(1)
 
-    typer.echo(f"Set {len(task.steps)} steps for {task_id}:")
-    for step in task.steps:
-        typer.echo(f"  - {step.id}: {step.name}")
+    lines = [f"Set {len(task.steps)} steps for {task_id}:"]
+    lines.extend(f"  - {step.id}: {step.name}" for step in task.steps)
+    _echo("\n".join(lines))
 
 
 @app.command("step-done")
@@ -440,7 +456,7 @@ def task_step_done(
     step_id: str = typer.Argument(..., help="Step ID to mark complete"),
     task_id: Optional[str] = typer.Option(None, "--task", "-t", help="Task ID (uses active task if not provided)"),
     notes: Optional[str] = typer.Option(None, "--notes", "-n", help="Notes for this step"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Mark a step as complete.
 
@@ -448,82 +464,68 @@ def task_step_done(
         brief task step-done step-1
         brief task step-done step-2 --notes "Implemented with edge case handling"
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
+    manager = _require_manager(base)
 
     # Use active task if no task_id provided
     if not task_id:
-        active = manager.get_active_task()
-        if not active:
-            typer.echo("No active task. Specify --task or start a task first.", err=True)
+        task_id = manager.active_id
+        if not task_id:
+            _echo("No active task. Specify --task or start a task first.", err=True)
             raise typer.Exit(1)
-        task_id = active.id
 
-    task = manager.update_step(task_id, step_id, TaskStepStatus.COMPLETE, notes)
+    result = manager.complete_step_and_summarize(task_id, step_id, notes)
 
-    if not task:
-        typer.echo(f"Step '{step_id}' not found in task '{task_id}'", err=True)
+    if not result:
+        _echo(f"Step '{step_id}' not found in task '{task_id}'", err=True)
         raise typer.Exit(1)
 
-    typer.echo(f"Completed: {step_id}")
+    _, summary = result
+    _echo(f"Completed: {step_id}")
     if notes:
-        typer.echo(f"  Notes: {notes}")
+        _echo(f"  Notes: {notes}")
 
     # Show progress
-    summary = manager.get_step_summary(task_id)
-    if summary:
-        typer.echo(f"Progress: {summary['completed']}/{summary['total_steps']} ({summary['progress_percent']:.0f}%)")
-        if summary['current_step']:
-            typer.echo(f"Next: {summary['current_step']} - {summary['current_step_name']}")
-        elif summary['is_complete']:
-            typer.echo("All steps complete!")
+    _echo(f"Progress: {summary['completed']}/{summary['total_steps']} ({summary['progress_percent']:.0f}%)")
+    if summary['current_step']:
+        _echo(f"Next: {summary['current_step']} - {summary['current_step_name']}")
+    elif summary['is_complete']:
+        _echo("All steps complete!")
 
 
 @app.command("active")
 def task_active(
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Show the currently active task."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
+    manager = _require_manager(base)
     task = manager.get_active_task()
 
     if not task:
-        typer.echo("No active task. Start one with 'brief task start <id>'")
+        _echo("No active task. Start one with 'brief task start <id>'")
         return
 
-    typer.echo(f"Active task: {task.id} - {task.title}")
-    typer.echo(f"Status: {task.status.value}")
+    lines = [
+        f"Active task: {task.id} - {task.title}",
+        f"Status: {task.status.value}",
+    ]
 
     if task.steps:
-        summary = manager.get_step_summary(task.id)
-        typer.echo(f"Progress: {summary['completed']}/{summary['total_steps']} steps ({summary['progress_percent']:.0f}%)")
+        summary = manager.summarize_steps(task)
+        lines.append(f"Progress: {summary['completed']}/{summary['total_steps']} steps ({summary['progress_percent']:.0f}%)")
         if summary['current_step']:
-            typer.echo(f"Current step: {summary['current_step']} - {summary['current_step_name']}")
+            lines.append(f"Current step: {summary['current_step']} - {summary['current_step_name']}")
 
     if task.notes:
-        typer.echo(f"Latest note: {task.notes[-1]}")
+        lines.append(f"Latest note: {task.notes[-1]}")
+
+    _echo("\n".join(lines))
 
 
 @app.command("clear")
 def task_clear(
     done_only: bool = typer.Option(False, "--done-only", "-d", help="Only clear completed tasks"),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Clear tasks from the task list.
 
@@ -534,54 +536,47 @@ def task_clear(
         brief task clear --yes        # Clear all without confirmation
         brief task clear --done-only  # Only clear completed tasks
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
+    manager = _require_manager(base)
 
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
-    tasks = manager.list_tasks()
+    if done_only:
+        # Raw lines: only tasks that might be done get decoded
+        cleared_ids, kept_lines = manager.split_done_lines()
+        n_keep = len(kept_lines)
+    else:
+        cleared_ids = [t.id for t in manager.iter_tasks()]
+        kept_lines = []
+        n_keep = 0
+    n_clear = len(cleared_ids)
 
-    if not tasks:
-        typer.echo("No tasks to clear.")
+    if not n_clear and not n_keep:
+        _echo("No tasks to clear.")
         return
 
     if done_only:
-        tasks_to_clear = [t for t in tasks if t.status == TaskStatus.DONE]
-        tasks_to_keep = [t for t in tasks if t.status != TaskStatus.DONE]
-        action = f"Clear {len(tasks_to_clear)} completed tasks (keeping {len(tasks_to_keep)} active)?"
+        action = f"Clear {n_clear} completed tasks (keeping {n_keep} active)?"
     else:
-        tasks_to_clear = tasks
-        tasks_to_keep = []
-        action = f"Clear ALL {len(tasks_to_clear)} tasks?"
+        action = f"Clear ALL {n_clear} tasks?"
 
-    if not tasks_to_clear:
-        typer.echo("No tasks match the criteria to clear.")
+    if not n_clear:
+        _echo("No tasks match the criteria to clear.")
         return
 
     if not yes:
         confirm = typer.confirm(action)
         if not confirm:
-            typer.echo("Cancelled.")
+            _echo("Cancelled.")
             return
 
     # Write remaining tasks (or empty list)
-    write_jsonl(brief_path / TASKS_FILE, tasks_to_keep)
+    manager.write_task_lines(kept_lines)
 
     # Clear active task if we cleared all or if active task was cleared
-    if not done_only:
+    if not done_only or manager.active_id in cleared_ids:
         manager.clear_active_task()
-    else:
-        active = manager.get_active_task()
-        if active and active.status == TaskStatus.DONE:
-            manager.clear_active_task()
 
-    typer.echo(f"Cleared {len(tasks_to_clear)} tasks.")
-    if tasks_to_keep:
-        typer.echo(f"Kept {len(tasks_to_keep)} tasks.")
+    _echo(f"Cleared {n_clear} tasks.")
+    if n_keep:
+        _echo(f"Kept {n_keep} tasks.")
 
 
 # Archive subcommand group
@@ -596,7 +591,7 @@ def archive_callback(
     link: Optional[Path] = typer.Option(None, "--link", "-l", help="Link and copy a plan file to the archive"),
     clear: bool = typer.Option(False, "--clear", "-c", help="Clear tasks after archiving"),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation for --clear"),
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """Archive current tasks to .brief/archives/tasks/.
 
@@ -626,19 +621,23 @@ def _do_archive(
     base: Path,
 ) -> None:
     """Implementation of archive action."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    if not _check_tasks_enabled(brief_path):
-        raise typer.Exit(1)
-
-    manager = TaskManager(brief_path)
-    tasks = manager.list_tasks()
-
-    if not tasks:
-        typer.echo("No tasks to archive.")
+    manager = _require_manager(base)
+    brief_path = manager.brief_path
+    import shutil
+    from collections import Counter
+    from datetime import datetime
+    from ..storage import write_json
+
+    # One raw read serves both the snapshot and the status counts
+    try:
+        data = manager.tasks_file.read_bytes()
+    except FileNotFoundError:
+        data = b""
+    records = [line for line in data.splitlines() if line.strip()]
+    task_count = len(records)
+
+    if not task_count:
+        _echo("No tasks to archive.")
         return
 
     # Create archive directory
@@ -646,7 +645,8 @@ def _do_archive(
     archive_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate archive name
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y-%m-%d_%H%M%S")
     if name:
         archive_name = f"{timestamp}_{name}"
     else:
@@ -654,66 +654,77 @@ def _do_archive(
 
     # Create archive files
     archive_tasks_file = archive_dir / f"{archive_name}.jsonl"
-    archive_meta_file = archive_dir / f"{archive_name}.meta.json"
+    archive_meta_file = archive_dir / f"{archive_name}{_META_SUFFIX}"
 
     # Check if archive already exists
     if archive_tasks_file.exists():
-        typer.echo(f"Archive already exists: {archive_tasks_file.name}", err=True)
+        _echo(f"Archive already exists: {archive_tasks_file.name}", err=True)
         raise typer.Exit(1)
 
-    # Count task statuses
+    # Count task statuses without decoding the records
+    counts = Counter(_raw_status(line) for line in records)
     status_counts = {
-        "pending": len([t for t in tasks if t.status == TaskStatus.PENDING]),
-        "in_progress": len([t for t in tasks if t.status == TaskStatus.IN_PROGRESS]),
-        "done": len([t for t in tasks if t.status == TaskStatus.DONE]),
-        "blocked": len([t for t in tasks if t.status == TaskStatus.BLOCKED]),
+        key: counts[key] for key in ("pending", "in_progress", "done", "blocked")
     }
 
-    # Copy tasks to archive
-    shutil.copy(brief_path / TASKS_FILE, archive_tasks_file)
-    typer.echo(f"Archived {len(tasks)} tasks to: {archive_tasks_file.relative_to(brief_path)}")
+    # Write the snapshot from the bytes already read. Not a hardlink:
+    # tasks.jsonl is appended to and rewritten in place.
+    archive_tasks_file.write_bytes(data)
+    _echo(f"Archived {task_count} tasks to: {archive_tasks_file.relative_to(brief_path)}")
 
     # Handle linked plan file
     linked_plan_name = None
     if link:
         if not link.exists():
-            typer.echo(f"Warning: Link file not found: {link}", err=True)
+            _echo(f"Warning: Link file not found: {link}", err=True)
         else:
             # Copy plan file to archive directory with matching name
             plan_ext = link.suffix
             linked_plan_name = f"{archive_name}_plan{plan_ext}"
             archive_plan_file = archive_dir / linked_plan_name
-            shutil.copy(link, archive_plan_file)
-            typer.echo(f"Linked plan file: {archive_plan_file.relative_to(brief_path)}")
+            shutil.copyfile(link, archive_plan_file)
+            _echo(f"Linked plan file: {archive_plan_file.relative_to(brief_path)}")
 
     # Write metadata
-    import json
     meta = {
-        "archived_at": datetime.now().isoformat(),
+        "archived_at": now.isoformat(),
         "name": name or archive_name,
-        "task_count": len(tasks),
+        "task_count": task_count,
         "status_counts": status_counts,
         "linked_plan": linked_plan_name,
         "original_plan_path": str(link) if link else None,
     }
-    archive_meta_file.write_text(json.dumps(meta, indent=2))
+    write_json(archive_meta_file, meta)
 
     # Clear tasks if requested
     if clear:
         if not yes:
-            confirm = typer.confirm(f"Clear all {len(tasks)} tasks after archiving?")
+            confirm = typer.confirm(f"Clear all {task_count} tasks after archiving?")
             if not confirm:
-                typer.echo("Tasks archived but not cleared.")
+                _echo("Tasks archived but not cleared.")
                 return
 
-        write_jsonl(brief_path / TASKS_FILE, [])
+        manager.write_task_lines([])
         manager.clear_active_task()
-        typer.echo(f"Cleared {len(tasks)} tasks.")
+        _echo(f"Cleared {task_count} tasks.")
+
+
+def _read_archive_meta(path: str) -> Optional[dict]:
+    """Read one archive's metadata; None if unreadable or not a JSON object.
+
+    Shape is checked up front instead of catching whatever .get() raises.
+    """
+    from ..storage import read_json
+    try:
+        meta = read_json(Path(path))
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
 
 
 @archive_app.command("list")
 def archive_list(
-    base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
+    base: Path = typer.Option(_CWD, "--base", "-b", help="Base path"),
 ) -> None:
     """List all task archives.
 
@@ -723,38 +734,53 @@ def archive_list(
         brief task archive list
     """
     brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
+    if not brief_dir_exists(brief_path):
+        _echo("Error: Brief not initialized.", err=True)
         raise typer.Exit(1)
 
-    archive_dir = brief_path / TASK_ARCHIVES_DIR
-    if not archive_dir.exists():
-        typer.echo("No archives found.")
-        return
-
-    # Find all archive metadata files
-    meta_files = sorted(archive_dir.glob("*.meta.json"))
+    # Find all archive metadata files; names start with a timestamp, so
+    # sorting by name is chronological. DirEntry carries the file type, so
+    # no per-file stat is needed.
+    try:
+        with os.scandir(brief_path / TASK_ARCHIVES_DIR) as it:
+            meta_files = sorted(
+                (e for e in it if e.name.endswith(_META_SUFFIX) and e.is_file(follow_symlinks=False)),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
+        meta_files = []
     if not meta_files:
-        typer.echo("No archives found.")
+        _echo("No archives found.")
         return
 
-    import json
-    typer.echo(f"Task Archives ({len(meta_files)}):")
-    typer.echo("-" * 60)
-
-    for meta_file in meta_files:
-        try:
-            meta = json.loads(meta_file.read_text())
-            name = meta.get("name", meta_file.stem.replace(".meta", ""))
-            count = meta.get("task_count", "?")
-            archived_at = meta.get("archived_at", "?")[:10]  # Just date
-            status = meta.get("status_counts", {})
-            done = status.get("done", 0)
-            linked = meta.get("linked_plan")
-
-            status_str = f"({done}/{count} done)"
-            link_str = f" [linked: {linked}]" if linked else ""
-
-            typer.echo(f"  {name} - {count} tasks {status_str} - {archived_at}{link_str}")
-        except Exception:
-            typer.echo(f"  {meta_file.stem} (error reading metadata)")
+    lines = [_header("Task Archives", len(meta_files))]
+
+    paths = [meta_file.path for meta_file in meta_files]
+    if len(paths) >= _PARALLEL_META_READS:
+        # Enough files that overlapping the open/read syscalls pays for the pool
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=_PARALLEL_META_READS) as pool:
+            metas = list(pool.map(_read_archive_meta, paths))
+    else:
+        metas = [_read_archive_meta(path) for path in paths]
+
+    for meta_file, meta in zip(meta_files, metas):
+        stem = meta_file.name[:-len(_META_SUFFIX)]
+        if meta is None:
+            lines.append(f"  {stem} (error reading metadata)")
+            continue
+
+        name = meta.get("name", stem)
+        count = meta.get("task_count", "?")
+        archived_at = str(meta.get("archived_at", "?"))[:10]  # Just date
+        status = meta.get("status_counts")
+        done = status.get("done", 0) if isinstance(status, dict) else 0
+        linked = meta.get("linked_plan")
+
+        status_str = f"({done}/{count} done)"
+        link_str = f" [linked: {linked}]" if linked else ""
+
+        lines.append(f"  {name} - {count} tasks {status_str} - {archived_at}{link_str}")
+
+    # One write for the whole listing instead of one echo per archive
+    _echo("\n".join(lines))
@@ -1,14 +1,73 @@
 """Execution path tracing commands for Brief."""
+from __future__ import annotations
+
 import typer
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
-from ..config import get_brief_path
-from ..tracing.tracer import PathTracer
-from ..models import TraceDefinition
+from typing import TYPE_CHECKING, Optional
+from ..config import get_brief_path, brief_dir_exists, MANIFEST_FILE, RELATIONSHIPS_FILE
+
+if TYPE_CHECKING:
+    from ..models import TraceDefinition
+    from ..tracing.tracer import PathTracer
 
 app = typer.Typer()
 
+# Display order for trace categories; any others follow alphabetically
+_CATEGORY_ORDER = ("cli", "api", "other", "test")
+
+# Row layout for `trace list`: status, name, entry point, description
+_TRACE_ROW = "    {} {:<25} {:<30} {}".format
+
+
+def _stamp(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=4)
+def _get_tracer(
+    brief_path: Path,
+    base: Path,
+    manifest_stamp: Optional[tuple[int, int]] = None,
+    relationships_stamp: Optional[tuple[int, int]] = None,
+) -> PathTracer:
+    """Return a shared PathTracer for a (brief_path, base) pair.
+
+    The tracer memoizes the parsed manifest and relationships, so reusing it
+    saves re-reading them when several trace commands run in one process.
+    The file stamps are part of the cache key, so a re-analyze gets a fresh
+    tracer. Tests can reset it with `_get_tracer.cache_clear()`.
+    """
+    from ..tracing.tracer import PathTracer
+    return PathTracer(brief_path, base)
+
+
+def _require_tracer(base: Path) -> PathTracer:
+    """Build the PathTracer for a command, exiting if Brief isn't initialized.
+
+    The tracer (and the models/storage it pulls in) is imported here so
+    `brief trace --help` doesn't pay for it.
+    """
+    brief_path = get_brief_path(base)
+    if not brief_dir_exists(brief_path):
+        typer.echo("Error: Brief not initialized.", err=True)
+        raise typer.Exit(1)
+
+    brief_path = brief_path.resolve()
+    return _get_tracer(
+        brief_path,
+        base.resolve(),
+        _stamp(brief_path / MANIFEST_FILE),
+        _stamp(brief_path / RELATIONSHIPS_FILE),
+    )
+
 
 @app.command("list")
 def trace_list(
@@ -20,61 +79,53 @@ def trace_list(
     Shows saved trace definitions with their entry points and validity status.
     Traces are regenerated dynamically when viewed - this just shows metadata.
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    tracer = PathTracer(brief_path, base)
+    tracer = _require_tracer(base)
     definitions = tracer.list_trace_definitions()
 
     if category:
         definitions = [d for d in definitions if d.category == category]
 
     if not definitions:
-        typer.echo("No trace definitions found.")
-        typer.echo("")
-        typer.echo("To create traces automatically from entry points:")
-        typer.echo("  brief trace discover --auto")
-        typer.echo("")
-        typer.echo("To define a trace manually:")
-        typer.echo("  brief trace define <name> <entry_point>")
+        typer.echo(
+            "No trace definitions found.\n"
+            "\n"
+            "To create traces automatically from entry points:\n"
+            "  brief trace discover --auto\n"
+            "\n"
+            "To define a trace manually:\n"
+            "  brief trace define <name> <entry_point>"
+        )
         return
 
     # Group by category
-    by_category: dict[str, list[TraceDefinition]] = {}
+    by_category: dict[str, list[TraceDefinition]] = defaultdict(list)
     for d in definitions:
-        cat = d.category or "other"
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(d)
+        by_category[d.category or "other"].append(d)
 
-    typer.echo(f"Trace Definitions ({len(definitions)}):")
-    typer.echo("")
+    # Build the whole listing and write it once
+    lines = [f"Trace Definitions ({len(definitions)}):", ""]
 
-    for cat in ["cli", "api", "other", "test"]:
+    for cat in (*_CATEGORY_ORDER, *sorted(by_category.keys() - set(_CATEGORY_ORDER))):
         if cat not in by_category:
             continue
 
         cat_traces = by_category[cat]
-        typer.echo(f"  {cat.upper()} ({len(cat_traces)}):")
+        lines.append(f"  {cat.upper()} ({len(cat_traces)}):")
 
         for d in cat_traces:
             # Check if entry point still exists
             exists = tracer.check_entry_point_exists(d.entry_point)
-            status = "✓" if exists else "✗"
-
-            # Truncate description
-            desc = d.description[:40] + "..." if len(d.description) > 40 else d.description
-
             if exists:
-                typer.echo(f"    {status} {d.name:<25} {d.entry_point:<30} {desc}")
+                # Truncate description
+                desc = d.description[:40] + "..." if len(d.description) > 40 else d.description
+                lines.append(_TRACE_ROW("✓", d.name, d.entry_point, desc))
             else:
-                typer.echo(f"    {status} {d.name:<25} {d.entry_point:<30} (entry point not found)")
+                lines.append(_TRACE_ROW("✗", d.name, d.entry_point, "(entry point not found)"))
 
-        typer.echo("")
+        lines.append("")
 
-    typer.echo("  ✓ = entry point exists, ✗ = entry point not found")
+    lines.append("  ✓ = entry point exists, ✗ = entry point not found")
+    typer.echo("\n".join(lines))
 
 
 @app.command("show")
@@ -87,12 +138,7 @@ def trace_show(
 
     By default shows a compact flow diagram. Use -v for full code snippets.
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    tracer = PathTracer(brief_path, base)
+    tracer = _require_tracer(base)
     definition = tracer.get_trace_definition(name)
 
     if not definition:
@@ -144,12 +190,9 @@ def trace_define(
     Example:
         brief trace define user-login AuthService.login -d "User authentication flow"
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    tracer = PathTracer(brief_path, base)
+    tracer = _require_tracer(base)
+    from datetime import datetime
+    from ..models import TraceDefinition
 
     # Check if entry point exists
     if not tracer.check_entry_point_exists(entry_point):
@@ -186,12 +229,7 @@ def trace_update(
     base: Path = typer.Option(Path("."), "--base", "-b", help="Base path"),
 ) -> None:
     """Update a trace definition."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    tracer = PathTracer(brief_path, base)
+    tracer = _require_tracer(base)
     definition = tracer.get_trace_definition(name)
 
     if not definition:
@@ -217,12 +255,7 @@ def trace_delete(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
     """Delete a trace definition."""
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    tracer = PathTracer(brief_path, base)
+    tracer = _require_tracer(base)
 
     if not tracer.get_trace_definition(name):
         typer.echo(f"Trace not found: {name}", err=True)
@@ -255,58 +288,53 @@ def trace_discover(
     Example:
         brief trace discover --auto
     """
-    brief_path = get_brief_path(base)
-    if not brief_path.exists():
-        typer.echo("Error: Brief not initialized.", err=True)
-        raise typer.Exit(1)
-
-    tracer = PathTracer(brief_path, base)
+    tracer = _require_tracer(base)
 
     typer.echo("Scanning for entry points...")
     entry_points = tracer.find_entry_points(include_tests=include_tests)
 
     if not entry_points:
-        typer.echo("No entry points found.")
-        typer.echo("")
-        typer.echo("Entry points are detected from decorators like:")
-        typer.echo("  @app.command, @click.command (CLI)")
-        typer.echo("  @app.route, @router.get (API)")
-        typer.echo("")
-        typer.echo("Make sure you've run 'brief analyze all' first.")
+        typer.echo(
+            "No entry points found.\n"
+            "\n"
+            "Entry points are detected from decorators like:\n"
+            "  @app.command, @click.command (CLI)\n"
+            "  @app.route, @router.get (API)\n"
+            "\n"
+            "Make sure you've run 'brief analyze all' first."
+        )
         return
 
     # Check existing definitions
     existing = {t.name for t in tracer.list_trace_definitions()}
 
-    typer.echo(f"Found {len(entry_points)} entry points:")
-    typer.echo("")
+    lines = [f"Found {len(entry_points)} entry points:", ""]
 
     # Group by category
-    by_category: dict[str, list] = {}
+    by_category: dict[str, list] = defaultdict(list)
     for ep in entry_points:
-        cat = ep["category"]
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(ep)
+        by_category[ep["category"]].append(ep)
 
     for cat, eps in by_category.items():
-        typer.echo(f"  {cat.upper()}: {len(eps)}")
-        for ep in eps[:5]:  # Show first 5 per category
-            typer.echo(f"    - {ep['function']} ({ep['decorator']})")
+        lines.append(f"  {cat.upper()}: {len(eps)}")
+        for ep in islice(eps, 5):  # Show first 5 per category
+            lines.append(f"    - {ep['function']} ({ep['decorator']})")
         if len(eps) > 5:
-            typer.echo(f"    ... and {len(eps) - 5} more")
-        typer.echo("")
+            lines.append(f"    ... and {len(eps) - 5} more")
+        lines.append("")
 
     if auto:
         created = tracer.auto_create_trace_definitions(include_tests=include_tests)
-        typer.echo(f"Created {len(created)} trace definitions.")
-        for d in created[:10]:
-            typer.echo(f"  - {d.name}: {d.entry_point}")
+        lines.append(f"Created {len(created)} trace definitions.")
+        for d in islice(created, 10):
+            lines.append(f"  - {d.name}: {d.entry_point}")
         if len(created) > 10:
-            typer.echo(f"  ... and {len(created) - 10} more")
+            lines.append(f"  ... and {len(created) - 10} more")
     else:
-        typer.echo("Run with --auto to create trace definitions for all entry points.")
-        typer.echo("Or define individually with: brief trace define <name> <entry_point>")
+        lines.append("Run with --auto to create trace definitions for all entry points.")
+        lines.append("Or define individually with: brief trace define <name> <entry_point>")
+
+    typer.echo("\n".join(lines))
 
 
 # Backward compatibility alias
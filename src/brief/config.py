@@ -1,7 +1,12 @@
 """Configuration and environment loading for Brief."""
 
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+import copy
 import os
 
 # Try to load dotenv if available
@@ -15,6 +20,9 @@ except ImportError:
 def load_env() -> bool:
     """Load environment variables from .env file.
 
+    Several modules call this at import time; the result is cached per
+    working directory so only the first call probes the filesystem.
+
     Returns:
         True if .env file was found and loaded, False otherwise.
     """
@@ -24,18 +32,32 @@ def load_env() -> bool:
     # Load from current working directory (user's project root).
     # CWD is where the user invokes `brief` from — the correct location
     # for their .env file, not Brief's install directory.
-    if Path(".env").exists():
-        load_dotenv()
-        return True
+    return _load_env_in(os.getcwd())
+
 
+@lru_cache(maxsize=4)
+def _load_env_in(cwd: str) -> bool:
+    """Load cwd/.env if present (cached by load_env)."""
+    env_file = os.path.join(cwd, ".env")
+    if os.path.exists(env_file):
+        load_dotenv(env_file)
+        return True
     return False
 
 
+def reset_env_cache() -> None:
+    """Forget cached load_env results (for tests)."""
+    _load_env_in.cache_clear()
+
+
 # Brief configuration constants
 BRIEF_DIR = ".brief"
 MANIFEST_FILE = "manifest.jsonl"
+MANIFEST_SHARD_FILE = "manifest.{type}.jsonl"  # Per-type copy of the manifest
+MANIFEST_INDEX_FILE = "manifest.idx"  # (type, path, offset, length) per manifest line
 RELATIONSHIPS_FILE = "relationships.jsonl"
 TASKS_FILE = "tasks.jsonl"
+TASKS_INDEX_FILE = "tasks.idx"  # (id, status, tags, offset, length) per task line
 ACTIVE_TASK_FILE = "active_task"
 MEMORY_FILE = "memory.jsonl"
 EMBEDDINGS_DB = "embeddings.db"
@@ -67,6 +89,18 @@ DEFAULT_DOC_INCLUDE = [
 ]
 
 # Default patterns for documentation files to exclude
+# Dated files - various formats typically used for logs/status reports
+DATE_DOC_EXCLUDE = (
+    # YYYY-MM-DD (ISO format)
+    "*[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*",
+    # YYYY_MM_DD (underscore variant)
+    "*[0-9][0-9][0-9][0-9]_[0-9][0-9]_[0-9][0-9]*",
+    # YYYY.MM.DD (dot variant)
+    "*[0-9][0-9][0-9][0-9].[0-9][0-9].[0-9][0-9]*",
+    # YYYYMMDD (compact)
+    "*[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9]*",
+)
+
 DEFAULT_DOC_EXCLUDE = [
     "**/archive/**",
     "**/old/**",
@@ -77,25 +111,17 @@ DEFAULT_DOC_EXCLUDE = [
     "**/wip/**",
     "**/*-session-*",
     "**/*-log-*",
-    # Dated files - various formats typically used for logs/status reports
-    # YYYY-MM-DD (ISO format)
-    "*[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*",
-    # YYYY_MM_DD (underscore variant)
-    "*[0-9][0-9][0-9][0-9]_[0-9][0-9]_[0-9][0-9]*",
-    # YYYY.MM.DD (dot variant)
-    "*[0-9][0-9][0-9][0-9].[0-9][0-9].[0-9][0-9]*",
-    # YYYYMMDD (compact)
-    "*[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9]*",
+    *DATE_DOC_EXCLUDE,
 ]
 
 # File extensions we fully parse (extract structure)
-PARSED_EXTENSIONS = {
+PARSED_EXTENSIONS = MappingProxyType({
     ".py": "python",    # Full AST parsing
     ".md": "markdown",  # Heading extraction
-}
+})
 
 # File extensions we track but don't parse (just record existence)
-TRACKED_EXTENSIONS = {
+TRACKED_EXTENSIONS = frozenset({
     # Code files
     ".js", ".ts", ".jsx", ".tsx",
     ".go", ".rs", ".rb", ".java", ".kt",
@@ -113,7 +139,15 @@ TRACKED_EXTENSIONS = {
     ".txt", ".rst", ".csv",
     # Other
     ".sql", ".graphql", ".proto",
-}
+})
+
+# One lookup table for both: suffix -> "python" / "markdown" / "other"
+_EXT_KIND: dict[str, str] = {**dict.fromkeys(TRACKED_EXTENSIONS, "other"), **PARSED_EXTENSIONS}
+
+
+def classify_extension(suffix: str) -> Optional[str]:
+    """Classify a file suffix as "python", "markdown", "other" (tracked), or None."""
+    return _EXT_KIND.get(suffix.lower())
 
 
 def get_brief_path(base_path: Optional[Path] = None) -> Path:
@@ -127,10 +161,89 @@ def get_brief_path(base_path: Optional[Path] = None) -> Path:
         Path to the .brief directory.
     """
     if base_path is None:
-        base_path = Path.cwd()
+        # One Path built from the joined string instead of cwd() then "/"
+        return Path(os.path.join(os.getcwd(), BRIEF_DIR))
     return base_path / BRIEF_DIR
 
 
+# .brief directories already seen to exist in this process. Only positive
+# results are kept, so `brief init` followed by another command still works.
+_EXISTING_BRIEF_DIRS: set[str] = set()
+
+
+def brief_dir_exists(brief_path: Path) -> bool:
+    """Check that a .brief directory exists, remembering positive results."""
+    key = os.path.abspath(brief_path)
+    if key in _EXISTING_BRIEF_DIRS:
+        return True
+    if os.path.exists(key):
+        _EXISTING_BRIEF_DIRS.add(key)
+        return True
+    return False
+
+
+def clear_brief_dir_cache() -> None:
+    """Forget cached .brief existence checks (for tests)."""
+    _EXISTING_BRIEF_DIRS.clear()
+
+
+def get_config(brief_path: Path) -> dict:
+    """Load config.json from a .brief directory.
+
+    Parsed configs are cached on the file's mtime and size, so repeated
+    lookups in one process (logging, the command itself, context building)
+    only parse the file once. Callers get their own copy to modify freely.
+
+    Args:
+        brief_path: Path to the .brief directory
+
+    Returns:
+        Loaded config dict
+    """
+    config_file = brief_path / "config.json"
+    stat = config_file.stat()
+    return copy.deepcopy(_read_config(str(config_file), stat.st_mtime_ns, stat.st_size))
+
+
+def get_config_value(brief_path: Path, key: str, default: Any = None) -> Any:
+    """Look up one config setting without copying the whole config.
+
+    Shares get_config's parse cache. The value itself is not copied, so
+    use this for scalar settings (flags, names, limits) only.
+
+    Args:
+        brief_path: Path to the .brief directory
+        key: Config key to read
+        default: Value returned when the key is missing
+
+    Returns:
+        The configured value, or default
+    """
+    config_file = brief_path / "config.json"
+    stat = config_file.stat()
+    return _read_config(str(config_file), stat.st_mtime_ns, stat.st_size).get(key, default)
+
+
+@lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a config file (cache key includes mtime and size)."""
+    from .storage import read_json
+    return read_json(Path(path))
+
+
+@lru_cache(maxsize=8)
+def _read_gitignore_patterns(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Parse exclude patterns from a .gitignore (cache key includes mtime and size)."""
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        lines = (line.strip() for line in f)
+        # Strip trailing slash (gitignore convention for directories)
+        patterns = (
+            line.rstrip("/") for line in lines
+            if line and line[0] not in "#!"
+        )
+        return tuple(dict.fromkeys(p for p in patterns if p))
+
+
 def load_exclude_patterns(base_path: Path, config: dict) -> list[str]:
     """Load all effective exclude patterns from config and gitignore.
 
@@ -141,21 +254,21 @@ def load_exclude_patterns(base_path: Path, config: dict) -> list[str]:
     Returns:
         Combined list of exclude patterns
     """
-    patterns = list(config.get("exclude_patterns", DEFAULT_EXCLUDE_PATTERNS))
+    patterns = dict.fromkeys(config.get("exclude_patterns", DEFAULT_EXCLUDE_PATTERNS))
 
     # Add gitignore patterns if enabled
     if config.get("use_gitignore", False):
         gitignore = base_path / ".gitignore"
-        if gitignore.exists():
-            for line in gitignore.read_text().splitlines():
-                line = line.strip()
-                if line and not line.startswith("#") and not line.startswith("!"):
-                    # Strip trailing slash (gitignore convention for directories)
-                    pattern = line.rstrip("/")
-                    if pattern and pattern not in patterns:
-                        patterns.append(pattern)
+        try:
+            stat = gitignore.stat()
+        except OSError:
+            pass
+        else:
+            patterns.update(dict.fromkeys(
+                _read_gitignore_patterns(str(gitignore), stat.st_mtime_ns, stat.st_size)
+            ))
 
-    return patterns
+    return list(patterns)
 
 
 def find_brief_root(start_path: Optional[Path] = None) -> Optional[Path]:
@@ -167,18 +280,14 @@ def find_brief_root(start_path: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to directory containing .brief, or None if not found.
     """
-    if start_path is None:
-        start_path = Path.cwd()
-
-    current = start_path.resolve()
-
-    while current != current.parent:
-        if (current / BRIEF_DIR).exists():
-            return current
-        current = current.parent
-
-    # Check root
-    if (current / BRIEF_DIR).exists():
-        return current
-
-    return None
+    # Walk plain strings: no Path objects per level, and the loop ends after
+    # checking the filesystem root itself
+    current = os.path.realpath(os.getcwd() if start_path is None else start_path)
+
+    while True:
+        if os.path.isdir(os.path.join(current, BRIEF_DIR)):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
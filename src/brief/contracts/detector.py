@@ -1,10 +1,85 @@
 """Pattern-based contract detection."""
 from pathlib import Path
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from functools import lru_cache
+from itertools import islice
+import re
+from typing import Iterable, Optional, Any, Sequence
 from ..storage import read_jsonl
 from ..config import MANIFEST_FILE
 
+# Class name suffixes that suggest a naming convention
+_CLASS_SUFFIXES = (
+    "Command", "Manager", "Handler", "Service",
+    "Factory", "Base", "Error", "Exception",
+    "Test", "Mixin", "View", "Model",
+)
+
+# Function name prefixes, in match order, and what they usually mean
+_FUNC_PREFIX_PURPOSE = {
+    "test_": "test functions",
+    "get_": "getter functions",
+    "set_": "setter functions",
+    "is_": "boolean check functions",
+    "has_": "boolean check functions",
+    "_": "private/protected functions",
+    "__": "dunder/magic methods",
+    "handle_": "event handler functions",
+    "on_": "callback functions",
+}
+# One C-level match per name; regex alternation tries prefixes in listed
+# order, so the first listed match wins (e.g. "_" before "__")
+_FUNC_PREFIX_MATCH = re.compile("|".join(map(re.escape, _FUNC_PREFIX_PURPOSE))).match
+
+
+def _by_char(affixes: tuple[str, ...], index: int) -> dict[str, tuple[str, ...]]:
+    """Bucket affixes by their first (0) or last (-1) character, keeping order."""
+    buckets: dict[str, list[str]] = defaultdict(list)
+    for affix in affixes:
+        buckets[affix[index]].append(affix)
+    return {char: tuple(group) for char, group in buckets.items()}
+
+
+# After the C-level endswith(tuple) gate, only the suffixes sharing the
+# name's last character need checking
+_CLASS_SUFFIXES_BY_LAST = _by_char(_CLASS_SUFFIXES, -1)
+
+# Return types too common to be worth a contract
+_COMMON_RETURN_TYPES = frozenset({"None", "str", "int", "bool", "list", "dict"})
+
+
+def load_manifest(brief_path: Path) -> tuple[dict[str, Any], ...]:
+    """Load manifest.jsonl records, sharing one parse per file version.
+
+    Detection and LLM inference both read the whole manifest; the parse is
+    cached on (path, mtime, size) so repeat loads in a process are free.
+    The records are shared, so callers must not modify them.
+    """
+    manifest_file = brief_path / MANIFEST_FILE
+    try:
+        stat = manifest_file.stat()
+    except OSError:
+        return ()
+    return _read_manifest(str(manifest_file), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _read_manifest(path: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], ...]:
+    """Parse a manifest file (cache key includes mtime and size)."""
+    return tuple(read_jsonl(Path(path)))
+
+
+def _unique(items: Iterable[str], limit: Optional[int] = None) -> list[str]:
+    """Distinct items in first-seen order, optionally only the first `limit`."""
+    return list(islice(dict.fromkeys(items), limit))
+
+
+@lru_cache(maxsize=1024)
+def _parent_dir(path: str) -> str:
+    """Parent directory of a manifest path, as a string."""
+    return str(Path(path).parent)
+
 
 @dataclass
 class Contract:
@@ -65,43 +140,83 @@ class Contract:
         return "\n".join(lines)
 
 
+@dataclass
+class _ManifestScan:
+    """Manifest records grouped for each detector, built in one pass."""
+    class_suffixes: dict[str, list[dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+    func_prefixes: dict[str, list[dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+    files_by_dir: dict[str, list[dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+    init_files: list[dict[str, Any]] = field(default_factory=list)
+    return_types: dict[str, list[dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+    generator_funcs: list[dict[str, Any]] = field(default_factory=list)
+    async_funcs: list[dict[str, Any]] = field(default_factory=list)
+    base_classes: dict[str, list[dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+    decorators: dict[str, list[dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+
+
 class ContractDetector:
     """Detect contracts from code patterns."""
 
     def __init__(self, brief_path: Path, base_path: Path):
         self.brief_path = brief_path
         self.base_path = base_path
-        self._manifest: Optional[list[dict[str, Any]]] = None
+        self._manifest: Optional[Sequence[dict[str, Any]]] = None
+        self._scan: Optional[_ManifestScan] = None
 
-    def _load_manifest(self) -> list[dict[str, Any]]:
+    def _load_manifest(self) -> Sequence[dict[str, Any]]:
         if self._manifest is None:
-            self._manifest = list(read_jsonl(self.brief_path / MANIFEST_FILE))
+            self._manifest = load_manifest(self.brief_path)
         return self._manifest
 
+    def _scan_manifest(self) -> _ManifestScan:
+        """Group the manifest for all detectors in a single pass (cached)."""
+        if self._scan is not None:
+            return self._scan
+
+        scan = _ManifestScan()
+        for record in self._load_manifest():
+            rtype = record.get("type")
+            if rtype == "class":
+                name = record.get("name", "")
+                if name.endswith(_CLASS_SUFFIXES):
+                    suffix = next(s for s in _CLASS_SUFFIXES_BY_LAST[name[-1]] if name.endswith(s))
+                    scan.class_suffixes[suffix].append(record)
+                for base in record.get("bases", []):
+                    scan.base_classes[base].append(record)
+                for dec in record.get("decorators", []):
+                    scan.decorators[dec].append(record)
+            elif rtype == "function":
+                name = record.get("name", "")
+                match = _FUNC_PREFIX_MATCH(name)
+                if match:
+                    scan.func_prefixes[match.group()].append(record)
+                if record.get("returns"):
+                    scan.return_types[record["returns"]].append(record)
+                if record.get("is_generator"):
+                    scan.generator_funcs.append(record)
+                if record.get("is_async"):
+                    scan.async_funcs.append(record)
+                for dec in record.get("decorators", []):
+                    scan.decorators[dec].append(record)
+            elif rtype == "file":
+                path = record.get("path", "")
+                scan.files_by_dir[_parent_dir(path)].append(record)
+                if path.endswith("__init__.py"):
+                    scan.init_files.append(record)
+
+        self._scan = scan
+        return scan
+
     def detect_naming_conventions(self) -> list[Contract]:
         """Detect naming convention contracts."""
         contracts = []
-        manifest = self._load_manifest()
+        scan = self._scan_manifest()
 
-        # Detect class naming patterns
-        class_suffixes: dict[str, list[dict[str, Any]]] = {}
-        for record in manifest:
-            if record.get("type") == "class":
-                name = record.get("name", "")
-                # Find common suffixes
-                for suffix in ["Command", "Manager", "Handler", "Service",
-                               "Factory", "Base", "Error", "Exception",
-                               "Test", "Mixin", "View", "Model"]:
-                    if name.endswith(suffix):
-                        if suffix not in class_suffixes:
-                            class_suffixes[suffix] = []
-                        class_suffixes[suffix].append(record)
-
-        # Create contracts for common suffixes
-        for suffix, records in class_suffixes.items():
+        # Create contracts for common class suffixes
+        for suffix, records in scan.class_suffixes.items():
             if len(records) >= 2:  # At least 2 occurrences
                 # Find common directory
-                dirs = set(str(Path(r.get("file", "")).parent) for r in records)
+                dirs = set(_parent_dir(r.get("file", "")) for r in records)
                 if len(dirs) == 1:
                     dir_str = str(list(dirs)[0])
                 else:
@@ -117,40 +232,17 @@ class ContractDetector:
                     confidence="high" if len(records) >= 3 else "medium"
                 ))
 
-        # Detect function naming patterns (e.g., test_ prefix)
-        func_prefixes: dict[str, list[dict[str, Any]]] = {}
-        for record in manifest:
-            if record.get("type") == "function":
-                name = record.get("name", "")
-                for prefix in ["test_", "get_", "set_", "is_", "has_",
-                               "_", "__", "handle_", "on_"]:
-                    if name.startswith(prefix):
-                        if prefix not in func_prefixes:
-                            func_prefixes[prefix] = []
-                        func_prefixes[prefix].append(record)
-                        break  # Only match first prefix
-
-        # Create contracts for significant function prefixes
-        for prefix, records in func_prefixes.items():
+        # Create contracts for significant function prefixes (e.g., test_)
+        for prefix, records in scan.func_prefixes.items():
             if len(records) >= 5:  # Require more occurrences for functions
-                purpose = {
-                    "test_": "test functions",
-                    "get_": "getter functions",
-                    "set_": "setter functions",
-                    "is_": "boolean check functions",
-                    "has_": "boolean check functions",
-                    "_": "private/protected functions",
-                    "__": "dunder/magic methods",
-                    "handle_": "event handler functions",
-                    "on_": "callback functions"
-                }.get(prefix, "functions")
+                purpose = _FUNC_PREFIX_PURPOSE.get(prefix, "functions")
 
                 contracts.append(Contract(
                     name=f"{prefix}* Function Naming",
                     rule=f"Functions starting with '{prefix}' are {purpose}",
                     category="naming",
                     examples_good=[r.get("name", "") for r in records[:5]],
-                    files_affected=list(set(r.get("file", "") for r in records))[:10],
+                    files_affected=_unique((r.get("file", "") for r in records), 10),
                     source=f"Detected from {len(records)} functions",
                     confidence="high" if len(records) >= 10 else "medium"
                 ))
@@ -160,19 +252,10 @@ class ContractDetector:
     def detect_file_organization(self) -> list[Contract]:
         """Detect file organization contracts."""
         contracts = []
-        manifest = self._load_manifest()
-
-        # Group files by parent directory
-        by_dir: dict[str, list[dict[str, Any]]] = {}
-        for record in manifest:
-            if record.get("type") == "file":
-                parent = str(Path(record.get("path", "")).parent)
-                if parent not in by_dir:
-                    by_dir[parent] = []
-                by_dir[parent].append(record)
+        scan = self._scan_manifest()
 
         # Detect patterns in specific directories
-        for dir_path, files in by_dir.items():
+        for dir_path, files in scan.files_by_dir.items():
             if "definitions" in dir_path:
                 contracts.append(Contract(
                     name="Definitions Directory Pattern",
@@ -202,8 +285,7 @@ class ContractDetector:
                 ))
 
         # Detect __init__.py pattern
-        init_files = [r for r in manifest
-                      if r.get("type") == "file" and r.get("path", "").endswith("__init__.py")]
+        init_files = scan.init_files
         if init_files:
             contracts.append(Contract(
                 name="Package Structure",
@@ -219,54 +301,43 @@ class ContractDetector:
     def detect_type_patterns(self) -> list[Contract]:
         """Detect type-related contracts."""
         contracts = []
-        manifest = self._load_manifest()
-
-        # Look for functions that return specific types
-        return_types: dict[str, list[dict[str, Any]]] = {}
-        for record in manifest:
-            if record.get("type") == "function" and record.get("returns"):
-                ret = record["returns"]
-                if ret not in return_types:
-                    return_types[ret] = []
-                return_types[ret].append(record)
+        scan = self._scan_manifest()
 
         # Create contracts for common return types
-        for ret_type, records in return_types.items():
-            if len(records) >= 3 and ret_type not in ["None", "str", "int", "bool", "list", "dict"]:
+        for ret_type, records in scan.return_types.items():
+            if len(records) >= 3 and ret_type not in _COMMON_RETURN_TYPES:
                 contracts.append(Contract(
                     name=f"Return Type: {ret_type}",
                     rule=f"Functions return {ret_type} for specific purposes",
                     category="type",
                     examples_good=[r.get("name", "") for r in records[:5]],
-                    files_affected=list(set(r.get("file", "") for r in records)),
+                    files_affected=_unique(r.get("file", "") for r in records),
                     source=f"Detected {len(records)} functions returning {ret_type}",
                     confidence="medium"
                 ))
 
         # Generator patterns
-        generator_funcs = [r for r in manifest
-                          if r.get("type") == "function" and r.get("is_generator")]
+        generator_funcs = scan.generator_funcs
         if generator_funcs:
             contracts.append(Contract(
                 name="Generator Pattern",
                 rule="Certain functions yield values instead of returning them (streaming/lazy evaluation)",
                 category="type",
                 examples_good=[r.get("name", "") for r in generator_funcs[:5]],
-                files_affected=list(set(r.get("file", "") for r in generator_funcs)),
+                files_affected=_unique(r.get("file", "") for r in generator_funcs),
                 source=f"Detected {len(generator_funcs)} generator functions",
                 confidence="high"
             ))
 
         # Async patterns
-        async_funcs = [r for r in manifest
-                      if r.get("type") == "function" and r.get("is_async")]
+        async_funcs = scan.async_funcs
         if async_funcs:
             contracts.append(Contract(
                 name="Async Pattern",
                 rule="Async functions are used for IO-bound operations",
                 category="type",
                 examples_good=[r.get("name", "") for r in async_funcs[:5]],
-                files_affected=list(set(r.get("file", "") for r in async_funcs)),
+                files_affected=_unique(r.get("file", "") for r in async_funcs),
                 source=f"Detected {len(async_funcs)} async functions",
                 confidence="high"
             ))
@@ -276,27 +347,16 @@ class ContractDetector:
     def detect_inheritance_patterns(self) -> list[Contract]:
         """Detect inheritance and base class patterns."""
         contracts = []
-        manifest = self._load_manifest()
-
-        # Find base classes
-        base_classes: dict[str, list[dict[str, Any]]] = {}
-        for record in manifest:
-            if record.get("type") == "class":
-                bases = record.get("bases", [])
-                for base in bases:
-                    if base not in base_classes:
-                        base_classes[base] = []
-                    base_classes[base].append(record)
 
         # Create contracts for common base classes
-        for base, records in base_classes.items():
+        for base, records in self._scan_manifest().base_classes.items():
             if len(records) >= 2:
                 contracts.append(Contract(
                     name=f"Inheritance: {base}",
                     rule=f"Classes extending {base} follow its interface contract",
                     category="type",
                     examples_good=[r.get("name", "") for r in records[:5]],
-                    files_affected=list(set(r.get("file", "") for r in records)),
+                    files_affected=_unique(r.get("file", "") for r in records),
                     source=f"Detected {len(records)} classes inheriting from {base}",
                     confidence="high" if len(records) >= 3 else "medium"
                 ))
@@ -306,20 +366,9 @@ class ContractDetector:
     def detect_decorator_patterns(self) -> list[Contract]:
         """Detect decorator usage patterns."""
         contracts = []
-        manifest = self._load_manifest()
-
-        # Find decorated functions/classes
-        decorators: dict[str, list[dict[str, Any]]] = {}
-        for record in manifest:
-            if record.get("type") in ["function", "class"]:
-                record_decorators = record.get("decorators", [])
-                for dec in record_decorators:
-                    if dec not in decorators:
-                        decorators[dec] = []
-                    decorators[dec].append(record)
 
         # Create contracts for common decorators
-        for dec, records in decorators.items():
+        for dec, records in self._scan_manifest().decorators.items():
             if len(records) >= 2:
                 # Clean up decorator name for display
                 dec_name = dec.split("(")[0] if "(" in dec else dec
@@ -329,7 +378,7 @@ class ContractDetector:
                     rule=f"The @{dec_name} decorator is used consistently for specific purposes",
                     category="behavioral",
                     examples_good=[r.get("name", "") for r in records[:5]],
-                    files_affected=list(set(r.get("file", "") for r in records)),
+                    files_affected=_unique(r.get("file", "") for r in records),
                     source=f"Detected {len(records)} uses of @{dec_name}",
                     confidence="high" if len(records) >= 3 else "medium"
                 ))
@@ -1,9 +1,8 @@
 """LLM-assisted contract inference."""
 from pathlib import Path
 from typing import Optional
-from .detector import Contract
-from ..config import load_env, CONTEXT_DIR, MANIFEST_FILE
-from ..storage import read_jsonl
+from .detector import Contract, load_manifest
+from ..config import load_env, CONTEXT_DIR
 
 load_env()
 
@@ -31,7 +30,7 @@ def infer_contracts_with_llm(
 
     # Gather code samples
     code_samples = []
-    manifest = list(read_jsonl(brief_path / MANIFEST_FILE))
+    manifest = load_manifest(brief_path)
 
     # Sample some files with interesting patterns
     files = [r for r in manifest if r.get("type") == "file"][:5]
@@ -5,8 +5,9 @@ using an LLM (via BAML). If BAML is not configured, it provides placeholder
 descriptions for testing.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from ..config import load_env
 from ..models import ManifestFunctionRecord, ManifestClassRecord, ManifestFileRecord
 from .types import FunctionDescription, ClassDescription, FileDescription, ModuleDescription
@@ -15,23 +16,29 @@ from .types import FunctionDescription, ClassDescription, FileDescription, Modul
 if "BAML_LOG" not in os.environ:
     os.environ["BAML_LOG"] = "error"
 
-# Try to load BAML client
-_baml_available = False
-_baml_client = None
 
-try:
-    load_env()
-    from baml_client.sync_client import b as _baml_client
-    _baml_available = True
-except ImportError:
-    pass
-except Exception:
-    pass
+@lru_cache(maxsize=1)
+def _get_baml() -> Optional[Any]:
+    """Load the BAML client on first use.
 
+    Importing it (and loading .env) is slow, so it's deferred until a
+    description is actually generated. Returns None if BAML isn't available.
+    """
+    try:
+        load_env()
+        from baml_client.sync_client import b
+    except Exception:
+        return None
+    return b
 
+
+@lru_cache(maxsize=8)
 def _get_baml_options(base_path: Path = Path(".")) -> dict:
     """Get BAML options including the active model client.
 
+    Cached per base path, since describe runs call this for every item;
+    the returned dict is shared and must not be modified.
+
     Args:
         base_path: Base path for Brief project (to find config)
 
@@ -78,9 +85,10 @@ def describe_function(
         record.end_line or record.line + 30
     )
 
-    if _baml_available and _baml_client:
+    client = _get_baml()
+    if client:
         baml_options = _get_baml_options(base_path)
-        result = _baml_client.DescribeFunction(
+        result = client.DescribeFunction(
             function_name=record.name,
             function_code=code,
             file_context=file_context or f"Part of {record.file}",
@@ -112,9 +120,10 @@ def describe_class(
         record.end_line or record.line + 100
     )
 
-    if _baml_available and _baml_client:
+    client = _get_baml()
+    if client:
         baml_options = _get_baml_options(base_path)
-        result = _baml_client.DescribeClass(
+        result = client.DescribeClass(
             class_name=record.name,
             class_code=code,
             file_context=file_context or f"Part of {record.file}",
@@ -150,9 +159,10 @@ def describe_file(
     if len(content) > max_chars:
         content = content[:max_chars] + "\n... [truncated]"
 
-    if _baml_available and _baml_client:
+    client = _get_baml()
+    if client:
         baml_options = _get_baml_options(base_path)
-        result = _baml_client.DescribeFile(
+        result = client.DescribeFile(
             file_path=record.path,
             file_content=content,
             class_names=class_names,
@@ -180,9 +190,10 @@ def describe_module(
     base_path: Path = Path(".")
 ) -> ModuleDescription:
     """Generate description for a module."""
-    if _baml_available and _baml_client:
+    client = _get_baml()
+    if client:
         baml_options = _get_baml_options(base_path)
-        result = _baml_client.DescribeModule(
+        result = client.DescribeModule(
             module_name=module_name,
             file_summaries=file_summaries,
             class_count=class_count,
@@ -314,7 +325,8 @@ def generate_and_save_file_description(
     Returns:
         The generated description as markdown, or None if generation failed.
     """
-    from ..storage import read_jsonl, write_jsonl
+    from ..storage import read_jsonl
+    from ..analysis.manifest import write_manifest_file_records
     from ..config import MANIFEST_FILE, CONTEXT_DIR, RELATIONSHIPS_FILE
 
     # Find file record in manifest
@@ -366,7 +378,7 @@ def generate_and_save_file_description(
                 if current_hash:
                     record["description_hash"] = current_hash
                 break
-        write_jsonl(brief_path / MANIFEST_FILE, records)
+        write_manifest_file_records(brief_path, records)
 
         return full_content
     except Exception as e:
@@ -438,4 +450,4 @@ def format_module_description(desc: ModuleDescription) -> str:
 
 def is_baml_available() -> bool:
     """Check if BAML client is available."""
-    return _baml_available
+    return _get_baml() is not None
@@ -2,7 +2,7 @@
 
 from typing import Optional
 from pathlib import Path
-from .config import load_env, get_brief_path
+from .config import load_env, get_brief_path, get_config
 
 # Load environment before any BAML imports
 load_env()
@@ -75,10 +75,9 @@ def get_active_model(base: Path = Path(".")) -> str:
 
     # Check config default
     from .models import BriefConfig
-    from .storage import read_json
     config_path = brief_path / "config.json"
     if config_path.exists():
-        config = read_json(config_path)
+        config = get_config(brief_path)
         if config and "default_model" in config:
             model = config["default_model"]
             if model in MODELS:
@@ -40,8 +40,7 @@ def is_logging_enabled(base_path: Optional[Path] = None) -> bool:
     Returns:
         True if logging is enabled, False otherwise.
     """
-    from .storage import read_json
-    from .config import get_brief_path
+    from .config import get_brief_path, get_config
 
     if base_path is None:
         base_path = Path.cwd()
@@ -54,7 +53,7 @@ def is_logging_enabled(base_path: Optional[Path] = None) -> bool:
         return True
 
     try:
-        config = read_json(config_file)
+        config = get_config(brief_path)
         return config.get("command_logging", True)
     except Exception:
         return True
@@ -811,8 +811,8 @@ def get_relevant_paths(
 
 def _make_upgrade_budget(brief_path: Path) -> Optional[list[int]]:
     """Create an upgrade budget from config. Returns None if upgrades disabled."""
-    from ..storage import read_json
-    config = read_json(brief_path / "config.json")
+    from ..config import get_config
+    config = get_config(brief_path)
     limit = config.get("lazy_upgrade_limit", 3)
     if limit == 0:
         return [0]  # Disabled
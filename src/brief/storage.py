@@ -1,11 +1,19 @@
 """Storage utilities for JSONL and JSON files."""
 
 import json
+import mmap
 from pathlib import Path
-from typing import Generator, TypeVar, Type
+from typing import Callable, Generator, Iterable, Optional, TypeVar, Type
 from pydantic import BaseModel
 from datetime import datetime
 
+# orjson is optional; it decodes/encodes several times faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -19,11 +27,44 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def read_jsonl(path: Path) -> Generator[dict, None, None]:
+def _json_default(obj: object) -> str:
+    """orjson fallback serializer, matching DateTimeEncoder."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: str | bytes) -> dict:
+    """Decode a JSON document, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: object, indent: bool = False) -> str:
+    """Encode a JSON document, using orjson when available."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, cls=DateTimeEncoder)
+
+
+def read_jsonl(
+    path: Path,
+    prefilter: Optional[Callable[[str], bool]] = None
+) -> Generator[dict, None, None]:
     """Read records from a JSONL file.
 
+    Lines are decoded lazily, so a caller that stops iterating early
+    never reads or parses the rest of the file.
+
     Args:
         path: Path to the JSONL file.
+        prefilter: Optional check on the raw line; lines it rejects are
+            skipped without being decoded. It must never reject a line
+            the caller would keep, so callers still filter decoded records.
 
     Yields:
         Parsed JSON objects from each line.
@@ -34,8 +75,111 @@ def read_jsonl(path: Path) -> Generator[dict, None, None]:
     with open(path, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.strip()
-            if line:
-                yield json.loads(line)
+            if line and (prefilter is None or prefilter(line)):
+                yield _loads(line)
+
+
+def index_jsonl(path: Path, key: Callable[[dict], tuple]) -> list[list]:
+    """Scan a JSONL file once and record where each record lives.
+
+    Args:
+        path: Path to the JSONL file.
+        key: Function returning the values to index for a record.
+
+    Returns:
+        One [*key(record), offset, length] entry per record, in file order.
+    """
+    entries: list[list] = []
+    if not path.exists():
+        return entries
+
+    offset = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped:
+                entries.append([*key(_loads(stripped)), offset, len(line)])
+            offset += len(line)
+    return entries
+
+
+def read_jsonl_spans(
+    path: Path,
+    spans: Iterable[tuple[int, int]]
+) -> Generator[dict, None, None]:
+    """Decode only the records at the given byte spans of a JSONL file.
+
+    Args:
+        path: Path to the JSONL file.
+        spans: (offset, length) pairs, e.g. from index_jsonl.
+
+    Yields:
+        Parsed JSON objects for each span.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for offset, length in spans:
+            yield _loads(mm[offset:offset + length])
+
+
+def partition_jsonl(
+    path: Path,
+    prefilter: Callable[[bytes], bool],
+    predicate: Callable[[dict], bool]
+) -> tuple[list[dict], list[bytes]]:
+    """Split a JSONL file into matching records and the raw remaining lines.
+
+    Lines the prefilter rejects are kept as raw bytes without being decoded,
+    so a caller removing a few records never parses the rest of the file.
+
+    Args:
+        path: Path to the JSONL file.
+        prefilter: Check on the raw line; it must accept every line the
+            predicate would match.
+        predicate: Check on a decoded record; matching records are split out.
+
+    Returns:
+        (decoded matching records, raw lines of everything else)
+    """
+    matched: list[dict] = []
+    rest: list[bytes] = []
+    if not path.exists():
+        return matched, rest
+
+    with open(path, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if prefilter(line):
+                record = _loads(line)
+                if predicate(record):
+                    matched.append(record)
+                    continue
+            rest.append(line)
+    return matched, rest
+
+
+def encode_jsonl_record(record: dict | BaseModel) -> bytes:
+    """Serialize one record the way write_jsonl does, without the newline."""
+    if isinstance(record, BaseModel):
+        return record.model_dump_json().encode('utf-8')
+    return _dumps(record).encode('utf-8')
+
+
+def write_jsonl_lines(path: Path, lines: Iterable[bytes]) -> None:
+    """Write already-serialized JSONL lines (overwrites existing).
+
+    Args:
+        path: Path to the JSONL file.
+        lines: Encoded records without trailing newlines.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'wb') as f:
+        f.writelines(line + b'\n' for line in lines)
 
 
 def read_jsonl_typed(path: Path, model: Type[T]) -> Generator[T, None, None]:
@@ -66,7 +210,19 @@ def write_jsonl(path: Path, records: list[dict | BaseModel]) -> None:
             if isinstance(record, BaseModel):
                 f.write(record.model_dump_json() + '\n')
             else:
-                f.write(json.dumps(record, cls=DateTimeEncoder) + '\n')
+                f.write(_dumps(record) + '\n')
+
+
+def reset_jsonl(path: Path) -> None:
+    """Truncate a JSONL file to zero records (creates it if missing).
+
+    Args:
+        path: Path to the JSONL file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'wb'):
+        pass
 
 
 def append_jsonl(path: Path, record: dict | BaseModel) -> None:
@@ -82,7 +238,7 @@ def append_jsonl(path: Path, record: dict | BaseModel) -> None:
         if isinstance(record, BaseModel):
             f.write(record.model_dump_json() + '\n')
         else:
-            f.write(json.dumps(record, cls=DateTimeEncoder) + '\n')
+            f.write(_dumps(record) + '\n')
 
 
 def read_json(path: Path) -> dict:
@@ -95,7 +251,7 @@ def read_json(path: Path) -> dict:
         Parsed JSON object.
     """
     with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return _loads(f.read())
 
 
 def write_json(path: Path, data: dict) -> None:
@@ -108,7 +264,7 @@ def write_json(path: Path, data: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, cls=DateTimeEncoder)
+        f.write(_dumps(data, indent=True))
 
 
 def update_jsonl_record(
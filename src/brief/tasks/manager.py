@@ -1,12 +1,12 @@
 """Task management - Beads-style task tracking for Brief."""
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 import hashlib
 import random
 from ..models import TaskRecord, TaskStatus, TaskStep, TaskStepStatus
-from ..storage import read_jsonl, write_jsonl, append_jsonl
-from ..config import TASKS_FILE, ACTIVE_TASK_FILE
+from ..storage import read_jsonl, write_jsonl, append_jsonl, index_jsonl, read_jsonl_spans, partition_jsonl, write_jsonl_lines
+from ..config import TASKS_FILE, TASKS_INDEX_FILE, ACTIVE_TASK_FILE
 
 
 def generate_task_id() -> str:
@@ -24,26 +24,66 @@ class TaskManager:
         self.brief_path = brief_path
         self.tasks_file = brief_path / TASKS_FILE
         self.active_task_file = brief_path / ACTIVE_TASK_FILE
+        self.index_file = brief_path / TASKS_INDEX_FILE
+        self._active_id: Optional[str] = None
+        self._active_id_loaded = False
+        # (tasks.jsonl mtime_ns, size, task) for the last active-task lookup
+        self._active_task: Optional[tuple[int, int, TaskRecord]] = None
+
+    @property
+    def active_id(self) -> Optional[str]:
+        """ID of the currently active task, read once without loading any tasks."""
+        if not self._active_id_loaded:
+            try:
+                self._active_id = self.active_task_file.read_text().strip() or None
+            except FileNotFoundError:
+                self._active_id = None
+            self._active_id_loaded = True
+        return self._active_id
 
     def get_active_task(self) -> Optional[TaskRecord]:
-        """Get the currently active task."""
-        if self.active_task_file.exists():
-            task_id = self.active_task_file.read_text().strip()
-            return self.get_task(task_id)
-        return None
+        """Get the currently active task.
+
+        The result is memoized until tasks.jsonl changes, so repeated calls
+        within one command read the file once.
+        """
+        task_id = self.active_id
+        if not task_id:
+            return None
+
+        try:
+            stat = self.tasks_file.stat()
+        except FileNotFoundError:
+            return None
+
+        cached = self._active_task
+        if (
+            cached
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+            and cached[2].id == task_id
+        ):
+            return cached[2]
+
+        task = self.get_task(task_id)
+        self._active_task = (stat.st_mtime_ns, stat.st_size, task) if task else None
+        return task
 
     def set_active_task(self, task_id: str) -> bool:
         """Set the active task."""
         task = self.get_task(task_id)
         if task:
             self.active_task_file.write_text(task_id)
+            self._active_id = task_id
+            self._active_id_loaded = True
             return True
         return False
 
     def clear_active_task(self) -> None:
         """Clear the active task."""
-        if self.active_task_file.exists():
-            self.active_task_file.unlink()
+        self.active_task_file.unlink(missing_ok=True)
+        self._active_id = None
+        self._active_id_loaded = True
 
     def _load_tasks(self) -> list[TaskRecord]:
         """Load all tasks from file."""
@@ -52,32 +92,117 @@ class TaskManager:
             tasks.append(TaskRecord.model_validate(record))
         return tasks
 
-    def _save_tasks(self, tasks: list[TaskRecord]) -> None:
+    def _save_tasks(self, tasks: list[TaskRecord | dict]) -> None:
         """Save all tasks to file."""
         write_jsonl(self.tasks_file, tasks)
+        self._invalidate_index()
+
+    def split_done_lines(self) -> tuple[list[str], list[bytes]]:
+        """Split tasks.jsonl into done task IDs and the raw lines of the rest.
+
+        Only lines mentioning "done" are decoded; every other line is kept
+        as raw bytes without being parsed or validated.
+
+        Returns:
+            (IDs of done tasks, raw lines of all other tasks)
+        """
+        done = TaskStatus.DONE.value
+        marker = f'"{done}"'.encode()
+        records, kept = partition_jsonl(
+            self.tasks_file,
+            lambda line: marker in line,
+            lambda record: record.get("status") == done,
+        )
+        return [r["id"] for r in records], kept
+
+    def write_task_lines(self, lines: list[bytes]) -> None:
+        """Replace tasks.jsonl with already-serialized task lines."""
+        write_jsonl_lines(self.tasks_file, lines)
+        self._invalidate_index()
+
+    def _invalidate_index(self) -> None:
+        """Drop tasks.idx and the memoized active task after a write.
+
+        The mtime/size stamp alone can miss a same-size rewrite within one
+        filesystem timestamp tick (e.g. pending -> blocked).
+        """
+        self.index_file.unlink(missing_ok=True)
+        self._active_task = None
+
+    def _load_index(self) -> list[list]:
+        """Load the tasks.idx sidecar, rebuilding it if tasks.jsonl changed.
+
+        Each entry is [id, status, tags, offset, length]. The first line of
+        tasks.idx records the tasks file's mtime and size it was built from.
+        """
+        if not self.tasks_file.exists():
+            return []
+
+        stat = self.tasks_file.stat()
+        stamp = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+        try:
+            lines = read_jsonl(self.index_file)
+            if next(lines, None) == stamp:
+                return list(lines)
+        except ValueError:
+            pass  # Corrupt index - rebuild
+
+        entries = index_jsonl(
+            self.tasks_file,
+            lambda r: (r.get("id"), r.get("status"), r.get("tags", [])),
+        )
+        write_jsonl(self.index_file, [stamp, *entries])
+        return entries
 
     def get_task(self, task_id: str) -> Optional[TaskRecord]:
-        """Get a task by ID."""
-        for task in self._load_tasks():
-            if task.id == task_id:
-                return task
+        """Get a task by ID.
+
+        Lines that can't contain the ID are skipped without being decoded,
+        and only the matching record is validated into a TaskRecord.
+        """
+        def may_contain_id(line: str) -> bool:
+            return task_id in line
+
+        # IDs that JSON serializes verbatim can be matched on the raw line
+        verbatim = task_id.isascii() and task_id.isprintable() and not any(c in task_id for c in '"\\')
+
+        for record in read_jsonl(self.tasks_file, may_contain_id if verbatim else None):
+            if record.get("id") == task_id:
+                return TaskRecord.model_validate(record)
         return None
 
+    def iter_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        tag: Optional[str] = None
+    ) -> Iterator[TaskRecord]:
+        """Yield tasks with optional filtering, decoding them one at a time.
+
+        Filtered queries look up matching lines in tasks.idx and only
+        decode those tasks. A caller that stops early (e.g. after
+        ``islice``) never decodes the rest of the file.
+        """
+        if not status and not tag:
+            records = read_jsonl(self.tasks_file)
+        else:
+            spans = [
+                (offset, length)
+                for _, task_status, tags, offset, length in self._load_index()
+                if (not status or task_status == status.value)
+                and (not tag or tag in tags)
+            ]
+            records = read_jsonl_spans(self.tasks_file, spans)
+        for record in records:
+            yield TaskRecord.model_validate(record)
+
     def list_tasks(
         self,
         status: Optional[TaskStatus] = None,
         tag: Optional[str] = None
     ) -> list[TaskRecord]:
         """List tasks with optional filtering."""
-        tasks = self._load_tasks()
-
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-
-        if tag:
-            tasks = [t for t in tasks if tag in t.tags]
-
-        return tasks
+        return list(self.iter_tasks(status=status, tag=tag))
 
     def create_task(
         self,
@@ -106,6 +231,7 @@ class TaskManager:
                     raise ValueError(f"Dependency {dep_id} does not exist")
 
         append_jsonl(self.tasks_file, task)
+        self._invalidate_index()
         return task
 
     def update_task(self, task_id: str, **updates) -> Optional[TaskRecord]:
@@ -142,8 +268,7 @@ class TaskManager:
         )
         if task:
             # Clear active task if this was the active one
-            active = self.get_active_task()
-            if active and active.id == task_id:
+            if self.active_id == task_id:
                 self.clear_active_task()
         return task
 
@@ -175,18 +300,28 @@ class TaskManager:
 
         return self.update_task(task_id, depends=depends)
 
-    def delete_task(self, task_id: str) -> bool:
-        """Delete a task."""
-        tasks = self._load_tasks()
-        original_len = len(tasks)
+    def delete_task(self, task_id: str) -> Optional[TaskRecord]:
+        """Delete a task.
 
-        tasks = [t for t in tasks if t.id != task_id]
+        The remaining records are written back as read, so only the
+        deleted task is validated into a TaskRecord.
 
-        if len(tasks) < original_len:
-            self._save_tasks(tasks)
-            return True
+        Returns:
+            The deleted task, or None if not found
+        """
+        kept: list[dict] = []
+        deleted = None
+        for record in read_jsonl(self.tasks_file):
+            if deleted is None and record.get("id") == task_id:
+                deleted = record
+            else:
+                kept.append(record)
 
-        return False
+        if deleted is None:
+            return None
+
+        self._save_tasks(kept)
+        return TaskRecord.model_validate(deleted)
 
     def get_ready_tasks(self) -> list[TaskRecord]:
         """Get tasks that have no incomplete dependencies (ready to work on)."""
@@ -235,6 +370,30 @@ class TaskManager:
 
         return blocked
 
+    def iter_blocked(self) -> Iterator[tuple[str, str, tuple[str, ...]]]:
+        """Yield (task_id, title, blockers) for each blocked task.
+
+        Works on the raw records, so no TaskRecord is built for tasks that
+        are only listed.
+        """
+        pending = TaskStatus.PENDING.value
+        waiting = (pending, TaskStatus.BLOCKED.value)
+        rows = [
+            (r["id"], r.get("status", pending), r["title"], r.get("depends", ()))
+            for r in read_jsonl(self.tasks_file)
+        ]
+        incomplete = {
+            task_id for task_id, status, _, _ in rows
+            if status != TaskStatus.DONE.value
+        }
+
+        for task_id, status, title, depends in rows:
+            if status not in waiting:
+                continue
+            blockers = tuple(d for d in depends if d in incomplete)
+            if blockers:
+                yield task_id, title, blockers
+
     def get_task_tree(self, task_id: str) -> dict:
         """Get a task and all its dependencies as a tree."""
         task = self.get_task(task_id)
@@ -291,6 +450,8 @@ class TaskManager:
     ) -> Optional[TaskRecord]:
         """Update a step's status.
 
+        Reads the task file once and writes it once.
+
         Args:
             task_id: The task ID
             step_id: The step ID to update
@@ -300,39 +461,52 @@ class TaskManager:
         Returns:
             Updated task or None if not found
         """
-        task = self.get_task(task_id)
+        tasks = self._load_tasks()
+        task = next((t for t in tasks if t.id == task_id), None)
         if not task:
             return None
 
-        # Find and update the step
-        updated_steps = []
-        step_found = False
-        for step in task.steps:
-            if step.id == step_id:
-                step_found = True
-                step.status = status
-                if notes:
-                    step.notes = notes
-                if status == TaskStepStatus.COMPLETE:
-                    step.completed_at = datetime.now()
-            updated_steps.append(step)
-
-        if not step_found:
+        step = next((s for s in task.steps if s.id == step_id), None)
+        if not step:
             return None
 
-        # Determine current step (first non-complete step)
-        current_step_id = None
-        for step in updated_steps:
-            if step.status in (TaskStepStatus.PENDING, TaskStepStatus.IN_PROGRESS):
-                current_step_id = step.id
-                break
+        step.status = status
+        if notes:
+            step.notes = notes
+        if status == TaskStepStatus.COMPLETE:
+            step.completed_at = datetime.now()
 
-        return self.update_task(
-            task_id,
-            steps=updated_steps,
-            current_step_id=current_step_id
+        # Determine current step (first non-complete step)
+        task.current_step_id = next(
+            (s.id for s in task.steps
+             if s.status in (TaskStepStatus.PENDING, TaskStepStatus.IN_PROGRESS)),
+            None
         )
 
+        self._save_tasks(tasks)
+        return task
+
+    def complete_step_and_summarize(
+        self,
+        task_id: str,
+        step_id: str,
+        notes: Optional[str] = None
+    ) -> Optional[tuple[TaskRecord, dict]]:
+        """Mark a step complete and summarize progress from the same load.
+
+        Args:
+            task_id: The task ID
+            step_id: The step ID to complete
+            notes: Optional notes for the step
+
+        Returns:
+            (updated task, step summary) or None if the task or step is not found
+        """
+        task = self.update_step(task_id, step_id, TaskStepStatus.COMPLETE, notes)
+        if not task:
+            return None
+        return task, self.summarize_steps(task)
+
     def get_step_summary(self, task_id: str) -> Optional[dict]:
         """Get a summary of task step progress.
 
@@ -345,28 +519,38 @@ class TaskManager:
         task = self.get_task(task_id)
         if not task or not task.steps:
             return None
+        return self.summarize_steps(task)
 
-        total = len(task.steps)
-        completed = sum(1 for s in task.steps if s.status == TaskStepStatus.COMPLETE)
-        in_progress = sum(1 for s in task.steps if s.status == TaskStepStatus.IN_PROGRESS)
-        pending = sum(1 for s in task.steps if s.status == TaskStepStatus.PENDING)
-        skipped = sum(1 for s in task.steps if s.status == TaskStepStatus.SKIPPED)
+    @staticmethod
+    def summarize_steps(task: TaskRecord) -> dict:
+        """Summarize step progress for an already-loaded task.
+
+        Walks ``task.steps`` once, so callers holding the task avoid both a
+        second task-file read and the per-status passes.
 
+        Args:
+            task: The task whose steps to summarize
+
+        Returns:
+            Dict with step summary (same keys as get_step_summary)
+        """
+        counts = dict.fromkeys(TaskStepStatus, 0)
         current_step = None
         current_step_name = None
-        if task.current_step_id:
-            for step in task.steps:
-                if step.id == task.current_step_id:
-                    current_step = step.id
-                    current_step_name = step.name
-                    break
+        for step in task.steps:
+            counts[step.status] += 1
+            if step.id == task.current_step_id and current_step is None:
+                current_step = step.id
+                current_step_name = step.name
 
+        total = len(task.steps)
+        completed = counts[TaskStepStatus.COMPLETE]
         return {
             "total_steps": total,
             "completed": completed,
-            "in_progress": in_progress,
-            "pending": pending,
-            "skipped": skipped,
+            "in_progress": counts[TaskStepStatus.IN_PROGRESS],
+            "pending": counts[TaskStepStatus.PENDING],
+            "skipped": counts[TaskStepStatus.SKIPPED],
             "progress_percent": (completed / total * 100) if total > 0 else 0,
             "current_step": current_step,
             "current_step_name": current_step_name,
@@ -4,7 +4,8 @@ from dataclasses import dataclass, field
 from typing import Optional, Any
 from datetime import datetime
 from ..storage import read_jsonl, write_jsonl, append_jsonl
-from ..config import MANIFEST_FILE, RELATIONSHIPS_FILE, CONTEXT_DIR
+from ..config import RELATIONSHIPS_FILE, CONTEXT_DIR
+from ..analysis.manifest import read_manifest
 from ..models import TraceDefinition
 
 
@@ -159,11 +160,16 @@ class PathTracer:
         self.base_path = base_path
         self._manifest: Optional[list[dict[str, Any]]] = None
         self._relationships: Optional[list[dict[str, Any]]] = None
+        self._entry_points: Optional[set[str]] = None
 
     def _load_manifest(self) -> list[dict[str, Any]]:
-        """Load manifest lazily."""
+        """Load the manifest's function records lazily.
+
+        Tracing only ever looks at functions, so this reads the function
+        shard (or just the function lines of manifest.jsonl).
+        """
         if self._manifest is None:
-            self._manifest = list(read_jsonl(self.brief_path / MANIFEST_FILE))
+            self._manifest = list(read_manifest(self.brief_path, "function"))
         return self._manifest
 
     def _load_relationships(self) -> list[dict[str, Any]]:
@@ -483,8 +489,29 @@ class PathTracer:
 
         return False
 
+    def get_existing_entry_points(self) -> set[str]:
+        """Names that resolve exactly to a function in the manifest.
+
+        Holds both bare names and "Class.method" names, built in one pass so
+        callers checking many definitions can test membership instead of
+        rescanning the manifest for each.
+        """
+        if self._entry_points is None:
+            names: set[str] = set()
+            for record in self._load_manifest():
+                if record["type"] == "function":
+                    names.add(record["name"])
+                    class_name = record.get("class_name")
+                    if class_name:
+                        names.add(f"{class_name}.{record['name']}")
+            self._entry_points = names
+        return self._entry_points
+
     def check_entry_point_exists(self, entry_point: str) -> bool:
         """Check if an entry point function still exists in the codebase."""
+        if entry_point in self.get_existing_entry_points():
+            return True
+        # Fall back to find_function for its partial-name matching
         return self.find_function(entry_point) is not None
 
     def generate_trace_from_definition(
@@ -3,7 +3,7 @@ import pytest
 from pathlib import Path
 import tempfile
 from brief.analysis.parser import PythonFileParser, compute_file_hash
-from brief.analysis.manifest import ManifestBuilder
+from brief.analysis.manifest import ManifestBuilder, read_manifest, find_manifest_records
 from brief.analysis.relationships import RelationshipExtractor
 
 SAMPLE_CODE = '''
@@ -169,11 +169,42 @@ class TestManifestBuilder:
         assert should_exclude(Path("foo.pyc"), ["*.pyc"]) is True
         assert should_exclude(Path("src/foo.pyc"), ["*.pyc"]) is True
 
+        # Glob patterns match whole components
+        assert should_exclude(Path("pkg.egg-info/PKG-INFO"), ["*.egg-info"]) is True
+        assert should_exclude(Path("src/egg-info.py"), ["*.egg-info"]) is False
+
         # Dot-prefixed dirs still work
         assert should_exclude(Path(".git/config"), [".*"]) is True
         assert should_exclude(Path("src/.hidden/file.py"), [".*"]) is True
         assert should_exclude(Path("src/visible/file.py"), [".*"]) is False
 
+    def test_matches_pattern_combined_globs(self):
+        """Test that doc globs match the relative path or the file name."""
+        from brief.analysis.manifest import matches_pattern
+
+        base = Path("/repo")
+        patterns = ["docs/*.md", "README*", "*_STATUS.md"]
+        assert matches_pattern(base / "docs" / "guide.md", patterns, base) is True
+        assert matches_pattern(base / "sub" / "README.md", patterns, base) is True
+        assert matches_pattern(base / "notes" / "WEEK_STATUS.md", patterns, base) is True
+        assert matches_pattern(base / "notes" / "guide.md", patterns, base) is False
+        assert matches_pattern(base / "docs" / "guide.md", [], base) is False
+
+    def test_date_globs_collapse_to_one_alternative(self):
+        """Test the combined date regex agrees with fnmatch on the date globs."""
+        import fnmatch
+        from brief.analysis.manifest import matches_pattern
+        from brief.config import DATE_DOC_EXCLUDE
+
+        base = Path("/repo")
+        names = [
+            "2024-01-15-notes.md", "log_2024_01_15.md", "v2024.01.15.md",
+            "20240115.md", "2024-01_15.md", "2024011.md", "guide.md",
+        ]
+        for name in names:
+            expected = any(fnmatch.fnmatch(name, p) for p in DATE_DOC_EXCLUDE)
+            assert matches_pattern(base / name, list(DATE_DOC_EXCLUDE), base) is expected
+
     def test_manifest_builder_saves_manifest(self) -> None:
         """Test manifest builder saves to JSONL."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -189,6 +220,182 @@ class TestManifestBuilder:
             manifest_file = brief_path / "manifest.jsonl"
             assert manifest_file.exists()
 
+    def test_manifest_builder_saves_type_shards(self) -> None:
+        """Test per-type shards are written and used for type queries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            (base_path / "test.py").write_text(SAMPLE_CODE)
+            brief_path = base_path / ".brief"
+            brief_path.mkdir()
+
+            builder = ManifestBuilder(base_path)
+            builder.analyze_directory()
+            builder.save_manifest(brief_path)
+
+            assert (brief_path / "manifest.class.jsonl").exists()
+            classes = list(read_manifest(brief_path, "class"))
+            assert [c["name"] for c in classes] == ["MyClass"]
+            assert all(r["type"] == "function" for r in read_manifest(brief_path, "function"))
+
+    def test_read_manifest_ignores_stale_shard(self) -> None:
+        """Test a shard older than manifest.jsonl falls back to the manifest."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            (brief_path / "manifest.class.jsonl").write_text(
+                '{"type": "class", "name": "Old", "file": "a.py", "line": 1}\n'
+            )
+            manifest = brief_path / "manifest.jsonl"
+            manifest.write_text(
+                '{"type": "class", "name": "New", "file": "a.py", "line": 1}\n'
+                '{"type": "file", "path": "a.py", "module": "a"}\n'
+            )
+            os.utime(brief_path / "manifest.class.jsonl", ns=(0, 0))
+
+            classes = list(read_manifest(brief_path, "class"))
+            assert [c["name"] for c in classes] == ["New"]
+
+    def test_read_manifest_type_prefilter_handles_compact_json(self) -> None:
+        """Test the type pre-filter matches both JSON separator styles."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            (brief_path / "manifest.jsonl").write_text(
+                '{"type":"class","name":"Compact","file":"a.py","line":1}\n'
+                '{"type": "class", "name": "Spaced", "file": "a.py", "line": 2}\n'
+                '{"type": "function", "name": "f", "file": "a.py", "line": 3}\n'
+            )
+
+            classes = list(read_manifest(brief_path, "class"))
+            assert [c["name"] for c in classes] == ["Compact", "Spaced"]
+
+    def test_context_ref_update_refreshes_file_shard(self) -> None:
+        """Test a description update rewrites only the file shard and drops the index."""
+        from brief.analysis.manifest import write_manifest
+        from brief.commands.describe import update_manifest_context_ref
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            write_manifest(brief_path, [
+                {"type": "file", "path": "a.py", "module": "a"},
+                {"type": "class", "name": "A", "file": "a.py", "line": 1},
+            ])
+            class_shard = brief_path / "manifest.class.jsonl"
+            class_bytes = class_shard.read_bytes()
+
+            update_manifest_context_ref(brief_path, "a.py", "context/files/a.py.md", "abc")
+
+            files = list(read_manifest(brief_path, "file"))
+            assert files[0]["context_ref"] == "context/files/a.py.md"
+            shard = (brief_path / "manifest.file.jsonl").read_text()
+            assert "context/files/a.py.md" in shard
+            assert class_shard.read_bytes() == class_bytes
+            manifest_mtime = (brief_path / "manifest.jsonl").stat().st_mtime_ns
+            assert class_shard.stat().st_mtime_ns >= manifest_mtime
+            assert not (brief_path / "manifest.idx").exists()
+
+
+class TestManifestIndex:
+    """Tests for the manifest.idx sidecar."""
+
+    def test_find_records_by_type_and_path(self) -> None:
+        """Test index lookups return only matching records."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            (brief_path / "manifest.jsonl").write_text(
+                '{"type": "file", "path": "src/a.py", "module": "src.a"}\n'
+                '{"type": "class", "name": "A", "file": "src/a.py", "line": 1}\n'
+                '{"type": "class", "name": "B", "file": "lib/b.py", "line": 1}\n'
+            )
+
+            found = list(find_manifest_records(brief_path, "class", "src/"))
+            assert [r["name"] for r in found] == ["A"]
+            assert (brief_path / "manifest.idx").exists()
+
+            found = list(find_manifest_records(brief_path, path_contains="a.py"))
+            assert [r["type"] for r in found] == ["file", "class"]
+
+    def test_write_manifest_builds_current_index(self) -> None:
+        """Test writing the manifest leaves an index that lookups can use as-is."""
+        from brief.analysis.manifest import load_manifest_index, write_manifest
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            write_manifest(brief_path, [{"type": "file", "path": "a.py", "module": "a"}])
+            index = brief_path / "manifest.idx"
+            before = index.read_bytes()
+
+            assert [e[:2] for e in load_manifest_index(brief_path)] == [["file", "a.py"]]
+            assert index.read_bytes() == before
+
+    def test_write_manifest_index_matches_file_offsets(self) -> None:
+        """Test the index written alongside model records matches a fresh scan."""
+        from brief.analysis.manifest import write_manifest
+        from brief.storage import index_jsonl, read_jsonl
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            (base_path / "test.py").write_text(SAMPLE_CODE)
+            brief_path = base_path / ".brief"
+            builder = ManifestBuilder(base_path)
+            builder.analyze_directory()
+
+            write_manifest(brief_path, builder.records)
+
+            written = list(read_jsonl(brief_path / "manifest.idx"))[1:]
+            scanned = index_jsonl(
+                brief_path / "manifest.jsonl",
+                lambda r: (r.get("type"), r.get("path") or r.get("file", "")),
+            )
+            assert written == scanned
+
+    def test_index_rebuilt_when_manifest_changes(self) -> None:
+        """Test a stale index is rebuilt rather than used."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            manifest = brief_path / "manifest.jsonl"
+            manifest.write_text('{"type": "file", "path": "old.py", "module": "old"}\n')
+            assert len(list(find_manifest_records(brief_path, path_contains=".py"))) == 1
+
+            manifest.write_text(
+                '{"type": "file", "path": "new_one.py", "module": "new_one"}\n'
+                '{"type": "file", "path": "new_two.py", "module": "new_two"}\n'
+            )
+            found = list(find_manifest_records(brief_path, path_contains="new"))
+            assert [r["path"] for r in found] == ["new_one.py", "new_two.py"]
+
+
+class TestParallelAnalysis:
+    """Tests for parallel per-file analysis."""
+
+    def test_parallel_matches_sequential(self, monkeypatch) -> None:
+        """Test worker-process analysis gives the same records in the same order."""
+        from brief.analysis import parallel
+
+        # Make sure the worker path runs even on a single-core machine
+        monkeypatch.setattr(parallel.os, "cpu_count", lambda: 2)
+
+        def dump(results):
+            return [[r.model_dump(exclude={"analyzed_at"}) for r in rs] for rs in results]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            for i in range(parallel.PARALLEL_MIN_FILES + 4):
+                (base_path / f"mod_{i}.py").write_text(
+                    f"from mod_0 import helper_0\n\ndef helper_{i}():\n    return helper_0()\n"
+                )
+            files = sorted(base_path.glob("*.py"))
+
+            builder = ManifestBuilder(base_path)
+            sequential = parallel.map_files(builder.analyze_python_file, files, min_files=len(files) + 1)
+            in_workers = parallel.map_files(builder.analyze_python_file, files, min_files=1)
+            assert dump(in_workers) == dump(sequential)
+
+            extractor = RelationshipExtractor(base_path)
+            sequential = parallel.map_files(extractor.extract_from_file, files, min_files=len(files) + 1)
+            in_workers = parallel.map_files(extractor.extract_from_file, files, min_files=1)
+            assert dump(in_workers) == dump(sequential)
+
 
 class TestRelationshipExtractor:
     """Tests for the relationship extractor."""
@@ -207,6 +414,20 @@ class TestRelationshipExtractor:
             assert relationships[0].from_file == "module_a.py"
             assert relationships[0].to_file == "module_b.py"
 
+    def test_extractor_uses_component_excludes(self) -> None:
+        """Test extractor excludes like the manifest does (no substring matches)."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            (base_path / ".venv").mkdir()
+            (base_path / ".venv" / "dep.py").write_text("def run():\n    helper()\n")
+            (base_path / "rebuild.py").write_text("def run():\n    helper()\n")
+
+            extractor = RelationshipExtractor(base_path, [".*", "build"])
+            extractor.extract_all()
+
+            files = {r.file for r in extractor.relationships if r.type == "calls"}
+            assert files == {"rebuild.py"}
+
     def test_extractor_ignores_external_imports(self) -> None:
         """Test extractor ignores stdlib and third-party imports."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -715,3 +936,104 @@ class TestFileHash:
             hash2 = compute_file_hash(file_path)
 
             assert hash1 == hash2
+
+
+class TestConfigLoading:
+    """Tests for cached config and exclude pattern loading."""
+
+    def test_get_config_returns_independent_copies(self) -> None:
+        """Test mutating a returned config doesn't leak into the cache."""
+        from brief.config import get_config
+        from brief.storage import write_json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            write_json(brief_path / "config.json", {"exclude_patterns": ["a"]})
+
+            config = get_config(brief_path)
+            config["exclude_patterns"].append("b")
+
+            assert get_config(brief_path) == {"exclude_patterns": ["a"]}
+
+    def test_get_config_sees_rewritten_file(self) -> None:
+        """Test the cache is invalidated when config.json changes."""
+        from brief.config import get_config
+        from brief.storage import write_json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            write_json(brief_path / "config.json", {"enable_tasks": False})
+            assert get_config(brief_path)["enable_tasks"] is False
+
+            write_json(brief_path / "config.json", {"enable_tasks": True, "x": 1})
+            assert get_config(brief_path)["enable_tasks"] is True
+
+    def test_load_exclude_patterns_reads_gitignore(self) -> None:
+        """Test gitignore patterns are merged without duplicates."""
+        from brief.config import load_exclude_patterns
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            (base_path / ".gitignore").write_text("# comment\nbuild/\n!keep\nout\n")
+            config = {"exclude_patterns": ["build"], "use_gitignore": True}
+
+            assert load_exclude_patterns(base_path, config) == ["build", "out"]
+
+    def test_classify_extension(self) -> None:
+        """Test suffixes are classified case-insensitively in one lookup."""
+        from brief.config import classify_extension
+
+        assert classify_extension(".py") == "python"
+        assert classify_extension(".MD") == "markdown"
+        assert classify_extension(".Json") == "other"
+        assert classify_extension(".exe") is None
+        assert classify_extension("") is None
+
+    def test_find_brief_root_walks_up(self) -> None:
+        """Test the nearest ancestor holding .brief is returned."""
+        from brief.config import find_brief_root
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            (root / ".brief").mkdir()
+            nested = root / "a" / "b"
+            nested.mkdir(parents=True)
+
+            assert find_brief_root(nested) == root
+            assert find_brief_root(root) == root
+
+    def test_load_env_probes_once_per_directory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test .env is loaded once and later calls reuse the cached result."""
+        import os
+        from brief.config import load_env, reset_env_cache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("BRIEF_TEST_ENV=1\n")
+            monkeypatch.chdir(tmpdir)
+            monkeypatch.delenv("BRIEF_TEST_ENV", raising=False)
+            reset_env_cache()
+
+            assert load_env() is True
+            assert os.environ["BRIEF_TEST_ENV"] == "1"
+
+            (Path(tmpdir) / ".env").unlink()
+            assert load_env() is True
+            reset_env_cache()
+            assert load_env() is False
+            monkeypatch.delenv("BRIEF_TEST_ENV", raising=False)
+
+    def test_brief_dir_exists_caches_positive_results(self) -> None:
+        """Test a found .brief is remembered but a missing one is rechecked."""
+        from brief.config import brief_dir_exists, clear_brief_dir_cache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_dir = Path(tmpdir) / ".brief"
+            assert brief_dir_exists(brief_dir) is False
+
+            brief_dir.mkdir()
+            assert brief_dir_exists(brief_dir) is True
+
+            brief_dir.rmdir()
+            assert brief_dir_exists(brief_dir) is True
+            clear_brief_dir_cache()
+            assert brief_dir_exists(brief_dir) is False
@@ -1,5 +1,6 @@
 """Tests for Brief CLI."""
 
+import json
 import pytest
 from pathlib import Path
 import tempfile
@@ -31,6 +32,20 @@ class TestInitCommand:
             assert (brief_path / CONTEXT_DIR / "paths").exists()
             assert (brief_path / "config.json").exists()
 
+    def test_init_gitignore_entries_added_once(self) -> None:
+        """Test that init creates .gitignore and only appends missing entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            gitignore = Path(tmpdir) / ".gitignore"
+
+            runner.invoke(app, ["init", tmpdir])
+            assert gitignore.read_text() == (
+                "# Brief context data (local, not committed)\n.brief/\n.brief-logs/\n"
+            )
+
+            gitignore.write_text(".brief/\nnode_modules")
+            runner.invoke(app, ["init", tmpdir, "--force"])
+            assert gitignore.read_text() == ".brief/\nnode_modules\n.brief-logs/\n"
+
     def test_init_fails_if_already_exists(self) -> None:
         """Test that init fails if .brief already exists."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -73,6 +88,14 @@ class TestCLIHelp:
         assert result.exit_code == 0
         assert "Context infrastructure" in result.stdout
 
+    def test_unknown_command_suggests_lazy_command(self) -> None:
+        """Test that a mistyped command suggests one that has not been loaded yet."""
+        result = runner.invoke(app, ["tsk"])
+
+        assert result.exit_code == 2
+        assert "No such command 'tsk'" in result.output
+        assert "Did you mean 'task'?" in result.output
+
     def test_init_help(self) -> None:
         """Test that init help displays."""
         result = runner.invoke(app, ["init", "--help"])
@@ -87,6 +110,106 @@ class TestCLIHelp:
         assert result.exit_code == 0
         assert "Clear Brief analysis cache" in result.stdout
 
+    def test_subcommand_imports_only_its_module(self) -> None:
+        """Test that invoking one command group doesn't import the others."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from brief.cli import app\n"
+            "try:\n"
+            "    app(['memory', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('brief.commands.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "['brief.commands._common', 'brief.commands.memory']"
+
+    def test_init_skips_setup_import(self) -> None:
+        """Test that init help doesn't import the setup command module."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from brief.cli import app\n"
+            "try:\n"
+            "    app(['init', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('brief.commands.setup' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+    def test_task_help_skips_task_manager_import(self) -> None:
+        """Test that task help doesn't import the task manager or storage."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from brief.cli import app\n"
+            "try:\n"
+            "    app(['task', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('brief.tasks.manager' in sys.modules or 'brief.storage' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+    def test_trace_help_skips_tracer_and_storage_import(self) -> None:
+        """Test that trace help doesn't import the tracer or storage."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from brief.cli import app\n"
+            "try:\n"
+            "    app(['trace', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('brief.tracing.tracer' in sys.modules or 'brief.storage' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+    def test_group_builds_only_invoked_subcommand(self) -> None:
+        """Test a lazy group converts just the subcommand that is looked up."""
+        from brief.cli import _load_command
+
+        group = _load_command("trace")
+        assert "show" not in group.commands
+
+        assert group.get_command(None, "show").name == "show"
+        assert "show" in group.commands
+        assert "list" not in group.commands
+        assert group.list_commands(None)[:2] == ["list", "show"]
+
+    def test_main_help_lists_lazy_commands(self) -> None:
+        """Test that main help still lists lazily registered commands."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "inventory" in result.stdout
+        assert "memory" in result.stdout
+
 
 class TestResetCommand:
     """Tests for the reset command."""
@@ -124,6 +247,39 @@ class TestResetCommand:
             assert desc_file.exists()
             assert desc_file.read_text() == "# Test description"
 
+    def test_reset_deletes_manifest_shards(self) -> None:
+        """Test that reset deletes the per-type manifest shards."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.py").write_text("class A:\n    pass\n")
+            runner.invoke(app, ["init", tmpdir])
+            runner.invoke(app, ["analyze", "all", "-b", tmpdir])
+            brief_path = Path(tmpdir) / BRIEF_DIR
+            shard = brief_path / "manifest.class.jsonl"
+            assert shard.exists()
+
+            result = runner.invoke(app, ["reset", "-b", tmpdir])
+
+            assert result.exit_code == 0
+            assert "Deleted manifest.class.jsonl (manifest shard)" in result.stdout
+            assert not shard.exists()
+            assert list(brief_path.glob("manifest.*.jsonl")) == []
+
+    def test_reset_deletes_index_sidecars(self) -> None:
+        """Test that reset deletes manifest.idx and tasks.idx."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+            brief_path = Path(tmpdir) / BRIEF_DIR
+            for name in ("manifest.idx", "tasks.idx"):
+                (brief_path / name).write_text('{"mtime_ns": 0, "size": 0}\n')
+
+            result = runner.invoke(app, ["reset", "-b", tmpdir])
+
+            assert result.exit_code == 0
+            assert "Deleted manifest.idx (manifest index)" in result.stdout
+            assert "Deleted tasks.idx (task index)" in result.stdout
+            assert not (brief_path / "manifest.idx").exists()
+            assert not (brief_path / "tasks.idx").exists()
+
     def test_reset_full_clears_llm_content(self) -> None:
         """Test that reset --full clears LLM content with confirmation."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -145,6 +301,36 @@ class TestResetCommand:
             # Description should be deleted
             assert not desc_file.exists()
 
+    def test_reset_preview_shows_record_counts(self) -> None:
+        """Test that the reset preview shows how many records JSONL files hold."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+            manifest = Path(tmpdir) / BRIEF_DIR / MANIFEST_FILE
+            manifest.write_text('{"type": "file"}\n{"type": "file"}\n{"type": "doc"}')
+
+            result = runner.invoke(app, ["reset", "-b", tmpdir, "--dry-run"])
+
+            assert "manifest.jsonl (code structure) (3 records)" in result.stdout
+            assert "relationships.jsonl (dependencies) (0 records)" in result.stdout
+
+    def test_reset_full_keeps_directories(self) -> None:
+        """Test that reset --full empties context dirs but keeps them and their subdirs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+            files_dir = Path(tmpdir) / BRIEF_DIR / CONTEXT_DIR / "files"
+            for i in range(3):
+                (files_dir / f"f{i}.md").write_text("x")
+            (files_dir / "nested").mkdir()
+
+            preview = runner.invoke(app, ["reset", "-b", tmpdir, "--full", "--dry-run"])
+            assert "(4 files)" in preview.stdout
+
+            result = runner.invoke(app, ["reset", "-b", tmpdir, "--full", "-y"])
+
+            assert result.exit_code == 0
+            assert files_dir.is_dir()
+            assert [p.name for p in files_dir.iterdir()] == ["nested"]
+
     def test_reset_fails_without_brief(self) -> None:
         """Test that reset fails if Brief not initialized."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -152,3 +338,568 @@ class TestResetCommand:
 
             assert result.exit_code == 1
             assert "not initialized" in result.output
+
+
+class TestInventoryCommand:
+    """Tests for the inventory command."""
+
+    def test_inventory_stops_reading_at_limit(self) -> None:
+        """Test that inventory streams the manifest and stops at --limit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+            manifest = Path(tmpdir) / BRIEF_DIR / MANIFEST_FILE
+            # The malformed tail would fail to decode if it were ever read
+            manifest.write_text(
+                '{"type": "file", "path": "a.py", "module": "a"}\n'
+                '{"type": "file", "path": "b.py", "module": "b"}\n'
+                "not json\n"
+            )
+
+            result = runner.invoke(app, ["inventory", "-b", tmpdir, "--limit", "2"])
+
+            assert result.exit_code == 0
+            assert "a.py" in result.stdout
+            assert "b.py" in result.stdout
+
+    def test_inventory_formats_each_record_type(self) -> None:
+        """Test inventory output for file, doc, class, and method records."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+            manifest = Path(tmpdir) / BRIEF_DIR / MANIFEST_FILE
+            manifest.write_text(
+                '{"type": "file", "path": "a.py", "module": "a"}\n'
+                '{"type": "file", "path": "b.js", "module": "b", "parsed": false}\n'
+                '{"type": "doc", "path": "README.md", "title": "Readme"}\n'
+                '{"type": "class", "name": "A", "file": "a.py", "line": 3}\n'
+                '{"type": "function", "name": "run", "file": "a.py", "line": 5, "class_name": "A"}\n'
+            )
+
+            result = runner.invoke(app, ["inventory", "-b", tmpdir])
+
+            assert result.exit_code == 0
+            assert "[FILE] a.py" in result.stdout
+            assert "[OTHER] b.js" in result.stdout
+            assert "[DOC] README.md\n      Title: Readme" in result.stdout
+            assert "[CLASS] A in a.py:3" in result.stdout
+            assert "[FUNC] A.run in a.py:5" in result.stdout
+
+
+class TestSetupCommand:
+    """Tests for the setup command."""
+
+    def test_setup_default_updates_existing_project_files(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that setup -d finds existing .gitignore and CLAUDE.md and appends to them."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / ".gitignore").write_text("*.pyc\n")
+            (base / "CLAUDE.md").write_text("# My project\n")
+
+            result = runner.invoke(app, ["setup", tmpdir, "-d"])
+
+            assert result.exit_code == 0
+            assert (base / ".gitignore").read_text() == "*.pyc\n\n.brief/\n.brief-logs/\n"
+            claude_md = (base / "CLAUDE.md").read_text()
+            assert claude_md.startswith("# My project\n")
+            assert "## Context Management (Brief)" in claude_md
+            for sub in ("modules", "files", "paths"):
+                assert (base / BRIEF_DIR / CONTEXT_DIR / sub).is_dir()
+
+    def test_setup_tasks_appends_only_missing_claude_md_section(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that setup --tasks adds the task section without repeating the Brief section."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            from brief.commands.setup import CLAUDE_MD_BRIEF_SECTION, CLAUDE_MD_TASKS_SECTION
+
+            claude_md = Path(tmpdir) / "CLAUDE.md"
+            claude_md.write_text(f"# CLAUDE.md\n{CLAUDE_MD_BRIEF_SECTION}")
+
+            result = runner.invoke(app, ["setup", tmpdir, "-d", "--tasks"])
+
+            assert result.exit_code == 0
+            assert "already has Brief section" in result.stdout
+            assert claude_md.read_text() == f"# CLAUDE.md\n{CLAUDE_MD_BRIEF_SECTION}{CLAUDE_MD_TASKS_SECTION}"
+
+    def test_setup_hooks_are_executable_and_not_rewritten(self) -> None:
+        """Test that hook scripts are created executable and left alone when unchanged."""
+        import os
+        from brief.commands.setup import _install_hooks
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brief_path = Path(tmpdir)
+            assert _install_hooks(brief_path) == 4
+            script = brief_path / "hooks" / "session-start.sh"
+            assert os.access(script, os.X_OK)
+            assert script.read_text().startswith("#!/bin/bash")
+
+            os.utime(script, ns=(0, 0))
+            assert _install_hooks(brief_path) == 4
+            assert script.stat().st_mtime_ns == 0
+
+    def test_setup_declined_reconfigure_exits_early(self) -> None:
+        """Test that declining to reconfigure an initialized project cancels setup."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+
+            result = runner.invoke(app, ["setup", tmpdir], input="n\n")
+
+            assert result.exit_code == 0
+            assert "already initialized" in result.stdout
+            assert "Setup cancelled." in result.stdout
+            assert result.stdout.index("Brief Setup") < result.stdout.index("already initialized")
+
+    def test_setup_settings_merge_keeps_user_hooks(self) -> None:
+        """Test that Brief hooks are merged into settings.json once, keeping user hooks."""
+        import io
+        import json
+        from rich.console import Console
+        from brief.commands.setup import _configure_claude_settings
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            settings_path = base / ".claude" / "settings.json"
+            settings_path.parent.mkdir()
+            user_hook = {"matcher": "", "hooks": [{"type": "command", "command": "echo hi"}]}
+            settings_path.write_text(json.dumps({"hooks": {"PreCompact": [user_hook]}}))
+            console = Console(file=io.StringIO())
+
+            _configure_claude_settings(base, console)
+            first = settings_path.read_text()
+            _configure_claude_settings(base, console)
+
+            assert settings_path.read_text() == first
+            settings = json.loads(first)
+            assert settings["hooks"]["PreCompact"][0] == user_hook
+            assert len(settings["hooks"]["PreCompact"]) == 2
+            assert "already configured" in console.file.getvalue()
+
+    def test_setup_descriptions_include_relationships(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that lite descriptions see relationships even when extraction is slow."""
+        import time
+        from brief.analysis.relationships import RelationshipExtractor
+
+        extract_all = RelationshipExtractor.extract_all
+
+        def slow_extract_all(self):
+            time.sleep(0.2)
+            return extract_all(self)
+
+        monkeypatch.setattr(RelationshipExtractor, "extract_all", slow_extract_all)
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "helpers.py").write_text("def helper():\n    return 1\n")
+            (base / "main.py").write_text("from helpers import helper\n\ndef run():\n    helper()\n")
+
+            result = runner.invoke(app, ["setup", tmpdir, "-d"])
+
+            assert result.exit_code == 0
+            assert "Generated lite descriptions for 2 files" in result.stdout
+            files_dir = base / BRIEF_DIR / CONTEXT_DIR / "files"
+            assert "Used by: main.py" in (files_dir / "helpers.py.md").read_text()
+            assert "Imports from: helpers.py" in (files_dir / "main.py.md").read_text()
+
+    def test_setup_pre_tool_use_hook_filters_paths(self) -> None:
+        """Test that the PreToolUse hook only emits a tip for project code files."""
+        import json
+        import subprocess
+        import sys
+        from brief.commands.setup import _install_hooks
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _install_hooks(Path(tmpdir))
+            script = Path(tmpdir) / "hooks" / "pre-tool-use.py"
+
+            def run_hook(file_path: str) -> str:
+                payload = json.dumps({"tool_input": {"file_path": file_path}})
+                return subprocess.run(
+                    [sys.executable, str(script)], input=payload, capture_output=True, text=True
+                ).stdout
+
+            output = json.loads(run_hook("/repo/src/app.py"))
+            assert "how app.py works" in output["hookSpecificOutput"]["additionalContext"]
+            assert run_hook("/repo/.venv/lib/site.py") == ""
+            assert run_hook("/repo/pyproject.toml") == ""
+            assert run_hook("/repo/README.md") == ""
+
+    def test_setup_migrates_legacy_pre_tool_use_hook(self) -> None:
+        """Test that settings pointing at the old shell PreToolUse hook are updated."""
+        import io
+        import json
+        from rich.console import Console
+        from brief.commands.setup import _configure_claude_settings, _install_hooks
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            brief_path = base / BRIEF_DIR
+            (brief_path / "hooks").mkdir(parents=True)
+            (brief_path / "hooks" / "pre-tool-use.sh").write_text("#!/bin/bash\n")
+            settings_path = base / ".claude" / "settings.json"
+            settings_path.parent.mkdir()
+            legacy = "$CLAUDE_PROJECT_DIR/.brief/hooks/pre-tool-use.sh"
+            settings_path.write_text(json.dumps({"hooks": {"PreToolUse": [
+                {"matcher": "Read|Grep|Glob", "hooks": [{"type": "command", "command": legacy}]}
+            ]}}))
+
+            _install_hooks(brief_path)
+            _configure_claude_settings(base, Console(file=io.StringIO()))
+
+            assert not (brief_path / "hooks" / "pre-tool-use.sh").exists()
+            hooks = json.loads(settings_path.read_text())["hooks"]["PreToolUse"]
+            assert hooks[0]["hooks"][0]["command"] == "$CLAUDE_PROJECT_DIR/.brief/hooks/pre-tool-use.py"
+
+    def test_setup_dotenv_loaded_when_a_key_is_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that .env fills in keys the environment lacks, and is skipped once all are set."""
+        import os
+        pytest.importorskip("dotenv")
+        for key in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "BRIEF_TEST_DOTENV"):
+            # setenv first so monkeypatch restores the original state afterwards
+            monkeypatch.setenv(key, "")
+            monkeypatch.delenv(key)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("GOOGLE_API_KEY=from-dotenv\nBRIEF_TEST_DOTENV=1\n")
+            monkeypatch.setenv("ANTHROPIC_API_KEY", "from-env")
+
+            result = runner.invoke(app, ["setup", tmpdir, "-d"])
+            assert "Anthropic (ANTHROPIC_API_KEY)" in result.stdout
+            assert "Google (GOOGLE_API_KEY)" in result.stdout
+
+            monkeypatch.delenv("BRIEF_TEST_DOTENV")
+            monkeypatch.setenv("OPENAI_API_KEY", "from-env")
+            monkeypatch.setenv("GOOGLE_API_KEY", "from-env")
+            monkeypatch.setattr("brief.retrieval.embeddings.is_embedding_api_available", lambda: False)
+            runner.invoke(app, ["setup", tmpdir, "-d"])
+            assert "BRIEF_TEST_DOTENV" not in os.environ
+
+    def test_setup_snapshot_of_missing_directory_is_empty(self) -> None:
+        """Test that the directory snapshot tolerates a path that does not exist yet."""
+        from brief.commands.setup import _snapshot_dir
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("")
+            assert _snapshot_dir(Path(tmpdir)) == {".env"}
+            assert _snapshot_dir(Path(tmpdir) / "missing") == set()
+
+
+class TestTaskCommands:
+    """Tests for the task command group."""
+
+    def _init(self, tmpdir: str, enable_tasks: bool = True) -> None:
+        """Initialize Brief in tmpdir with the task system on or off."""
+        runner.invoke(app, ["init", tmpdir])
+        runner.invoke(app, ["config", "set", "enable_tasks", str(enable_tasks).lower(), "-b", tmpdir])
+
+    def test_task_commands_require_init(self) -> None:
+        """Test that task commands fail cleanly when Brief isn't initialized."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = runner.invoke(app, ["task", "list", "-b", tmpdir])
+
+            assert result.exit_code == 1
+            assert "Brief not initialized" in result.output
+
+    def test_task_commands_respect_disabled_config(self) -> None:
+        """Test that task commands exit when the task system is disabled."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir, enable_tasks=False)
+
+            result = runner.invoke(app, ["task", "create", "Nope", "-b", tmpdir])
+
+            assert result.exit_code == 1
+            assert "Task system is disabled" in result.output
+            assert not (Path(tmpdir) / BRIEF_DIR / "tasks.jsonl").read_text()
+
+    def test_task_create_and_list(self) -> None:
+        """Test creating a task and listing it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+
+            result = runner.invoke(app, ["task", "create", "Fix login", "-p", "2", "-b", tmpdir])
+            assert result.exit_code == 0
+            task_id = result.stdout.split("Created task: ")[1].strip()
+
+            result = runner.invoke(app, ["task", "list", "-b", tmpdir])
+            assert result.exit_code == 0
+            assert "Tasks (1):" in result.stdout
+            assert f"○ {task_id}: Fix login [P2]" in result.stdout
+
+    def test_task_list_limit(self) -> None:
+        """Test that --limit caps the listing and notes the tasks left out."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            for title in ("First", "Second", "Third"):
+                runner.invoke(app, ["task", "create", title, "-b", tmpdir])
+
+            result = runner.invoke(app, ["task", "list", "-n", "2", "-b", tmpdir])
+            assert result.exit_code == 0
+            assert "Tasks (2):" in result.stdout
+            assert "Third" not in result.stdout
+            assert "more tasks not shown" in result.stdout
+
+            result = runner.invoke(app, ["task", "list", "-n", "3", "-b", tmpdir])
+            assert "Tasks (3):" in result.stdout
+            assert "more tasks not shown" not in result.stdout
+
+    def test_task_list_status_filter(self) -> None:
+        """Test --status filters by value and rejects unknown statuses."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            runner.invoke(app, ["task", "create", "Waiting", "-b", tmpdir])
+
+            result = runner.invoke(app, ["task", "list", "-s", "pending", "-b", tmpdir])
+            assert result.exit_code == 0
+            assert "Waiting" in result.stdout
+
+            result = runner.invoke(app, ["task", "list", "-s", "done", "-b", tmpdir])
+            assert "No tasks found." in result.stdout
+
+            result = runner.invoke(app, ["task", "list", "-s", "finished", "-b", tmpdir])
+            assert result.exit_code == 1
+            assert "Invalid status: finished" in result.output
+
+    def test_task_start_and_done_are_idempotent(self) -> None:
+        """Test repeating start/done reports the state without rewriting tasks."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            result = runner.invoke(app, ["task", "create", "Once", "-b", tmpdir])
+            task_id = result.stdout.split("Created task: ")[1].strip()
+            tasks_file = Path(tmpdir) / BRIEF_DIR / "tasks.jsonl"
+
+            runner.invoke(app, ["task", "start", task_id, "-b", tmpdir])
+            before = tasks_file.read_bytes()
+            result = runner.invoke(app, ["task", "start", task_id, "-b", tmpdir])
+            assert result.exit_code == 0
+            assert f"Already started: {task_id}" in result.stdout
+            assert tasks_file.read_bytes() == before
+
+            runner.invoke(app, ["task", "done", task_id, "-b", tmpdir])
+            before = tasks_file.read_bytes()
+            result = runner.invoke(app, ["task", "done", task_id, "-b", tmpdir])
+            assert result.exit_code == 0
+            assert f"Already complete: {task_id}" in result.stdout
+            assert tasks_file.read_bytes() == before
+
+    def test_task_archive_and_list(self) -> None:
+        """Test archiving writes metadata that archive list reads back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            runner.invoke(app, ["task", "create", "Keep me", "-b", tmpdir])
+
+            result = runner.invoke(app, ["task", "archive", "list", "-b", tmpdir])
+            assert "No archives found." in result.stdout
+
+            result = runner.invoke(app, ["task", "archive", "-n", "sprint", "-b", tmpdir])
+            assert result.exit_code == 0
+            meta_file = next((Path(tmpdir) / BRIEF_DIR / "archives" / "tasks").glob("*.meta.json"))
+            meta = json.loads(meta_file.read_text())
+            assert meta["task_count"] == 1
+            assert meta["status_counts"]["pending"] == 1
+
+            result = runner.invoke(app, ["task", "archive", "list", "-b", tmpdir])
+            assert "Task Archives (1):" in result.stdout
+            assert "sprint - 1 tasks (0/1 done)" in result.stdout
+
+            (meta_file.parent / "broken.meta.json").write_text("[1, 2")
+            (meta_file.parent / "listy.meta.json").write_text("[1, 2]")
+            result = runner.invoke(app, ["task", "archive", "list", "-b", tmpdir])
+            assert result.exit_code == 0
+            assert "broken (error reading metadata)" in result.stdout
+            assert "listy (error reading metadata)" in result.stdout
+
+    def test_task_clear_done_only(self) -> None:
+        """Test clear --done-only removes completed tasks and keeps the rest."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            ids = []
+            for title in ("Finished", "Open"):
+                result = runner.invoke(app, ["task", "create", title, "-b", tmpdir])
+                ids.append(result.stdout.split("Created task: ")[1].strip())
+            runner.invoke(app, ["task", "done", ids[0], "-b", tmpdir])
+
+            result = runner.invoke(app, ["task", "clear", "--done-only", "-y", "-b", tmpdir])
+            assert result.exit_code == 0
+
+            result = runner.invoke(app, ["task", "list", "-b", tmpdir])
+            assert "Tasks (1):" in result.stdout
+            assert "Open" in result.stdout
+            assert "Finished" not in result.stdout
+
+    def test_task_archive_counts_top_level_status(self) -> None:
+        """Test archive status counts ignore step statuses and quoted text."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            result = runner.invoke(app, ["task", "create", 'Say "status": "done"', "-b", tmpdir])
+            task_id = result.stdout.split("Created task: ")[1].strip()
+            runner.invoke(app, ["task", "start", task_id, "-s", "one", "-b", tmpdir])
+            runner.invoke(app, ["task", "step-done", "step-1", "-b", tmpdir])
+            runner.invoke(app, ["task", "create", "Other", "-b", tmpdir])
+
+            tasks_file = Path(tmpdir) / BRIEF_DIR / "tasks.jsonl"
+            before = tasks_file.read_bytes()
+            result = runner.invoke(app, ["task", "archive", "-b", tmpdir])
+            assert "Archived 2 tasks" in result.stdout
+
+            archive_dir = Path(tmpdir) / BRIEF_DIR / "archives" / "tasks"
+            meta = json.loads(next(archive_dir.glob("*.meta.json")).read_text())
+            assert meta["status_counts"] == {"pending": 1, "in_progress": 1, "done": 0, "blocked": 0}
+            assert next(archive_dir.glob("*.jsonl")).read_bytes() == before
+
+    def test_task_archive_list_many(self) -> None:
+        """Test archive list keeps name order when reading metadata on a pool."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            archive_dir = Path(tmpdir) / BRIEF_DIR / "archives" / "tasks"
+            archive_dir.mkdir(parents=True)
+            for i in range(10):
+                meta = {"name": f"a{i:02d}", "task_count": i, "archived_at": "2025-01-01T00:00:00"}
+                (archive_dir / f"a{i:02d}.meta.json").write_text(json.dumps(meta))
+
+            result = runner.invoke(app, ["task", "archive", "list", "-b", tmpdir])
+            assert result.exit_code == 0
+            rows = [line for line in result.stdout.splitlines() if line.startswith("  a")]
+            assert [row.split()[0] for row in rows] == [f"a{i:02d}" for i in range(10)]
+
+    def test_task_echo_decides_color_per_stream(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that stderr echoes use stderr's color decision, not stdout's."""
+        import typer
+        from brief.commands import task
+
+        monkeypatch.setattr(task, "_COLOR_OUT", True)
+        monkeypatch.setattr(task, "_COLOR_ERR", False)
+        styled = typer.style("x", fg="red")
+
+        task._echo(styled)
+        task._echo(styled, err=True)
+
+        out, err = capsys.readouterr()
+        assert out == styled + "\n"
+        assert err == "x\n"
+
+    def test_task_delete_force(self) -> None:
+        """Test deleting with --force, and that an unknown ID still fails."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            result = runner.invoke(app, ["task", "create", "Doomed", "-b", tmpdir])
+            task_id = result.stdout.split("Created task: ")[1].strip()
+
+            result = runner.invoke(app, ["task", "delete", task_id, "-f", "-b", tmpdir])
+            assert result.exit_code == 0
+            assert f"Deleted: {task_id}" in result.stdout
+
+            result = runner.invoke(app, ["task", "delete", task_id, "-f", "-b", tmpdir])
+            assert result.exit_code == 1
+            assert "Task not found" in result.output
+
+    def test_task_list_marks_active_task(self) -> None:
+        """Test that task list shows status icons and marks the active task."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            first = runner.invoke(app, ["task", "create", "First", "-b", tmpdir]).stdout.split(": ")[1].strip()
+            second = runner.invoke(app, ["task", "create", "Second", "-b", tmpdir]).stdout.split(": ")[1].strip()
+            runner.invoke(app, ["task", "start", second, "-b", tmpdir])
+
+            result = runner.invoke(app, ["task", "list", "-b", tmpdir])
+
+            lines = result.stdout.splitlines()
+            assert f"○ {first}: First  " in lines
+            assert f"● {second}: Second   *" in lines
+
+    def test_task_show_ready_and_blocked_output(self) -> None:
+        """Test the show, ready and blocked listings for a dependent pair of tasks."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            parent = runner.invoke(app, ["task", "create", "Parent", "-b", tmpdir]).stdout.split(": ")[1].strip()
+            child = runner.invoke(
+                app, ["task", "create", "Child", "--depends", parent, "--tags", "ui", "-b", tmpdir]
+            ).stdout.split(": ")[1].strip()
+            runner.invoke(app, ["task", "note", child, "Check mobile", "-b", tmpdir])
+
+            result = runner.invoke(app, ["task", "show", child, "-b", tmpdir])
+            lines = result.stdout.splitlines()
+            assert lines[:3] == [f"Task: {child}", "Title: Child", "Status: pending"]
+            assert "Tags: ui" in lines
+            assert f"Depends on: {parent}" in lines
+            assert lines[-2] == "Notes:"
+            assert lines[-1].endswith("Check mobile")
+
+            result = runner.invoke(app, ["task", "ready", "-b", tmpdir])
+            assert result.stdout.splitlines()[0] == "Ready tasks (1):"
+            assert f"○ {parent}: Parent " in result.stdout.splitlines()
+
+            result = runner.invoke(app, ["task", "blocked", "-b", tmpdir])
+            assert result.stdout.splitlines()[2:] == [f"⊘ {child}: Child", f"  Blocked by: {parent}"]
+
+    def test_task_comma_separated_options_are_trimmed(self) -> None:
+        """Test that tags and steps ignore surrounding whitespace and empty items."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            task_id = runner.invoke(
+                app, ["task", "create", "Tagged", "--tags", " ui , backend ,", "-b", tmpdir]
+            ).stdout.split(": ")[1].strip()
+
+            result = runner.invoke(app, ["task", "start", task_id, "--steps", "design,, test ", "-b", tmpdir])
+            assert "  Steps: 2" in result.stdout
+            assert "    - step-2: test" in result.stdout.splitlines()
+
+            result = runner.invoke(app, ["task", "show", task_id, "-b", tmpdir])
+            assert "Tags: ui, backend" in result.stdout.splitlines()
+
+    def test_task_step_commands_default_to_active_task(self) -> None:
+        """Test that steps and step-done use the active task and show marks it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._init(tmpdir)
+            task_id = runner.invoke(app, ["task", "create", "Steps", "-b", tmpdir]).stdout.split(": ")[1].strip()
+
+            result = runner.invoke(app, ["task", "steps", "a,b", "-b", tmpdir])
+            assert result.exit_code == 1
+            assert "No active task" in result.output
+
+            runner.invoke(app, ["task", "start", task_id, "-b", tmpdir])
+            result = runner.invoke(app, ["task", "steps", "a,b", "-b", tmpdir])
+            assert f"Set 2 steps for {task_id}:" in result.stdout
+
+            result = runner.invoke(app, ["task", "step-done", "step-1", "-b", tmpdir])
+            assert "Progress: 1/2 (50%)" in result.stdout
+            assert "Next: step-2 - b" in result.stdout
+
+            result = runner.invoke(app, ["task", "show", task_id, "-b", tmpdir])
+            lines = result.stdout.splitlines()
+            assert lines[0] == f"Task: {task_id} (ACTIVE)"
+            assert "  ● step-1: a" in lines
+            assert "  ○ step-2: b" in lines
+
+
+class TestMemoryCommands:
+    """Tests for the memory command group."""
+
+    def test_memory_add_tags_trimmed(self) -> None:
+        """Test comma-separated tags are trimmed and empty items dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+
+            result = runner.invoke(
+                app, ["memory", "add", "api/auth", "Use JWT", "-t", " auth , api,, ", "-b", tmpdir]
+            )
+            assert result.exit_code == 0
+            assert "  Tags: auth, api" in result.stdout
+
+            result = runner.invoke(app, ["memory", "get", "-t", "api ,", "-b", tmpdir])
+            assert "[api/auth]" in result.stdout
+
+
+class TestTraceCommands:
+    """Tests for the trace command group."""
+
+    def test_trace_list_shows_custom_categories(self) -> None:
+        """Test categories outside cli/api/other/test are listed after them."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner.invoke(app, ["init", tmpdir])
+            runner.invoke(app, ["trace", "define", "job", "run_job", "-c", "worker", "-b", tmpdir])
+            runner.invoke(app, ["trace", "define", "main", "main", "-c", "cli", "-b", tmpdir])
+
+            result = runner.invoke(app, ["trace", "list", "-b", tmpdir])
+            assert result.exit_code == 0
+            assert "Trace Definitions (2):" in result.stdout
+            assert result.stdout.index("CLI (1):") < result.stdout.index("WORKER (1):")
+            assert f"    ✗ {'job':<25} {'run_job':<30} (entry point not found)" in result.stdout
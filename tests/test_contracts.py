@@ -265,6 +265,58 @@ class TestContractDetector:
         assert "organization" in categories
         assert "type" in categories
 
+    def test_detect_all_scans_manifest_once(self, mock_brief):
+        """Test all detectors share one grouped pass over the manifest."""
+        brief_path, base_path = mock_brief
+        detector = ContractDetector(brief_path, base_path)
+
+        detector.detect_all()
+        scan = detector._scan_manifest()
+        detector.detect_naming_conventions()
+        assert detector._scan_manifest() is scan
+        assert "Command" in scan.class_suffixes
+        assert "test_" in scan.func_prefixes
+
+    def test_manifest_parse_shared_until_file_changes(self, mock_brief):
+        """Test detectors share one manifest parse until manifest.jsonl changes."""
+        brief_path, base_path = mock_brief
+        first = ContractDetector(brief_path, base_path)._load_manifest()
+        assert ContractDetector(brief_path, base_path)._load_manifest() is first
+
+        write_jsonl(brief_path / "manifest.jsonl", [
+            {"type": "class", "name": "OnlyClass", "file": "a.py", "line": 1},
+        ])
+        records = ContractDetector(brief_path, base_path)._load_manifest()
+        assert [r["name"] for r in records] == ["OnlyClass"]
+
+    def test_files_affected_deduplicated_in_order(self, mock_brief):
+        """Test files_affected lists each file once, in first-seen order."""
+        brief_path, base_path = mock_brief
+        detector = ContractDetector(brief_path, base_path)
+        detector._manifest = [
+            {"type": "function", "name": name, "file": file, "is_generator": True}
+            for name, file in [("a", "z.py"), ("b", "m.py"), ("c", "z.py"), ("d", "a.py")]
+        ]
+
+        [generator] = [c for c in detector.detect_type_patterns() if c.name == "Generator Pattern"]
+        assert generator.files_affected == ["z.py", "m.py", "a.py"]
+
+    def test_affix_matching_keeps_first_listed_match(self, mock_brief):
+        """Test names are bucketed by the first listed prefix/suffix they match."""
+        brief_path, base_path = mock_brief
+        detector = ContractDetector(brief_path, base_path)
+        detector._manifest = [
+            {"type": "function", "name": "__init__", "file": "a.py"},
+            {"type": "function", "name": "handle_click", "file": "a.py"},
+            {"type": "function", "name": "run", "file": "a.py"},
+            {"type": "class", "name": "ParseError", "file": "a.py"},
+            {"type": "class", "name": "Widget", "file": "a.py"},
+        ]
+
+        scan = detector._scan_manifest()
+        assert {p: len(r) for p, r in scan.func_prefixes.items()} == {"_": 1, "handle_": 1}
+        assert {s: len(r) for s, r in scan.class_suffixes.items()} == {"Error": 1}
+
     def test_empty_manifest(self):
         """Test handling empty manifest."""
         tmp = tempfile.mkdtemp()
@@ -236,3 +236,19 @@ class TestBamlAvailability:
         # This should return False in test environment without BAML
         available = is_baml_available()
         assert isinstance(available, bool)
+
+    def test_import_defers_baml_client(self) -> None:
+        """Test that importing the generator doesn't load the BAML client."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from brief.generation.generator import _get_baml\n"
+            "print(_get_baml.cache_info().misses, 'baml_client' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "0 False"
@@ -11,6 +11,9 @@ from brief.storage import (
     write_json,
     read_jsonl_typed,
     update_jsonl_record,
+    reset_jsonl,
+    partition_jsonl,
+    write_jsonl_lines,
 )
 from brief.models import ManifestFileRecord
 
@@ -38,6 +41,27 @@ class TestJSONLOperations:
 
             assert result == []
 
+    def test_read_jsonl_prefilter_skips_decoding(self) -> None:
+        """Test lines rejected by the prefilter are never decoded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.jsonl"
+            path.write_text('{"keep": 1}\nnot json\n{"keep": 2}\n')
+
+            result = list(read_jsonl(path, lambda line: "keep" in line))
+
+            assert result == [{"keep": 1}, {"keep": 2}]
+
+    def test_reset_jsonl(self) -> None:
+        """Test resetting a JSONL file leaves it empty."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.jsonl"
+            write_jsonl(path, [{"a": 1}, {"b": 2}])
+
+            reset_jsonl(path)
+
+            assert path.exists()
+            assert list(read_jsonl(path)) == []
+
     def test_append_jsonl(self) -> None:
         """Test appending to JSONL file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -91,6 +115,27 @@ class TestJSONLOperations:
             assert result[0]["name"] == "updated"
             assert result[1]["name"] == "second"
 
+    def test_partition_jsonl_keeps_other_lines_raw(self) -> None:
+        """Test partitioning splits out matches and round-trips the rest."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.jsonl"
+            write_jsonl(path, [
+                {"id": "1", "status": "done"},
+                {"id": "2", "status": "pending", "note": "not done yet"},
+                {"id": "3", "status": "pending"},
+            ])
+
+            matched, rest = partition_jsonl(
+                path,
+                lambda line: b'"done"' in line,
+                lambda record: record["status"] == "done",
+            )
+            assert [r["id"] for r in matched] == ["1"]
+            assert len(rest) == 2
+
+            write_jsonl_lines(path, rest)
+            assert [r["id"] for r in read_jsonl(path)] == ["2", "3"]
+
 
 class TestJSONOperations:
     """Tests for JSON read/write operations."""
@@ -116,3 +161,21 @@ class TestJSONOperations:
 
             assert path.exists()
             assert read_json(path) == data
+
+    def test_datetime_round_trip_with_and_without_orjson(self, monkeypatch) -> None:
+        """Test datetimes serialize the same whichever JSON backend is used."""
+        from datetime import datetime
+        import brief.storage as storage
+
+        when = datetime(2026, 1, 2, 3, 4, 5)
+        backends = [False, True] if storage.HAS_ORJSON else [False]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for use_orjson in backends:
+                monkeypatch.setattr(storage, "HAS_ORJSON", use_orjson)
+                path = Path(tmpdir) / f"test_{use_orjson}.jsonl"
+
+                write_jsonl(path, [{"when": when, "count": 1}])
+                write_json(path.with_suffix(".json"), {"when": when})
+
+                assert list(read_jsonl(path)) == [{"when": when.isoformat(), "count": 1}]
+                assert read_json(path.with_suffix(".json")) == {"when": when.isoformat()}
@@ -4,7 +4,7 @@ from pathlib import Path
 import tempfile
 import shutil
 from brief.tasks.manager import TaskManager, generate_task_id
-from brief.models import TaskStatus
+from brief.models import TaskStatus, TaskStepStatus
 from brief.storage import write_jsonl
 
 
@@ -98,6 +98,17 @@ class TestTaskQueries:
         assert retrieved.id == task.id
         assert retrieved.title == "Test task"
 
+    def test_get_task_skips_tasks_that_only_reference_it(self, brief_path):
+        """Test get_task returns the task itself, not one that depends on it."""
+        manager = TaskManager(brief_path)
+        parent = manager.create_task("Parent")
+        manager.create_task("Child", depends=[parent.id])
+        manager.update_task(parent.id, notes=[f"see {parent.id}"])
+
+        retrieved = manager.get_task(parent.id)
+        assert retrieved.title == "Parent"
+        assert manager.get_task('ag-"odd') is None
+
     def test_get_task_not_found(self, brief_path):
         """Test getting a non-existent task."""
         manager = TaskManager(brief_path)
@@ -143,6 +154,20 @@ class TestTaskQueries:
         assert len(important) == 2
         assert len(urgent) == 1
 
+    def test_filtered_list_uses_index_and_tracks_updates(self, brief_path):
+        """Test filtered queries build tasks.idx and see status changes after it."""
+        manager = TaskManager(brief_path)
+
+        task1 = manager.create_task("Task 1", tags=["ui"])
+        manager.create_task("Task 2", tags=["api"])
+
+        assert [t.title for t in manager.list_tasks(tag="ui")] == ["Task 1"]
+        assert (brief_path / "tasks.idx").exists()
+
+        manager.update_task(task1.id, status=TaskStatus.BLOCKED)
+        assert manager.list_tasks(status=TaskStatus.PENDING)[0].title == "Task 2"
+        assert [t.id for t in manager.list_tasks(status=TaskStatus.BLOCKED)] == [task1.id]
+
 
 class TestTaskWorkflow:
     """Tests for task status workflow."""
@@ -192,6 +217,34 @@ class TestTaskWorkflow:
         assert task.completed is not None
 
 
+    def test_active_task_id_tracks_start_and_complete(self, brief_path):
+        """Test the active task ID is set by start and cleared by complete."""
+        manager = TaskManager(brief_path)
+        assert manager.active_id is None
+
+        task = manager.create_task("Active task")
+        manager.start_task(task.id)
+        assert manager.active_id == task.id
+
+        manager.complete_task(task.id)
+        assert manager.active_id is None
+
+    def test_get_active_task_memoized_until_write(self, brief_path):
+        """Test the active task is reused until the manager writes tasks."""
+        manager = TaskManager(brief_path)
+
+        task = manager.create_task("Active one")
+        manager.start_task(task.id)
+
+        first = manager.get_active_task()
+        assert manager.get_active_task() is first
+
+        manager.add_note(task.id, "changed")
+        refreshed = manager.get_active_task()
+        assert refreshed is not first
+        assert len(refreshed.notes) == 1
+
+
 class TestTaskDependencies:
     """Tests for task dependencies."""
 
@@ -253,6 +306,18 @@ class TestTaskDependencies:
         assert blocked_task.id == child.id
         assert parent.id in blockers
 
+    def test_iter_blocked_matches_get_blocked_tasks(self, brief_path):
+        """Test iter_blocked yields plain rows for the same blocked tasks."""
+        manager = TaskManager(brief_path)
+
+        parent = manager.create_task("Parent task")
+        done = manager.create_task("Done task")
+        manager.complete_task(done.id)
+        child = manager.create_task("Child task", depends=[parent.id, done.id])
+
+        assert list(manager.iter_blocked()) == [(child.id, "Child task", (parent.id,))]
+        assert [(t.id, b) for t, b in manager.get_blocked_tasks()] == [(child.id, [parent.id])]
+
     def test_add_dependency(self, brief_path):
         """Test adding a dependency to existing task."""
         manager = TaskManager(brief_path)
@@ -303,6 +368,43 @@ class TestTaskNotes:
         assert len(task.notes) == 3
 
 
+class TestTaskSteps:
+    """Tests for task step summaries."""
+
+    def test_summarize_steps_matches_get_step_summary(self, brief_path):
+        """Test the in-memory summary agrees with the task-ID lookup."""
+        manager = TaskManager(brief_path)
+
+        task = manager.create_task("Stepped")
+        manager.set_steps(task.id, ["Plan", "Build", "Ship"])
+        task = manager.update_step(task.id, "step-1", TaskStepStatus.COMPLETE)
+
+        summary = manager.summarize_steps(task)
+        assert summary == manager.get_step_summary(task.id)
+        assert summary["completed"] == 1
+        assert summary["pending"] == 2
+        assert summary["current_step"] == "step-2"
+        assert summary["current_step_name"] == "Build"
+        assert not summary["is_complete"]
+
+    def test_complete_step_and_summarize(self, brief_path):
+        """Test completing steps returns the saved task with its summary."""
+        manager = TaskManager(brief_path)
+
+        task = manager.create_task("Stepped")
+        manager.set_steps(task.id, ["Plan", "Build"])
+
+        task, summary = manager.complete_step_and_summarize(task.id, "step-1", "Sketched")
+        assert task.steps[0].notes == "Sketched"
+        assert summary["current_step"] == "step-2"
+        assert manager.get_task(task.id).current_step_id == "step-2"
+
+        task, summary = manager.complete_step_and_summarize(task.id, "step-2")
+        assert summary["is_complete"]
+        assert task.current_step_id is None
+        assert manager.complete_step_and_summarize(task.id, "step-9") is None
+
+
 class TestTaskDeletion:
     """Tests for task deletion."""
 
@@ -314,7 +416,8 @@ class TestTaskDeletion:
         task_id = task.id
 
         result = manager.delete_task(task_id)
-        assert result is True
+        assert result.id == task_id
+        assert result.title == "To delete"
         assert manager.get_task(task_id) is None
 
     def test_delete_nonexistent_task(self, brief_path):
@@ -322,7 +425,7 @@ class TestTaskDeletion:
         manager = TaskManager(brief_path)
 
         result = manager.delete_task("ag-fake")
-        assert result is False
+        assert result is None
 
 
 class TestTaskTree:
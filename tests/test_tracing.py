@@ -248,6 +248,18 @@ class TestPathTracer:
         assert func is not None
         assert func["class_name"] == "DataProcessor"
 
+    def test_loads_only_function_records(self, brief_path):
+        """Test the tracer reads function records from the manifest shard."""
+        from brief.analysis.manifest import read_manifest, write_manifest
+        brief_dir, base = brief_path
+        write_manifest(brief_dir, list(read_manifest(brief_dir)))
+
+        tracer = PathTracer(brief_dir, base)
+        records = tracer._load_manifest()
+        assert records
+        assert all(r["type"] == "function" for r in records)
+        assert tracer.find_function("main_func") is not None
+
     def test_get_callees(self, brief_path):
         """Test getting functions called by a function."""
         brief_dir, base = brief_path
@@ -535,3 +547,36 @@ class TestTraceDefinitions:
 
         assert tracer.check_entry_point_exists("main_func") is True
         assert tracer.check_entry_point_exists("nonexistent") is False
+
+    def test_get_existing_entry_points(self, brief_path):
+        """Test that exact entry point names are collected in one set."""
+        brief_dir, base = brief_path
+        tracer = PathTracer(brief_dir, base)
+
+        names = tracer.get_existing_entry_points()
+        assert {"main_func", "helper_func"} <= names
+        assert "nonexistent" not in names
+        # Partial names still resolve through check_entry_point_exists
+        assert "main" not in names
+        assert tracer.check_entry_point_exists("main") is True
+
+
+class TestTracerCache:
+    """Tests for the per-process tracer cache in the trace commands."""
+
+    def test_require_tracer_reuses_until_manifest_changes(self, brief_path):
+        """Test that the tracer is shared until manifest.jsonl changes."""
+        from brief.commands.trace import _get_tracer, _require_tracer
+        brief_dir, base = brief_path
+        _get_tracer.cache_clear()
+
+        tracer = _require_tracer(base)
+        assert _require_tracer(base) is tracer
+
+        write_jsonl(brief_dir / "manifest.jsonl", [
+            {"type": "function", "name": "renamed", "file": "test.py", "line": 1},
+        ])
+        fresh = _require_tracer(base)
+        assert fresh is not tracer
+        assert fresh.check_entry_point_exists("renamed") is True
+        _get_tracer.cache_clear()